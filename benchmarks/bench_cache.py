@@ -0,0 +1,146 @@
+"""중복 방지 캐시 벤치마크
+
+전송 이력이 N개인 캐시에서 실행 한 번 분량(--new개)을 표시하고 저장하는 시간과,
+다음 실행에서 캐시를 불러오는 시간, 처음 보는 URL 1000개를 확인하는 시간, 메모리 사용량을 이력 크기별로 측정합니다.
+
+- json:  이전 형식 (저장할 때마다 {"urls": [...]} 전체를 다시 씀)
+- log:   utils.cache.Cache, 모든 항목을 메모리에 둠
+- bloom: utils.cache.Cache, 최근 --recent개만 메모리에 두고 나머지는 전송 이력(블룸 필터 + 지문 색인)
+- sqlite: utils.sqlite_cache.SqliteCache (CACHE_BACKEND=sqlite), 메모리는 SQLite 페이지 캐시라 tracemalloc에 잡히지 않음
+- index: utils.index_cache.IndexCache (CACHE_BACKEND=index), mmap으로 연 정렬된 지문 파일 + 델타 로그
+
+사용법:
+  python benchmarks/bench_cache.py
+  python benchmarks/bench_cache.py --sizes 10000,100000,1000000 --new 50
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import Cache
+from utils.index_cache import IndexCache
+from utils.sqlite_cache import SqliteCache
+
+
+def make_urls(start: int, count: int) -> list[str]:
+    return [f"https://example.com/posts/{i}" for i in range(start, start + count)]
+
+
+class JsonCache:
+    """이전 형식 캐시 (비교용)"""
+
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self.sent_urls = set()
+        if os.path.exists(cache_file):
+            with open(cache_file, "r", encoding="utf-8") as f:
+                self.sent_urls = set(json.load(f).get("urls", []))
+
+    def mark_sent_many(self, entries) -> None:
+        self.sent_urls.update(url for url, _ in entries)
+
+    def filter_new(self, urls: list[str]) -> list[str]:
+        return [url for url in urls if url not in self.sent_urls]
+
+    def save(self) -> None:
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump({"urls": list(self.sent_urls)}, f, ensure_ascii=False, indent=2)
+
+
+def backends(recent: int) -> dict:
+    return {
+        "json": JsonCache,
+        "log": partial(Cache, ttl_days=0, max_entries=0, source_policies={}, history=False),
+        "bloom": partial(Cache, ttl_days=0, max_entries=recent, source_policies={}, history=True),
+        "sqlite": SqliteCache,
+        "index": IndexCache,
+    }
+
+
+def seed(factory, path: str, size: int) -> None:
+    """size개가 저장된 캐시 파일 만들기"""
+    if factory is JsonCache:
+        cache = JsonCache(path)
+        cache.sent_urls = set(make_urls(0, size))
+    elif factory is SqliteCache:
+        cache = SqliteCache(path)
+        cache.mark_sent_many((url, "") for url in make_urls(0, size))
+    else:
+        cache = factory(path, fsync_batch=size or 1)
+        for url in make_urls(0, size):
+            cache.mark_sent(url)
+    cache.save()
+    if hasattr(cache, "wait"):
+        cache.wait()
+
+
+def bench(factory, size: int, new: int, repeat: int) -> dict:
+    load_times, save_times, lookup_times, memory = [], [], [], 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "cache.json" if factory is JsonCache else "cache.log")
+        seed(factory, path, size)
+        for run in range(repeat):
+            started = time.perf_counter()
+            cache = factory(path)
+            load_times.append(time.perf_counter() - started)
+
+            unseen = make_urls(10 * size + run * 1000, 1000)
+            started = time.perf_counter()
+            cache.filter_new(unseen)
+            lookup_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            cache.mark_sent_many((url, "") for url in make_urls(size + run * new, new))
+            cache.save()
+            save_times.append(time.perf_counter() - started)
+            if hasattr(cache, "wait"):
+                cache.wait()
+            del cache
+
+        # 불러온 캐시가 차지하는 메모리 (한 번 더 불러와서 측정)
+        tracemalloc.start()
+        cache = factory(path)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del cache
+        file_mb = sum(os.path.getsize(os.path.join(tmp_dir, name)) for name in os.listdir(tmp_dir)) / 1024 / 1024
+    return {
+        "load_ms": statistics.median(load_times) * 1000,
+        "save_ms": statistics.median(save_times) * 1000,
+        "lookup_ms": statistics.median(lookup_times) * 1000,
+        "memory_mb": memory / 1024 / 1024,
+        "file_mb": file_mb,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="중복 방지 캐시 벤치마크")
+    parser.add_argument("--sizes", default="10000,100000", help="전송 이력 크기 (쉼표로 구분)")
+    parser.add_argument("--new", type=int, default=50, help="실행 한 번에 새로 표시할 URL 수")
+    parser.add_argument("--repeat", type=int, default=5, help="크기별 실행 횟수 (중앙값)")
+    parser.add_argument("--recent", type=int, default=20000, help="bloom: 메모리에 둘 최근 항목 수")
+    parser.add_argument("--backends", default="json,log,bloom,sqlite,index", help="비교할 방식 (json,log,bloom,sqlite,index)")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    factories = backends(args.recent)
+    print(f"{'이력':>10} {'방식':>6} {'불러오기':>10} {'표시+저장':>10} {'새 URL 1000개':>13} {'메모리':>9} {'파일':>8}")
+    for size in sizes:
+        for backend in args.backends.split(","):
+            result = bench(factories[backend], size, args.new, args.repeat)
+            print(
+                f"{size:>10,} {backend:>6} {result['load_ms']:>8.1f}ms {result['save_ms']:>8.1f}ms "
+                f"{result['lookup_ms']:>11.1f}ms {result['memory_mb']:>7.1f}MB {result['file_mb']:>6.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""피드 파서 벤치마크 (feedparser 전체 파싱 vs 스트리밍 파싱)
+
+benchmarks/fixtures/feeds의 피드를 두 방식으로 파싱하여
+스크래퍼가 실제로 쓰는 앞쪽 N개 엔트리를 얻는 데 걸리는 시간과
+최대 메모리 사용량(tracemalloc)을 비교합니다.
+
+사용법:
+  python benchmarks/bench_feed_parser.py
+  python benchmarks/bench_feed_parser.py --limit 20 --scale 10
+"""
+import argparse
+import os
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser
+
+from scrapers.base import iter_feed_entries
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "feeds"
+CHUNK_SIZE = 16 * 1024
+
+
+def scale_feed(data: bytes, scale: int) -> bytes:
+    """<item> 목록을 scale배로 늘린 피드"""
+    if scale <= 1:
+        return data
+    items = re.findall(rb"<item>.*?</item>", data, re.S)
+    if not items:
+        return data
+    start = data.index(items[0])
+    end = data.rindex(items[-1]) + len(items[-1])
+    return data[:start] + b"\n".join(items * scale) + data[end:]
+
+
+def parse_full(data: bytes, limit: int) -> list:
+    return feedparser.parse(data).entries[:limit]
+
+
+def parse_stream(data: bytes, limit: int) -> list:
+    chunks = (data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+    return list(iter_feed_entries(chunks, limit))
+
+
+def measure(func, data: bytes, limit: int, repeat: int) -> tuple[float, float]:
+    """(가장 빠른 회차 소요 시간 ms, 최대 메모리 KB)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(data, limit)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    func(data, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피드 파서 벤치마크")
+    parser.add_argument("--limit", type=int, default=20, help="읽을 엔트리 수 (기본값: 20)")
+    parser.add_argument("--scale", type=int, default=1, help="피드 엔트리를 몇 배로 늘릴지 (기본값: 1)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (기본값: 5)")
+    args = parser.parse_args()
+
+    paths = sorted(FIXTURES_DIR.glob("*.xml"))
+    if not paths:
+        print(f"피드 픽스처가 없습니다: {FIXTURES_DIR}")
+        sys.exit(1)
+
+    print(f"엔트리 {args.limit}개, 피드 크기 x{args.scale}")
+    print(f"{'피드':<32}{'크기':>9}  {'feedparser':>20}  {'stream':>20}")
+    for path in paths:
+        data = scale_feed(path.read_bytes(), args.scale)
+        full_ms, full_kb = measure(parse_full, data, args.limit, args.repeat)
+        stream_ms, stream_kb = measure(parse_stream, data, args.limit, args.repeat)
+        print(
+            f"{path.stem:<32}{len(data) / 1024:7.0f}KB  "
+            f"{full_ms:7.1f}ms {full_kb:8.0f}KB  {stream_ms:7.1f}ms {stream_kb:8.0f}KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
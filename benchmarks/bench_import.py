@@ -0,0 +1,80 @@
+"""시작 시간(import) 벤치마크
+
+새 프로세스에서 main.py를 불러오고 스크래퍼를 만드는 데까지 걸리는 시간을 측정합니다.
+실행할 때마다 치르는 시작 비용이므로 cron/GitHub Actions 실행에서는 그대로 지연이 됩니다.
+- import main: 인자 파싱 전까지의 비용
+- 소스 1개: import main + get_scrapers(["geeknews"]) (python main.py --test --sources geeknews의 시작 부분)
+- 전체 소스: import main + 모든 스크래퍼 클래스
+
+--top을 주면 `python -X importtime` 결과에서 누적 시간이 큰 모듈을 함께 출력합니다.
+
+사용법:
+  python benchmarks/bench_import.py
+  python benchmarks/bench_import.py --repeat 20 --top 15
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+SCENARIOS = {
+    "import main": "import main",
+    "소스 1개": "import main; main.get_scrapers(sources=['geeknews'])",
+    "전체 소스": (
+        "import main, scrapers; "
+        "[scrapers.get_scraper_class(key) for key in scrapers.SCRAPER_REGISTRY]"
+    ),
+}
+
+
+def run_once(code: str) -> float:
+    """새 인터프리터에서 code를 실행하는 데 걸린 시간 (초)"""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, check=True)
+    return time.perf_counter() - started
+
+
+def import_times(code: str, top: int) -> list[tuple[int, str]]:
+    """-X importtime 결과에서 누적 시간이 큰 최상위 import (마이크로초, 모듈)"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        rows.append((int(cumulative), name))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간(import) 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="시나리오별 실행 횟수")
+    parser.add_argument("--top", type=int, default=0, help="누적 import 시간 상위 N개 모듈 출력")
+    args = parser.parse_args()
+
+    baseline = statistics.median(run_once("pass") for _ in range(args.repeat))
+    print(f"인터프리터 시작: {baseline * 1000:.0f}ms (아래 값은 이 시간을 뺀 값, {args.repeat}회 중앙값)")
+
+    for label, code in SCENARIOS.items():
+        run_once(code)  # .pyc 생성 등 첫 실행 비용 제외
+        elapsed = statistics.median(run_once(code) for _ in range(args.repeat))
+        print(f"  {(elapsed - baseline) * 1000:7.0f}ms  {label}")
+
+    if args.top:
+        print(f"\n누적 import 시간 상위 {args.top}개 (소스 1개)")
+        for cumulative, name in import_times(SCENARIOS["소스 1개"], args.top):
+            print(f"  {cumulative / 1000:7.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""스크래핑 파이프라인 오프라인 벤치마크
+
+benchmarks/fixtures/feeds의 피드를 로컬 HTTP 서버로 제공하고, 각 스크래퍼의 base_url을
+이 서버로 바꾼 뒤 실제 get_scrapers() + run_scraping(test_mode=True) 경로를 실행합니다.
+크기(원본, 10배, 100배)마다 별도 프로세스에서 실행하여 다음을 측정합니다.
+- 처리량: 초당 처리한 새 엔트리 수 (실행 지표의 entries_seen 기준)
+- 소스별 소요 시간 p50/p95 (반복 실행 기준)
+- 최대 RSS
+
+픽스처의 발행 시각은 가장 최신 글이 한 시간 전이 되도록 옮겨서 제공하고,
+HOURS_LIMIT은 고정값(BENCH_HOURS_LIMIT)을 사용하므로 실행 날짜와 관계없이 같은 양을 처리합니다.
+브런치, 디스콰이엇은 피드 없이 헤드리스 브라우저로 페이지를 렌더링하므로 픽스처가 없어 제외하며,
+처리량과 소스별 소요 시간에는 이 두 소스의 비용이 들어 있지 않습니다 (실행 시 제외 목록을 함께 출력).
+--profiles N을 주면 키워드가 서로 다른 프로필 N개(PROFILES_FILE)로 실행해, 피드를 한 번만 받고
+프로필마다 나누는 비용이 프로필 수에 따라 얼마나 늘어나는지 볼 수 있습니다.
+
+사용법:
+  python benchmarks/bench_pipeline.py                    # 기준값과 비교
+  python benchmarks/bench_pipeline.py --scales 1 10 --repeat 10
+  python benchmarks/bench_pipeline.py --parser stream
+  python benchmarks/bench_pipeline.py --scales 10 --profiles 8
+  python benchmarks/bench_pipeline.py --save-baseline    # 현재 결과를 기준값으로 저장
+  python benchmarks/bench_pipeline.py --check            # 기준값보다 나빠지면 종료 코드 1
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = Path(__file__).parent
+ROOT_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+BASELINE_FILE = BENCH_DIR / "baseline_pipeline.json"
+BENCH_HOURS_LIMIT = 168
+PUB_DATE = re.compile(rb"<pubDate>([^<]+)</pubDate>")
+
+# SCRAPERS_ENABLED 키 → 스크래퍼 클래스 이름 (픽스처 파일 이름도 같은 키 사용)
+FEED_SOURCES = {
+    "yozm": "YozmScraper",
+    "medium": "MediumScraper",
+    "geeknews": "GeekNewsScraper",
+    "outstanding": "OutstandingScraper",
+    "venturesquare": "VentureSquareScraper",
+    "platum": "PlatumScraper",
+    "byline": "BylineScraper",
+}
+BROWSER_SOURCES = ("brunch", "disquiet")
+
+# 기준값 대비 허용 범위 (비율)
+TOLERANCE = 0.25
+
+
+def shift_dates(data: bytes, newest: datetime) -> bytes:
+    """가장 최신 pubDate가 newest가 되도록 모든 pubDate를 같은 만큼 옮김"""
+    dates = [parsedate_to_datetime(m.decode()) for m in PUB_DATE.findall(data)]
+    if not dates:
+        return data
+    delta = newest - max(dates)
+
+    def replace(match):
+        shifted = parsedate_to_datetime(match.group(1).decode()) + delta
+        return b"<pubDate>" + format_datetime(shifted).encode() + b"</pubDate>"
+
+    return PUB_DATE.sub(replace, data)
+
+
+def load_fixtures(scale: int) -> dict[str, bytes]:
+    """픽스처 파일 이름(확장자 제외) → scale배로 늘리고 날짜를 옮긴 피드"""
+    # bench_feed_parser는 scrapers(→ config)를 불러오므로, 자식 프로세스가 환경 변수를 바꾼 뒤에 불러옴
+    from bench_feed_parser import FIXTURES_DIR, scale_feed
+
+    newest = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=1)
+    return {
+        path.stem: scale_feed(shift_dates(path.read_bytes(), newest), scale)
+        for path in sorted(FIXTURES_DIR.glob("*.xml"))
+    }
+
+
+def make_handler(feeds: dict[str, bytes]):
+    """/<소스 키>/... 요청에 <소스 키>.xml (없으면 <소스 키>_<마지막 경로>.xml)을 응답"""
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = [p for p in self.path.split("?")[0].split("/") if p]
+            body = None
+            if parts:
+                body = feeds.get(parts[0]) or feeds.get(f"{parts[0]}_{parts[-1]}")
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def percentile(values: list[float], p: float) -> float:
+    """nearest-rank 백분위수"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p * len(ordered)) - 1)]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)  # Linux: KB 단위
+
+
+def write_profiles(path: str, count: int) -> None:
+    """키워드를 5개씩 돌아가며 나눠 가진 프로필 count개를 PROFILES_FILE 형식으로 저장"""
+    from config import KEYWORDS
+
+    profiles = [
+        {
+            "name": f"team{i + 1}",
+            "keywords": [KEYWORDS[(i + j) % len(KEYWORDS)] for j in range(5)],
+            "sources": list(FEED_SOURCES),
+        }
+        for i in range(count)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"profiles": profiles}, f, ensure_ascii=False)
+
+
+def run_child(scale: int, repeat: int, profiles: int = 0) -> dict:
+    """한 가지 크기로 파이프라인을 repeat회 실행 (별도 프로세스에서 호출)"""
+    state_dir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    profiles_file = os.path.join(state_dir, "profiles.json") if profiles else ""
+    # config를 불러오기 전에 상태 파일을 임시 디렉터리로 돌려 실제 캐시/커서와 분리
+    os.environ.update({
+        "CACHE_FILE": os.path.join(state_dir, "cache.log"),
+        "FEED_STATE_FILE": os.path.join(state_dir, "feed_state.json"),
+        "NEAR_DUP_STATE_FILE": os.path.join(state_dir, "fingerprints.json"),
+        "SOURCE_HEALTH_FILE": os.path.join(state_dir, "source_health.json"),
+        "METRICS_FILE": "",
+        "METRICS_TEXTFILE": "",
+        "ARCHIVE_DIR": "",
+        "HOURS_LIMIT": str(BENCH_HOURS_LIMIT),
+        "PROFILES_FILE": profiles_file,
+    })
+    if profiles:
+        write_profiles(profiles_file, profiles)
+
+    import main
+    import scrapers
+    from utils.metrics import get_metrics
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(load_fixtures(scale)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    for key in BROWSER_SOURCES:
+        main.SCRAPERS_ENABLED[key] = False
+    for key, class_name in FEED_SOURCES.items():
+        main.SCRAPERS_ENABLED[key] = True
+        getattr(scrapers, class_name).base_url = f"{base}/{key}"
+
+    walls, entries, downloaded = [], [], []
+    latencies: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            main.run_scraping(test_mode=True)
+        walls.append(time.perf_counter() - started)
+
+        record = get_metrics().to_record()
+        seen = downloaded_bytes = 0
+        for source, data in record["sources"].items():
+            seen += data["counters"].get("entries_seen", 0)
+            downloaded_bytes += data["counters"].get("bytes_downloaded", 0)
+            if "scrape" in data["stages"]:
+                latencies.setdefault(source, []).append(data["stages"]["scrape"]["seconds"])
+        entries.append(seen)
+        downloaded.append(downloaded_bytes)
+
+    server.shutdown()
+    return {
+        "scale": scale,
+        "runs": repeat,
+        "entries_per_run": entries[-1],
+        "bytes_per_run": downloaded[-1],
+        "entries_per_sec": round(sum(entries) / sum(walls), 1),
+        "run_p50_ms": round(percentile(walls, 0.5) * 1000, 1),
+        "run_p95_ms": round(percentile(walls, 0.95) * 1000, 1),
+        "sources": {
+            source: {
+                "p50_ms": round(percentile(values, 0.5) * 1000, 1),
+                "p95_ms": round(percentile(values, 0.95) * 1000, 1),
+            }
+            for source, values in sorted(latencies.items())
+        },
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_scale(scale: int, repeat: int, parser: str, profiles: int = 0) -> dict:
+    """크기별로 새 프로세스에서 실행 (최대 RSS가 이전 크기의 영향을 받지 않도록)"""
+    env = dict(os.environ, FEED_PARSER=parser, PYTHONIOENCODING="utf-8")
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", str(scale), "--repeat", str(repeat), "--profiles", str(profiles)],
+        env=env,
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_result(result: dict) -> None:
+    rss = f"{result['peak_rss_mb']}MB" if result["peak_rss_mb"] is not None else "-"
+    print(
+        f"\n[{result['scale']}배] 엔트리 {result['entries_per_run']}개/실행, "
+        f"수신 {result['bytes_per_run'] / 1024:.0f}KB/실행, {result['entries_per_sec']:.0f} 엔트리/초, "
+        f"실행 p50 {result['run_p50_ms']:.0f}ms / p95 {result['run_p95_ms']:.0f}ms, 최대 RSS {rss}"
+    )
+    for source, latency in result["sources"].items():
+        print(f"  {source:<12} p50 {latency['p50_ms']:7.1f}ms  p95 {latency['p95_ms']:7.1f}ms")
+
+
+def compare(results: dict, baseline: dict) -> list[str]:
+    """기준값보다 TOLERANCE 이상 나빠진 항목 목록"""
+    regressions = []
+    for scale, result in results.items():
+        base = baseline.get("scales", {}).get(scale)
+        if not base:
+            continue
+        checks = [
+            ("entries_per_sec", result["entries_per_sec"], base["entries_per_sec"], True),
+            ("run_p95_ms", result["run_p95_ms"], base["run_p95_ms"], False),
+            ("peak_rss_mb", result["peak_rss_mb"], base.get("peak_rss_mb"), False),
+        ]
+        print(f"\n[{scale}배] 기준값 대비")
+        for name, current, reference, higher_is_better in checks:
+            if current is None or not reference:
+                continue
+            ratio = current / reference
+            worse = ratio < 1 - TOLERANCE if higher_is_better else ratio > 1 + TOLERANCE
+            print(f"  {name:<16} {reference:>10} → {current:>10} ({ratio:.2f}배){'  ← 나빠짐' if worse else ''}")
+            if worse:
+                regressions.append(f"{scale}배 {name}: {reference} → {current}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스크래핑 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="피드 크기 배수")
+    parser.add_argument("--repeat", type=int, default=3, help="크기별 반복 실행 횟수")
+    parser.add_argument("--parser", choices=["feedparser", "stream"], default=os.getenv("FEED_PARSER", "feedparser"))
+    parser.add_argument("--profiles", type=int, default=0, help="프로필 수 (0이면 PROFILES_FILE 없이 기본 프로필)")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값 파일로 저장")
+    parser.add_argument("--check", action="store_true", help="기준값보다 나빠지면 종료 코드 1")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(run_child(args.child, args.repeat, args.profiles)))
+        return
+
+    print(
+        f"피드 파서: {args.parser}, 반복: {args.repeat}회, HOURS_LIMIT: {BENCH_HOURS_LIMIT}"
+        f"{f', 프로필 {args.profiles}개' if args.profiles else ''}"
+    )
+    print(f"제외한 소스 (헤드리스 브라우저, 픽스처 없음): {', '.join(BROWSER_SOURCES)}")
+    results = {}
+    for scale in args.scales:
+        results[str(scale)] = run_scale(scale, args.repeat, args.parser, args.profiles)
+        print_result(results[str(scale)])
+
+    if args.save_baseline:
+        BASELINE_FILE.write_text(
+            json.dumps({"parser": args.parser, "repeat": args.repeat, "profiles": args.profiles, "scales": results}, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        print(f"\n기준값 저장: {BASELINE_FILE}")
+        return
+
+    if not BASELINE_FILE.exists():
+        print("\n기준값 파일이 없습니다. --save-baseline으로 먼저 저장하세요.")
+        return
+
+    baseline = json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+    if baseline.get("parser") != args.parser:
+        print(f"\n주의: 기준값은 {baseline.get('parser')} 파서로 측정했습니다.")
+    if baseline.get("profiles", 0) != args.profiles:
+        print(f"\n주의: 기준값은 프로필 {baseline.get('profiles', 0)}개로 측정했습니다.")
+    regressions = compare(results, baseline)
+    if regressions:
+        print("\n기준값보다 나빠진 항목:")
+        for line in regressions:
+            print(f"  {line}")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
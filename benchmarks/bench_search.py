@@ -0,0 +1,95 @@
+"""아티클 검색 벤치마크
+
+임시 DB에 합성 아티클을 저장하고 (`ArticleStore.add`, 실행 단위 배치)
+`--search`와 같은 쿼리의 응답 시간을 측정합니다.
+
+사용법:
+  python benchmarks/bench_search.py
+  python benchmarks/bench_search.py --articles 100000 --batch 200
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.base import Article
+from utils.article_store import ArticleStore
+
+SOURCES = ["요즘IT", "브런치", "GeekNews", "아웃스탠딩", "벤처스퀘어", "플래텀", "바이라인네트워크"]
+WORDS = (
+    "프로덕트 로드맵 기획 기획자 서비스 사용자 경험 데이터 지표 실험 성장 리텐션 온보딩 "
+    "스타트업 투자 유치 시리즈 채용 조직 문화 협업 디자인 개발 출시 고객 인터뷰 가설 검증 "
+    "우선순위 백로그 스프린트 회고 전략 시장 경쟁 플랫폼 구독 가격 AI 모델 에이전트 "
+    "PM PO UX product manager roadmap growth metrics"
+).split()
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주"
+QUERIES = ["프로덕트 로드맵", "사용자 경험", "PM", "리텐션 실험", "product roadmap", "투자 유치 시리즈"]
+
+
+def make_articles(count: int, seed: int = 42) -> list[Article]:
+    """합성 아티클 생성 (제목 6~12단어, 요약 30~60단어)
+
+    단어의 약 10%만 주제어(WORDS)이고 나머지는 무작위 일반 단어이므로
+    실제 기사처럼 검색어가 일부 아티클에만 나타납니다.
+    """
+    rng = random.Random(seed)
+    now = datetime.now()
+    filler = ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(20000)]
+
+    def text(k: int) -> str:
+        return " ".join(rng.choice(WORDS) if rng.random() < 0.1 else rng.choice(filler) for _ in range(k))
+
+    return [
+        Article(
+            title=text(rng.randint(6, 12)),
+            url=f"https://example.com/{rng.choice(SOURCES)}/{i}",
+            source=rng.choice(SOURCES),
+            summary=text(rng.randint(30, 60)),
+            published_at=now - timedelta(minutes=i),
+            author=f"작성자{i % 500}",
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="아티클 검색 벤치마크")
+    parser.add_argument("--articles", type=int, default=50000, help="저장할 아티클 수")
+    parser.add_argument("--batch", type=int, default=150, help="한 번에 저장할 아티클 수 (실행 한 번 분량)")
+    parser.add_argument("--repeat", type=int, default=20, help="쿼리별 실행 횟수")
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_file = os.path.join(tmp_dir, "articles.db")
+        store = ArticleStore(db_file)
+
+        started = time.perf_counter()
+        for i in range(0, len(articles), args.batch):
+            store.add(articles[i:i + args.batch])
+        elapsed = time.perf_counter() - started
+        size_mb = sum(p.stat().st_size for p in Path(tmp_dir).iterdir()) / 1024 / 1024
+        print(f"저장: {len(store)}개, {elapsed:.2f}초 ({len(articles) / elapsed:,.0f}개/초), DB {size_mb:.1f}MB")
+
+        print(f"\n검색 ({args.repeat}회 중앙값 / p95, 상위 20건)")
+        for query in QUERIES:
+            times = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                results = store.search(query, limit=20)
+                times.append((time.perf_counter() - started) * 1000)
+            times.sort()
+            p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+            print(f"  {statistics.median(times):7.2f}ms / {p95:7.2f}ms  {query!r} ({len(results)}건)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
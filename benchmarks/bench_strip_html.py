@@ -0,0 +1,80 @@
+"""요약문 HTML 제거 마이크로 벤치마크
+
+benchmarks/fixtures/feeds의 피드 요약문으로 기존 BeautifulSoup 경로와
+utils.text.strip_html을 비교합니다. 결과가 다르면 실패로 종료합니다.
+
+사용법:
+  python benchmarks/bench_strip_html.py
+  python benchmarks/bench_strip_html.py --repeat 20 --length 200
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feedparser
+from bs4 import BeautifulSoup
+
+from utils.text import strip_html
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "feeds"
+
+
+def load_summaries() -> list[str]:
+    """픽스처 피드의 엔트리 요약문 목록"""
+    summaries = []
+    for path in sorted(FIXTURES_DIR.glob("*.xml")):
+        feed = feedparser.parse(path.read_bytes())
+        summaries.extend(entry.get("summary", "") for entry in feed.entries)
+    return [s for s in summaries if s]
+
+
+def bs4_strip(summary: str, length: int) -> str:
+    return BeautifulSoup(summary, "html.parser").get_text(strip=True)[:length]
+
+
+def measure(func, summaries: list[str], length: int, repeat: int) -> float:
+    """가장 빠른 회차의 요약문 1개당 처리 시간 (마이크로초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for summary in summaries:
+            func(summary, length)
+        best = min(best, time.perf_counter() - started)
+    return best / len(summaries) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요약문 HTML 제거 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수 (기본값: 10)")
+    parser.add_argument("--length", type=int, default=200, help="추출할 글자 수 (기본값: 200)")
+    args = parser.parse_args()
+
+    summaries = load_summaries()
+    if not summaries:
+        print(f"요약문 픽스처가 없습니다: {FIXTURES_DIR}")
+        sys.exit(1)
+
+    mismatches = [s for s in summaries if bs4_strip(s, args.length) != strip_html(s, args.length)]
+    if mismatches:
+        print(f"결과 불일치 {len(mismatches)}건:")
+        for summary in mismatches[:3]:
+            print(f"  {summary[:120]!r}")
+        sys.exit(1)
+
+    total_kb = sum(len(s) for s in summaries) / 1024
+    print(f"요약문 {len(summaries)}개 ({total_kb:.1f}KB), 결과 일치")
+
+    bs4_us = measure(bs4_strip, summaries, args.length, args.repeat)
+    fast_us = measure(strip_html, summaries, args.length, args.repeat)
+
+    print(f"  BeautifulSoup   {bs4_us:8.1f} us/건")
+    print(f"  strip_html      {fast_us:8.1f} us/건")
+    print(f"  → {bs4_us / fast_us:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
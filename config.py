@@ -1,8 +1,26 @@
 """설정 파일"""
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+
+def _find_env_file() -> str:
+    """config.py가 있는 디렉터리부터 상위로 올라가며 .env 찾기 (load_dotenv 기본 동작과 같음)"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        path = os.path.join(directory, ".env")
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return ""
+        directory = parent
+
+
+# python-dotenv는 .env 파일이 있을 때만 불러옴 (GitHub Actions 등은 환경 변수만 사용)
+_ENV_FILE = _find_env_file()
+if _ENV_FILE:
+    from dotenv import load_dotenv
+
+    load_dotenv(_ENV_FILE)
 
 # Slack 설정
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL", "")
@@ -10,8 +28,86 @@ SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL", "")
 # 스케줄 설정
 SCHEDULE_TIME = os.getenv("SCHEDULE_TIME", "09:00")
 
+# 데몬 모드: 모아 둔 새 아티클을 전송할 시각 (쉼표로 구분, 예: "09:00,13:00,18:00")
+DIGEST_TIMES = [t for t in os.getenv("DIGEST_TIMES", SCHEDULE_TIME).split(",") if t.strip()]
+
+# 데몬 모드: 소스별 확인 주기 (분 단위, 발행 간격에 맞춰 최소~최대 사이에서 조정)
+SCHEDULE_STATE_FILE = os.getenv("SCHEDULE_STATE_FILE", "schedule_state.json")
+POLL_DEFAULT_MINUTES = float(os.getenv("POLL_DEFAULT_MINUTES", "60"))   # 발행 이력이 없을 때
+POLL_MIN_MINUTES = float(os.getenv("POLL_MIN_MINUTES", "15"))
+POLL_MAX_MINUTES = float(os.getenv("POLL_MAX_MINUTES", "720"))
+
 # 캐시 설정
-CACHE_FILE = os.getenv("CACHE_FILE", "cache.json")
+CACHE_FILE = os.getenv("CACHE_FILE", "cache.log")                           # 전송한 URL 추가 전용 로그 (이전 cache.json은 자동으로 옮김)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "log")                            # log: 추가 전용 로그, sqlite: 여러 실행이 함께 쓰는 SQLite (캐시 파일 옆 .db), index: mmap 지문 색인 (.fp)
+CACHE_CLAIM_TIMEOUT_MINUTES = float(os.getenv("CACHE_CLAIM_TIMEOUT_MINUTES", "30"))  # sqlite: 전송 중 선점이 이 시간보다 오래되면 다른 실행이 다시 선점
+CACHE_FSYNC_BATCH = int(os.getenv("CACHE_FSYNC_BATCH", "100"))               # 몇 개씩 모아서 로그에 추가하고 fsync할지
+CACHE_COMPACT_RATIO = float(os.getenv("CACHE_COMPACT_RATIO", "2"))           # 로그 줄 수가 현재 항목 수의 몇 배를 넘으면 정리할지
+CACHE_COMPACT_MIN_LINES = int(os.getenv("CACHE_COMPACT_MIN_LINES", "1000"))  # 이보다 짧은 로그는 정리하지 않음
+CACHE_TTL_DAYS = float(os.getenv("CACHE_TTL_DAYS", "30"))                   # 전송 후 며칠이 지난 URL을 메모리에서 내보낼지 (0이면 계속 둠)
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "20000"))              # 메모리에 둘 최대 항목 수, 넘으면 오래 전에 보낸 것부터 (0이면 제한 없음)
+CACHE_HISTORY = os.getenv("CACHE_HISTORY", "true").lower() == "true"          # 내보낸 URL을 전송 이력(블룸 필터 + 디스크 색인)으로 옮길지 (false면 잊음)
+CACHE_BLOOM_CAPACITY = int(os.getenv("CACHE_BLOOM_CAPACITY", "10000"))        # 전송 이력 블룸 필터의 첫 용량 (가득 차면 두 배씩 추가)
+CACHE_BLOOM_ERROR_RATE = float(os.getenv("CACHE_BLOOM_ERROR_RATE", "0.01"))   # 블룸 필터 오탐률 (오탐이면 디스크 색인을 읽음)
+CACHE_BLOOM_MAX_MB = float(os.getenv("CACHE_BLOOM_MAX_MB", "16"))             # 캐시 하나의 블룸 필터 최대 메모리 (MB)
+CACHE_DELTA_MAX = int(os.getenv("CACHE_DELTA_MAX", "4096"))                  # 지문 색인의 델타 로그가 몇 개를 넘으면 정렬된 파일에 병합할지
+
+# 소스별 캐시 보관 정책 (없으면 위 값) - 소스 이름: (보관 일수, 최대 항목 수), 0이면 제한 없음
+CACHE_SOURCE_POLICIES = {
+    "GeekNews": (90, 0),   # 하루 발행량이 많고 며칠 지나면 목록에서 내려감
+}
+
+# 프로필(팀별 다이제스트) 파일 - 팀마다 키워드/소스/슬랙 채널/캐시를 따로 지정 (빈 값이면 아래 설정으로 한 프로필)
+PROFILES_FILE = os.getenv("PROFILES_FILE", "")
+
+# 소스별 상태(서킷 브레이커) 설정 - 상태 파일은 캐시 파일 옆에 저장
+SOURCE_HEALTH_FILE = os.getenv(
+    "SOURCE_HEALTH_FILE", os.path.join(os.path.dirname(CACHE_FILE), "source_health.json")
+)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))         # 연속 실패 몇 회부터 건너뛸지
+CIRCUIT_BACKOFF_MINUTES = float(os.getenv("CIRCUIT_BACKOFF_MINUTES", "60"))          # 처음 건너뛰는 시간 (분)
+CIRCUIT_MAX_BACKOFF_MINUTES = float(os.getenv("CIRCUIT_MAX_BACKOFF_MINUTES", "1440"))  # 최대 건너뛰는 시간 (분)
+
+# 실행 지표 설정 - 실행마다 JSON 한 줄 추가 (빈 값이면 저장 안 함)
+METRICS_FILE = os.getenv("METRICS_FILE", "metrics.jsonl")
+METRICS_TEXTFILE = os.getenv("METRICS_TEXTFILE", "")   # OpenMetrics 텍스트 파일 (node_exporter textfile collector용)
+
+# 원본 응답 보관 설정 - --replay로 네트워크 없이 다시 실행할 수 있도록 저장 (빈 값이면 보관 안 함)
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "archive")
+ARCHIVE_KEEP_DAYS = int(os.getenv("ARCHIVE_KEEP_DAYS", "30"))   # 보관 기간 (일, 0이면 정리 안 함)
+
+# 아티클 보관/검색 DB (SQLite FTS5, --search로 검색, 빈 값이면 저장 안 함)
+ARTICLE_DB_FILE = os.getenv("ARTICLE_DB_FILE", "articles.db")
+
+# 지난 아티클 채우기 설정 (--backfill, WordPress 피드의 지난 페이지)
+BACKFILL_HOST_CONCURRENCY = int(os.getenv("BACKFILL_HOST_CONCURRENCY", "2"))   # 소스(호스트)별 동시 요청 수
+BACKFILL_PARSE_WORKERS = int(os.getenv("BACKFILL_PARSE_WORKERS", "0"))         # 파싱 프로세스 수 (0이면 CPU 수)
+BACKFILL_MAX_PAGES = int(os.getenv("BACKFILL_MAX_PAGES", "200"))               # 소스별 최대 페이지 수
+BACKFILL_BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "200"))             # 한 번에 저장할 아티클 수
+
+# 유사 아티클(같은 보도자료 등) 묶음 설정
+NEAR_DUP_STATE_FILE = os.getenv("NEAR_DUP_STATE_FILE", "fingerprints.json")   # 전송한 아티클 서명 저장 파일
+NEAR_DUP_THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", "0.6"))           # 같은 글로 볼 유사도 (0~1, 제목만으로는 0.85 이상)
+NEAR_DUP_HISTORY_DAYS = int(os.getenv("NEAR_DUP_HISTORY_DAYS", "14"))        # 전송 이력 비교 기간 (일)
+
+# 공용 HTTP 클라이언트 설정
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))     # 기본 타임아웃 (초)
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))        # 일시적 오류 재시도 횟수
+HTTP_BACKOFF = float(os.getenv("HTTP_BACKOFF", "0.5"))    # 재시도 백오프 계수 (초)
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))   # 호스트별 연결 풀 크기
+
+# 피드 조건부 요청(ETag/Last-Modified) 상태 파일
+FEED_STATE_FILE = os.getenv("FEED_STATE_FILE", "feed_state.json")
+
+# 피드 요청 타임아웃 (초 단위)
+FEED_TIMEOUT = float(os.getenv("FEED_TIMEOUT", "15"))
+
+# 피드 파서 ("feedparser": 문서 전체 파싱, "stream": 필요한 엔트리까지만 스트리밍 파싱)
+FEED_PARSER = os.getenv("FEED_PARSER", "feedparser")
+
+# 헤드리스 브라우저 풀 설정 (브런치, 디스콰이엇 등 CSR 사이트용)
+BROWSER_CONTEXTS = int(os.getenv("BROWSER_CONTEXTS", "2"))      # 동시에 렌더링할 페이지 수
+BROWSER_TIMEOUT = float(os.getenv("BROWSER_TIMEOUT", "20"))     # 목록이 나타날 때까지 기다리는 시간 (초)
 
 # 스크래핑 시간 제한 (시간 단위)
 HOURS_LIMIT = int(os.getenv("HOURS_LIMIT", "24"))
@@ -34,13 +130,18 @@ KEYWORDS = [
     "사용자 경험",
 ]
 
+# 짧은 영문 키워드(PM, PO, UX 등)는 단어 경계에서만 매칭
+# 예: "UPMOST", "PM2"의 "PM"은 제외, "PM이", "UX/UI", 복수형 "PMs"는 매칭
+KEYWORD_WORD_BOUNDARY = os.getenv("KEYWORD_WORD_BOUNDARY", "true").lower() == "true"
+KEYWORD_BOUNDARY_MAX_LENGTH = 3  # 단어 경계 규칙을 적용할 최대 글자 수
+
 # 각 스크래퍼 활성화 여부
 SCRAPERS_ENABLED = {
     "yozm": True,
-    "brunch": False,
+    "brunch": False,          # 헤드리스 브라우저 필요 (playwright), 실제 페이지에서 셀렉터 확인 전까지 비활성
     "medium": False,
     "geeknews": True,
-    "disquiet": False,
+    "disquiet": False,        # 헤드리스 브라우저 필요 (playwright), 실제 페이지에서 셀렉터 확인 전까지 비활성
     "outstanding": True,      # 아웃스탠딩
     "venturesquare": True,    # 벤처스퀘어
     "platum": True,           # 플래텀
@@ -49,3 +150,41 @@ SCRAPERS_ENABLED = {
 
 # 최대 아티클 수 제한
 MAX_ARTICLES = 20
+
+# 아티클 랭킹 설정 (점수 = 소스 가중치 × (키워드 점수 + 최신도 점수))
+MAX_PER_SOURCE = int(os.getenv("MAX_PER_SOURCE", "6"))                  # 소스별 최대 아티클 수 (0이면 제한 없음)
+RANK_HALF_LIFE_HOURS = float(os.getenv("RANK_HALF_LIFE_HOURS", "24"))   # 최신도 점수가 절반이 되는 시간
+RANK_RECENCY_WEIGHT = float(os.getenv("RANK_RECENCY_WEIGHT", "6"))      # 방금 발행된 글의 최신도 점수
+
+# 키워드별 가중치 (없으면 1.0) - 구체적인 키워드일수록 높게
+KEYWORD_WEIGHTS = {
+    "프로덕트 매니저": 3.0,
+    "프로덕트 오너": 3.0,
+    "product manager": 3.0,
+    "product owner": 3.0,
+    "product management": 3.0,
+    "서비스 기획": 2.0,
+    "기획자": 2.0,
+    "프로덕트 디자인": 2.0,
+    "PM": 1.5,
+    "PO": 1.5,
+}
+
+# 소스별 가중치 (없으면 1.0) - PM 전문 매체는 높게, 일반 스타트업 뉴스는 낮게
+SOURCE_WEIGHTS = {
+    "요즘IT": 1.2,
+    "브런치": 1.1,
+    "디스콰이엇": 1.1,
+    "Medium": 1.0,
+    "GeekNews": 1.0,
+    "아웃스탠딩": 0.9,
+    "벤처스퀘어": 0.8,
+    "플래텀": 0.8,
+    "바이라인네트워크": 0.8,
+}
+
+# 동시 스크래핑 설정 (SCRAPE_WORKERS=1이면 순차 실행)
+SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS", "4"))
+
+# 소스별 스크래핑 제한 시간 (초 단위)
+SCRAPE_TIMEOUT = float(os.getenv("SCRAPE_TIMEOUT", "30"))
@@ -1,119 +1,745 @@
 """PM/PO 스크래핑 봇 메인 실행 파일"""
 import argparse
+import os
+import sqlite3
 import sys
 import time
-from datetime import datetime
-
-import schedule
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
 
 from scrapers import (
-    YozmScraper,
-    BrunchScraper,
-    MediumScraper,
-    GeekNewsScraper,
-    DisquietScraper,
-    OutstandingScraper,
-    VentureSquareScraper,
-    PlatumScraper,
-    BylineScraper,
+    SCRAPER_REGISTRY,
     Article,
+    FeedFetcher,
+    SourceHealth,
+    get_scraper_class,
+    run_scrapers,
 )
+from scrapers.browser import active_browser_pool, close_browser_pool
 from notifiers import SlackNotifier
-from utils import Cache
-from config import SCRAPERS_ENABLED, SCHEDULE_TIME, SLACK_WEBHOOK_URL, MAX_ARTICLES
-
-
-def get_scrapers() -> list:
-    """활성화된 스크래퍼 목록 반환"""
-    scrapers = []
-
-    if SCRAPERS_ENABLED.get("yozm", True):
-        scrapers.append(YozmScraper())
-    if SCRAPERS_ENABLED.get("brunch", False):
-        scrapers.append(BrunchScraper())
-    if SCRAPERS_ENABLED.get("medium", False):
-        scrapers.append(MediumScraper())
-    if SCRAPERS_ENABLED.get("geeknews", True):
-        scrapers.append(GeekNewsScraper())
-    if SCRAPERS_ENABLED.get("disquiet", False):
-        scrapers.append(DisquietScraper())
-    if SCRAPERS_ENABLED.get("outstanding", True):
-        scrapers.append(OutstandingScraper())
-    if SCRAPERS_ENABLED.get("venturesquare", True):
-        scrapers.append(VentureSquareScraper())
-    if SCRAPERS_ENABLED.get("platum", True):
-        scrapers.append(PlatumScraper())
-    if SCRAPERS_ENABLED.get("byline", True):
-        scrapers.append(BylineScraper())
-
-    return scrapers
-
-
-def run_scraping(test_mode: bool = False) -> None:
-    """스크래핑 실행 및 슬랙 전송"""
-    print(f"\n{'=' * 50}")
-    print(f"스크래핑 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'=' * 50}\n")
-
-    cache = Cache()
-    notifier = SlackNotifier()
-    scrapers = get_scrapers()
+from utils import Cache, get_client, open_cache
+from utils.archive import RawArchive, get_archive, set_archive
+from utils.article_store import ArticleStore, print_search
+from utils.metrics import GLOBAL, RunMetrics, get_metrics, start_run
+from utils.near_dup import NearDuplicateFilter
+from utils.profiles import Profile, load_profiles, union_keywords, union_sources
+from utils.ranking import Ranker, select_top, Selection
+from utils.scheduler import TimerHeap, PollPlanner, next_digest_time
+from utils.index_cache import IndexCache
+from utils.sqlite_cache import SqliteCache
+from config import (
+    SCRAPERS_ENABLED,
+    PROFILES_FILE,
+    DIGEST_TIMES,
+    MAX_ARTICLES,
+    MAX_PER_SOURCE,
+    SCRAPE_WORKERS,
+    ARCHIVE_DIR,
+    ARTICLE_DB_FILE,
+)
 
-    all_articles: list[Article] = []
 
-    for scraper in scrapers:
-        print(f"[{scraper.name}] 스크래핑 중...")
+def get_scrapers(
+    fetcher: FeedFetcher = None,
+    sources: Optional[Iterable[str]] = None,
+    keywords: Optional[list[str]] = None,
+) -> list:
+    """활성화된 스크래퍼 목록 반환 (sources를 주면 SCRAPERS_ENABLED 대신 그 소스 키만)
+
+    스크래퍼 모듈은 여기서 처음 불러오므로, 실행하지 않는 소스의 의존성은 불러오지 않습니다.
+    keywords를 주면 KEYWORDS 대신 그 키워드로 필터링합니다 (여러 프로필의 키워드를 합친 목록).
+    """
+    fetcher = fetcher or FeedFetcher()
+    keys = [
+        key for key in SCRAPER_REGISTRY
+        if (key in sources if sources is not None else SCRAPERS_ENABLED.get(key, False))
+    ]
+    return [get_scraper_class(key)(keywords=keywords, fetcher=fetcher) for key in keys]
+
+
+@dataclass
+class ProfileTarget:
+    """프로필 하나의 전송 상태 (캐시, 전송 이력, 알림 채널)"""
+
+    profile: Profile
+    cache: Cache | SqliteCache | IndexCache
+    near_dup: NearDuplicateFilter
+    notifier: SlackNotifier
+    sources: set[str]  # 이 프로필이 받는 소스 (스크래퍼 이름)
+    label: str = ""    # 프로필이 여러 개일 때 출력에 붙이는 이름
+
+    @property
+    def prefix(self) -> str:
+        return f"{self.label}: " if self.label else ""
+
+
+def load_run_profiles(sources: Optional[list[str]] = None) -> list[Profile]:
+    """PROFILES_FILE의 프로필 목록 (없으면 기본 프로필 하나, 읽을 수 없으면 빈 목록)"""
+    try:
+        profiles = load_profiles(PROFILES_FILE, sources=sources, known_sources=SCRAPER_REGISTRY)
+    except ValueError as e:
+        print(e)
+        return []
+    return [profile for profile in profiles if profile.sources]
+
+
+def open_targets(profiles: list[Profile], replay_sent: Optional[set[str]] = None) -> list[ProfileTarget]:
+    """프로필별 캐시, 유사 아티클 이력, 알림 채널 준비
+
+    replay_sent를 주면 (재실행) 상태 파일 대신 그 URL 목록을 캐시로 쓰고 전송 이력 비교는 생략합니다.
+    """
+    targets = []
+    signatures: dict[str, list[int]] = {}  # 유사 아티클 서명은 프로필끼리 공유
+    for profile in profiles:
+        if replay_sent is not None:
+            cache = Cache(cache_file="")
+            for url in replay_sent:
+                cache.mark_sent(url)
+            near_dup = NearDuplicateFilter(state_file="", signatures=signatures)
+        else:
+            cache = open_cache(profile.cache_file)
+            near_dup = NearDuplicateFilter(profile.near_dup_state_file, signatures=signatures)
+        targets.append(ProfileTarget(
+            profile=profile,
+            cache=cache,
+            near_dup=near_dup,
+            notifier=SlackNotifier(webhook_url=profile.slack_webhook_url, channel=profile.slack_channel),
+            sources={get_scraper_class(key).name for key in profile.sources},
+            label=profile.name if len(profiles) > 1 else "",
+        ))
+    return targets
+
+
+def run_scraping(
+    test_mode: bool = False,
+    workers: int = SCRAPE_WORKERS,
+    replay: Optional[str] = None,
+    sources: Optional[list[str]] = None,
+) -> None:
+    """스크래핑 실행 및 슬랙 전송 (sources: 실행할 소스 키, 기본값은 SCRAPERS_ENABLED)
+
+    피드는 모든 프로필의 소스/키워드를 합쳐 한 번만 받아 파싱하고, 결과를 프로필마다
+    키워드로 나눠 각자의 캐시와 채널로 보냅니다 (PROFILES_FILE이 없으면 기본 프로필 하나).
+    replay에 보관된 실행 ID를 주면 네트워크 없이 그 실행의 원본 응답으로
+    파싱/필터링/랭킹을 다시 실행합니다 (테스트 모드와 같이 전송/저장하지 않음).
+    """
+    profiles = load_run_profiles(sources)
+    if not profiles:
+        print("실행할 프로필이 없습니다.")
+        return
+
+    archive = None
+    if replay:
         try:
-            articles = scraper.scrape()
-            print(f"[{scraper.name}] {len(articles)}개 아티클 발견")
-
-            # 중복 필터링
-            new_articles = [a for a in articles if not cache.is_sent(a.url)]
-            print(f"[{scraper.name}] {len(new_articles)}개 새 아티클")
-
-            all_articles.extend(new_articles)
+            archive = RawArchive.load(replay)
+        except (OSError, ValueError) as e:
+            print(f"보관된 실행을 불러올 수 없습니다: {e}")
+            return
+        test_mode = True
 
-        except Exception as e:
-            print(f"[{scraper.name}] 오류 발생: {e}")
-            continue
-
-    print(f"\n총 {len(all_articles)}개의 새 아티클 발견")
-
-    # 최대 개수 제한
-    if len(all_articles) > MAX_ARTICLES:
-        print(f"→ {MAX_ARTICLES}개로 제한")
-        all_articles = all_articles[:MAX_ARTICLES]
-
-    if all_articles:
-        # 슬랙 전송
-        success = notifier.send(all_articles, test_mode=test_mode)
-
-        if success and not test_mode:
-            # 전송 성공 시 캐시에 저장
-            for article in all_articles:
-                cache.mark_sent(article.url)
-            cache.save()
-            print("캐시 저장 완료")
+    print(f"\n{'=' * 50}")
+    if archive is not None:
+        print(f"재실행: {archive.run_id} (원래 실행 {archive.started_at.strftime('%Y-%m-%d %H:%M:%S')})")
     else:
-        print("새로운 아티클이 없습니다.")
+        print(f"스크래핑 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'=' * 50}\n")
 
+    metrics = start_run("replay" if archive is not None else "test" if test_mode else "run")
+    keywords = union_keywords(profiles)
+    now = None
+
+    if archive is not None:
+        # 원래 실행 시점의 커서, 캐시 제외 목록, 기준 시각으로 재현 (전송 이력 비교는 생략)
+        set_archive(archive)
+        now = archive.started_at.astimezone(timezone.utc)
+        targets = open_targets(profiles, replay_sent=archive.already_sent)
+        fetcher = FeedFetcher(state_file="")
+        fetcher.cursors = dict(archive.cursors)
+        health = None
+        scrapers = [
+            scraper for scraper in get_scrapers(fetcher, union_sources(profiles), keywords)
+            if scraper.name in archive.sources
+        ]
+        for scraper in scrapers:
+            scraper.reference_time = now
+    else:
+        targets = open_targets(profiles)
+        fetcher = FeedFetcher()
+        health = SourceHealth()
+
+        # 연속으로 실패해 차단 중인 소스는 건너뜀
+        scrapers = []
+        for scraper in get_scrapers(fetcher, union_sources(profiles), keywords):
+            if health.allow(scraper.name):
+                scrapers.append(scraper)
+            else:
+                print(f"[{scraper.name}] 건너뜀: {health.describe(scraper.name)}")
+        archive = start_archive(metrics.run_id, metrics.mode, fetcher, scrapers)
+
+    if len(targets) > 1:
+        print(f"프로필 {len(targets)}개: {', '.join(target.label for target in targets)}")
+    print(f"{len(scrapers)}개 소스 스크래핑 중... (동시 실행 {max(1, workers)}개)")
+
+    # 끝나는 순서대로 결과를 받되, 최종 순서는 스크래퍼 등록 순서를 유지
+    new_by_source: list[dict[str, list[Article]]] = [{} for _ in targets]
+    results = []
+    opened = []
+
+    try:
+        for result in run_scrapers(scrapers, max_workers=workers):
+            results.append(result)
+            report_result(result)
+            for target, by_source in zip(targets, new_by_source):
+                if result.source in target.sources:
+                    by_source[result.source] = collect_new_articles(result, target)
+            if health is not None and health.record_result(result):
+                opened.append(result)
+    finally:
+        finish_archive(archive)
+
+    print_source_summary(results, health)
+    print_fetch_summary(fetcher)
+
+    store = None
+    if not test_mode:
+        health.save()
+        report_opened_circuits(opened, health, targets[0].notifier)
+        store = open_article_store()
+        store_articles(store, results)
+
+    delivered = True
+    try:
+        for target, by_source in zip(targets, new_by_source):
+            if target.label:
+                print(f"\n[프로필 {target.label}]")
+            articles = dedupe_articles(
+                article
+                for scraper in scrapers
+                for article in by_source.get(scraper.name, [])
+            )
+            delivered = deliver(articles, target, test_mode=test_mode, now=now, store=store) and delivered
+    finally:
+        if store is not None:
+            store.close()
+
+    # 모든 프로필에 전송했을 때만 커서를 저장해, 실패한 프로필은 다음 실행에서 다시 받음
+    if not test_mode:
+        commit_cursors(scrapers, targets, [
+            [article for articles in by_source.values() for article in articles] for by_source in new_by_source
+        ])
+    if delivered and not test_mode:
+        fetcher.save()
+
+    print()
+    print_http_summary()
+    print_browser_summary()
+    if not replay:
+        print_cache_summary(targets, metrics)
+        write_metrics(metrics)
     print(f"\n스크래핑 완료: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 
-def run_scheduler() -> None:
-    """스케줄러 실행"""
-    if not SLACK_WEBHOOK_URL:
-        print("경고: SLACK_WEBHOOK_URL이 설정되지 않았습니다.")
-        print(".env 파일에 SLACK_WEBHOOK_URL을 설정해주세요.")
-
-    print(f"스케줄러 시작 - 매일 {SCHEDULE_TIME}에 실행됩니다.")
+def open_article_store() -> Optional[ArticleStore]:
+    """아티클 보관 DB 열기 (ARTICLE_DB_FILE이 비어 있거나 열 수 없으면 None)"""
+    if not ARTICLE_DB_FILE:
+        return None
+    try:
+        return ArticleStore(ARTICLE_DB_FILE)
+    except sqlite3.Error as e:
+        print(f"아티클 보관 DB를 열 수 없습니다: {e}")
+        return None
+
+
+def store_articles(store: Optional[ArticleStore], results: list) -> None:
+    """이번 실행에서 스크래핑한 아티클 전체를 보관 DB에 저장 (이미 전송한 글 포함)"""
+    if store is None:
+        return
+    try:
+        count = store.add(article for result in results for article in result.articles)
+        if count:
+            print(f"아티클 {count}개 보관 (전체 {len(store)}개)")
+    except sqlite3.Error as e:
+        print(f"아티클 보관 실패: {e}")
+
+
+def start_archive(run_id: str, mode: str, fetcher: FeedFetcher, scrapers: list) -> Optional[RawArchive]:
+    """원본 응답 보관 시작 (ARCHIVE_DIR가 비어 있으면 보관하지 않음)"""
+    if not ARCHIVE_DIR:
+        return None
+    archive = RawArchive(run_id, mode=mode)
+    archive.sources = [scraper.name for scraper in scrapers]
+    archive.cursors = {url: dict(cursor) for url, cursor in fetcher.cursors.items()}
+    set_archive(archive)
+    return archive
+
+
+def finish_archive(archive: Optional[RawArchive]) -> None:
+    """보관 종료 후 실행 목록 저장 (재실행 중이면 저장하지 않음)"""
+    set_archive(None)
+    if archive is None or archive.replaying:
+        return
+    try:
+        archive.save()
+        print(f"원본 응답 보관: {archive.run_id} (재실행: python main.py --replay {archive.run_id})")
+    except OSError as e:
+        print(f"원본 응답 보관 실패: {e}")
+
+
+def report_result(result) -> None:
+    """소스별 스크래핑 결과 출력 (모든 프로필에 공통)"""
+    get_metrics().add_time(result.source, "scrape", result.elapsed)  # 소스 전체 소요 시간
+    if result.error:
+        print(f"[{result.source}] 오류 발생: {result.error}")
+    else:
+        print(f"[{result.source}] {len(result.articles)}개 아티클 발견 ({result.elapsed:.1f}초)")
+
+
+def collect_new_articles(result, target: ProfileTarget) -> list[Article]:
+    """프로필의 키워드에 매칭된 아티클 중 아직 전송하지 않은 아티클만 반환"""
+    if result.error:
+        return []
+
+    # 이미 전송한 아티클 제외 (정규화 URL 기준)
+    metrics = get_metrics()
+    with metrics.timer(result.source, "cache_filter"):
+        articles = target.profile.select(result.articles)
+        # URL 묶음을 한 번에 조회 (CACHE_BACKEND=index는 색인 탐색 한 번)
+        new_urls = set(target.cache.filter_new([a.canonical_url for a in articles]))
+        new_articles = [a for a in articles if a.canonical_url in new_urls]
+    metrics.count(result.source, "articles_kept", len(articles))
+    metrics.count(result.source, "cache_hits", len(articles) - len(new_articles))
+    metrics.count(result.source, "cache_misses", len(new_articles))
+    archive = get_archive()
+    if archive is not None and len(new_articles) < len(articles):
+        archive.mark_already_sent(a.canonical_url for a in articles if a.canonical_url not in new_urls)
+    print(f"[{result.source}] {target.prefix}{len(new_articles)}개 새 아티클")
+    return new_articles
+
+
+def deliver(
+    articles: list[Article],
+    target: ProfileTarget,
+    test_mode: bool = False,
+    now: Optional[datetime] = None,
+    store: Optional[ArticleStore] = None,
+) -> bool:
+    """프로필 하나에 대해 유사 아티클 묶음 → 랭킹 → 슬랙 전송 → 상태 저장
+
+    전송에 성공했거나 보낼 아티클이 없으면 True를 반환합니다.
+    테스트 모드에서는 캐시를 저장하지 않습니다. 피드 상태(커서)는 모든 프로필에
+    전송한 뒤 호출한 쪽에서 저장합니다.
+    now는 최신도 점수의 기준 시각입니다 (기본값: 현재 시각).
+    store를 주면 전송한 아티클을 보관 DB에 전송됨으로 표시합니다.
+    """
+    metrics = get_metrics()
+
+    # 같은 보도자료 등 유사 아티클은 하나로 묶고, 최근 전송한 글과 비슷하면 제외
+    with metrics.timer(GLOBAL, "near_dup"):
+        articles, already_sent = target.near_dup.collapse(articles)
+    grouped = sum(len(a.duplicates) for a in articles)
+    if grouped or already_sent:
+        print(f"유사 아티클 {grouped}개 묶음, 최근 전송한 글과 유사한 {len(already_sent)}개 제외")
+    if already_sent and not test_mode:
+        # 최근 보낸 글과 같은 소식은 다시 보내지 않으므로 전송한 것으로 기록 (피드 커서가 이 엔트리를 넘어감)
+        target.cache.mark_sent_many((a.canonical_url, a.source) for a in already_sent)
+        target.cache.save()
+
+    print(f"\n{target.prefix}총 {len(articles)}개의 새 아티클 발견")
+
+    # 점수 상위 MAX_ARTICLES개 선택 (소스별 최대 MAX_PER_SOURCE개)
+    with metrics.timer(GLOBAL, "rank"):
+        ranker = Ranker(keywords=target.profile.keywords, now=now)
+        selection = select_top(articles, limit=MAX_ARTICLES, per_source=MAX_PER_SOURCE, ranker=ranker)
+    if selection.over_quota or selection.over_limit:
+        print(
+            f"→ {len(selection.selected)}개 선택 "
+            f"(소스별 한도 초과 {selection.over_quota}개, 전체 한도 초과 {selection.over_limit}개 제외)"
+        )
+    if test_mode:
+        print_ranking(selection)
+    articles = selection.articles
+
+    if articles and not test_mode:
+        # 같은 캐시를 쓰는 다른 실행이 이미 보냈거나 보내는 중인 아티클은 제외 (CACHE_BACKEND=sqlite)
+        claimed = target.cache.claim([a.canonical_url for a in articles])
+        if len(claimed) < len(articles):
+            print(f"다른 실행에서 전송했거나 전송 중인 {len(articles) - len(claimed)}개 제외")
+            articles = [a for a in articles if a.canonical_url in claimed]
+
+    if not articles:
+        print("새로운 아티클이 없습니다.")
+        return True
+
+    # 슬랙 전송
+    with metrics.timer(GLOBAL, "notify"):
+        success = target.notifier.send(articles, test_mode=test_mode)
+
+    if success:
+        for article in articles:
+            metrics.count(article.source, "sent")
+
+    if not success and not test_mode:
+        target.cache.release(a.canonical_url for a in articles)
+
+    if success and not test_mode:
+        # 전송 성공 시 캐시에 저장 (대표 아티클에 묶여 함께 보낸 유사 아티클 포함)
+        target.cache.mark_sent_many(
+            (a.canonical_url, a.source) for article in articles for a in (article, *article.duplicates)
+        )
+        target.cache.save()
+        target.near_dup.add(articles)
+        target.near_dup.save()
+        if store is not None:
+            try:
+                store.mark_sent(articles)
+            except sqlite3.Error as e:
+                print(f"아티클 보관 DB 갱신 실패: {e}")
+        print("캐시 저장 완료")
+
+    return success
+
+
+def commit_cursors(scrapers: Iterable, targets: list[ProfileTarget], collected: list[list[Article]]) -> None:
+    """피드 커서를 전송했거나 키워드로 걸러진 엔트리까지만 이동
+
+    collected는 프로필별로 전송 대상이었던 아티클이며, 그중 캐시에 없는 아티클(한도 초과, 전송 실패 등)은
+    커서를 넘기지 않아 다음 실행에서 다시 확인합니다. 보낸 아티클에 묶인 유사 아티클과 최근 전송한 글과
+    유사해 제외한 아티클은 deliver가 캐시에 기록하므로 결과가 확정된 것으로 봅니다.
+    """
+    unsent: set[str] = set()
+    for target, articles in zip(targets, collected):
+        unsent.update(target.cache.filter_new([article.canonical_url for article in articles]))
+    for scraper in scrapers:
+        scraper.commit_cursors(unsent)
+
+
+def dedupe_articles(articles: Iterable[Article]) -> list[Article]:
+    """소스 간 중복 아티클 제거 (정규화 URL 기준, 먼저 나온 아티클 유지)"""
+    metrics = get_metrics()
+    seen: set[str] = set()
+    unique = []
+    duplicates = 0
+
+    with metrics.timer(GLOBAL, "dedupe"):
+        for article in articles:
+            if article.canonical_url in seen:
+                duplicates += 1
+                metrics.count(article.source, "cross_source_duplicates")
+                continue
+            seen.add(article.canonical_url)
+            unique.append(article)
+
+    if duplicates:
+        print(f"소스 간 중복 {duplicates}개 제외")
+    return unique
+
+
+def write_metrics(metrics: RunMetrics) -> None:
+    """실행 지표 저장 (저장에 실패해도 실행은 계속)"""
+    try:
+        metrics.write()
+    except OSError as e:
+        print(f"실행 지표 저장 실패: {e}")
+
+
+def print_ranking(selection: Selection) -> None:
+    """선택된 아티클의 순위와 점수 구성 출력"""
+    if not selection.selected:
+        return
+
+    print(f"\n{'-' * 50}")
+    print("아티클 순위 (점수 = 소스 가중치 × (키워드 + 최신도))")
+    for rank, ranked in enumerate(selection.selected, 1):
+        print(f"  {rank:2d}. {ranked.score:5.2f}점 [{ranked.article.source}] {ranked.article.title}")
+        print(f"      {ranked.explain()}")
+    print(f"{'-' * 50}")
+
+
+def report_opened_circuits(opened: list, health: SourceHealth, notifier: SlackNotifier) -> None:
+    """이번 실행에서 차단되기 시작한 소스를 슬랙 오류 메시지로 알림"""
+    if not opened:
+        return
+
+    lines = [
+        f"{result.source}: {health.describe(result.source)} - {result.failure_reason}"
+        for result in opened
+    ]
+    notifier.send_error("연속으로 실패한 소스를 당분간 건너뜁니다.\n" + "\n".join(lines))
+
+
+def print_source_summary(results: list, health: Optional[SourceHealth] = None) -> None:
+    """소스별 소요 시간 및 상태 출력"""
+    if not results:
+        return
+
+    print(f"\n{'-' * 50}")
+    print("소스별 소요 시간")
+    for result in sorted(results, key=lambda r: r.elapsed, reverse=True):
+        line = f"  {result.source:<12} {result.elapsed:6.2f}초  {len(result.articles):3d}개  {result.status}"
+        if health is not None and result.failed:
+            line += f"  ({health.describe(result.source)})"
+        print(line)
+    print(f"{'-' * 50}")
+
+
+def print_fetch_summary(fetcher: FeedFetcher) -> None:
+    """소스별 조건부 요청(304) 비율 및 절약한 전송량 출력"""
+    lines = fetcher.summary_lines()
+    if not lines:
+        return
+
+    print("피드 요청 통계 (304 Not Modified)")
+    for line in lines:
+        print(f"  {line}")
+    print(f"{'-' * 50}")
+
+
+def print_http_summary() -> None:
+    """호스트별 HTTP 요청 소요 시간 및 전송량 출력"""
+    lines = get_client().summary_lines()
+    if not lines:
+        return
+
+    print("HTTP 요청 통계")
+    for line in lines:
+        print(f"  {line}")
+    print(f"{'-' * 50}")
+
+
+def print_cache_summary(targets: list[ProfileTarget], metrics: Optional[RunMetrics] = None) -> None:
+    """프로필별 중복 방지 캐시의 항목 수와 메모리 사용량 출력 (지표에도 기록)"""
+    print("중복 방지 캐시")
+    for target in targets:
+        usage = target.cache.memory_usage()
+        memory = usage["entries_bytes"] + usage["bloom_bytes"]
+        print(
+            f"  {target.profile.name:<12} 최근 {usage['entries']}개, 이력 {usage['history']}개, "
+            f"메모리 {memory / 1024:.0f}KB (블룸 필터 {usage['bloom_bytes'] / 1024:.0f}KB)"
+        )
+        if metrics is not None:
+            metrics.count(GLOBAL, "cache_entries", usage["entries"])
+            metrics.count(GLOBAL, "cache_history", usage["history"])
+            metrics.count(GLOBAL, "cache_memory_bytes", memory)
+    print(f"{'-' * 50}")
+
+
+def print_browser_summary() -> None:
+    """헤드리스 브라우저 렌더링 횟수 및 차단한 요청 수 출력"""
+    pool = active_browser_pool()
+    if pool is None:
+        return
+
+    print(pool.summary_line())
+    print(f"{'-' * 50}")
+
+
+def run_scheduler(workers: int = SCRAPE_WORKERS, sources: Optional[list[str]] = None) -> None:
+    """데몬 모드: 소스별 주기로 확인하고, 새 아티클은 모아 두었다가 전송 시각에 전송
+
+    타이머 힙에 소스별 다음 확인 시각과 다음 전송 시각을 넣고, 가장 가까운 시각까지
+    잠들었다가 깨어납니다. 확인 주기는 소스의 최근 발행 간격에 맞춰 조정됩니다.
+    프로필이 여러 개여도 소스는 한 번만 확인하고, 새 아티클은 프로필별로 모아 둡니다.
+    """
+    profiles = load_run_profiles(sources)
+    if not profiles:
+        print("실행할 프로필이 없습니다.")
+        return
+
+    fetcher = FeedFetcher()
+    targets = open_targets(profiles)
+    for target in targets:
+        if not target.notifier.webhook_url and not target.notifier.bot_token:
+            print(f"경고: {target.prefix}SLACK_WEBHOOK_URL이 설정되지 않았습니다.")
+            print(".env 파일에 SLACK_WEBHOOK_URL을 설정해주세요.")
+
+    planner = PollPlanner()
+    health = SourceHealth()
+    store = open_article_store()
+    scrapers = {
+        scraper.name: scraper
+        for scraper in get_scrapers(fetcher, union_sources(profiles), union_keywords(profiles))
+    }
+
+    # 전송 시각까지 모아 둔 프로필별 새 아티클 (정규화 URL → 아티클, 발견 순서 유지)
+    pending: list[dict[str, Article]] = [{} for _ in targets]
+
+    timers = TimerHeap()
+    now = time.time()
+    for name in scrapers:
+        timers.push(now, ("poll", name))
+    digest_at = next_digest_time(DIGEST_TIMES)
+    timers.push(digest_at.timestamp(), ("digest", None))
+
+    print(f"데몬 시작 - {len(scrapers)}개 소스, 전송 시각: {', '.join(DIGEST_TIMES)}")
     print("종료하려면 Ctrl+C를 누르세요.\n")
 
-    schedule.every().day.at(SCHEDULE_TIME).do(run_scraping)
-
     while True:
-        schedule.run_pending()
-        time.sleep(60)
+        jobs = timers.wait()
+        due_sources = []
+        for kind, name in jobs:
+            if kind != "poll":
+                continue
+            if health.allow(name):
+                due_sources.append(name)
+            else:
+                # 차단 중인 소스는 차단이 풀리는 시각에 다시 확인
+                timers.push(health.retry_at(name).timestamp(), ("poll", name))
+
+        if due_sources:
+            stamp = datetime.now().strftime("%H:%M:%S")
+            print(f"[{stamp}] 확인: {', '.join(due_sources)}")
+            metrics = start_run("poll")
+            polled = [scrapers[name] for name in due_sources]
+            archive = start_archive(metrics.run_id, metrics.mode, fetcher, polled)
+            opened = []
+            results = []
+            for result in run_scrapers(polled, max_workers=workers):
+                results.append(result)
+                report_result(result)
+                for target, waiting in zip(targets, pending):
+                    if result.source not in target.sources:
+                        continue
+                    for article in collect_new_articles(result, target):
+                        waiting.setdefault(article.canonical_url, article)
+                if health.record_result(result):
+                    opened.append(result)
+
+                planner.record(result.source, result.published)
+                next_poll = time.time() + planner.interval(result.source)
+                retry_at = health.retry_at(result.source)
+                if retry_at is not None:
+                    next_poll = max(next_poll, retry_at.timestamp())
+                timers.push(next_poll, ("poll", result.source))
+                print(f"[{result.source}] 다음 확인: {(next_poll - time.time()) / 60:.0f}분 후")
+            finish_archive(archive)
+            store_articles(store, results)
+            planner.save()
+            health.save()
+            report_opened_circuits(opened, health, targets[0].notifier)
+            write_metrics(metrics)
+            print(f"전송 대기 중인 아티클: {sum(len(waiting) for waiting in pending)}개")
+
+        if any(kind == "digest" for kind, _ in jobs):
+            print(f"\n{'=' * 50}")
+            waiting_count = sum(len(waiting) for waiting in pending)
+            print(f"전송: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ({waiting_count}개 대기)")
+            print(f"{'=' * 50}")
+            metrics = start_run("digest")
+            # 소스 등록 순서대로 정렬해 실행마다 같은 순서로 처리
+            order = {name: index for index, name in enumerate(scrapers)}
+            collected = [list(waiting.values()) for waiting in pending]
+            delivered = True
+            for target, waiting in zip(targets, pending):
+                if target.label:
+                    print(f"\n[프로필 {target.label}]")
+                articles = sorted(waiting.values(), key=lambda a: order.get(a.source, len(order)))
+                if deliver(articles, target, store=store):
+                    waiting.clear()
+                else:
+                    delivered = False
+            commit_cursors(scrapers.values(), targets, collected)
+            if delivered:
+                fetcher.save()
+            print_fetch_summary(fetcher)
+            print_http_summary()
+            print_cache_summary(targets, metrics)
+            write_metrics(metrics)
+            timers.push(next_digest_time(DIGEST_TIMES).timestamp(), ("digest", None))
+
+
+def compact_caches(sources: Optional[list[str]] = None) -> None:
+    """프로필별 캐시 로그를 현재 항목만 남기도록 정리"""
+    for profile in load_run_profiles(sources):
+        cache = open_cache(profile.cache_file)
+        if not os.path.exists(profile.cache_file) and not len(cache):
+            continue
+        cache.evict()
+        cache.compact()
+        usage = cache.memory_usage()
+        print(f"{profile.cache_file}: 최근 {usage['entries']}개, 이력 {usage['history']}개")
+
+
+def run_backfill(since: datetime, sources: Optional[list[str]] = None, seed_cache: bool = False) -> None:
+    """WordPress 피드의 지난 페이지에서 since 이후 아티클을 모아 보관 DB에 저장
+
+    seed_cache이면 모은 아티클을 프로필별 캐시에도 전송한 것으로 표시해, 이후 실행에서 보내지 않게 합니다.
+    """
+    from scrapers.backfill import backfill  # multiprocessing은 채우기에서만 사용
+
+    profiles = load_run_profiles(sources)
+    scrapers = [
+        scraper for scraper in get_scrapers(sources=union_sources(profiles), keywords=union_keywords(profiles))
+        if scraper.paged_feed
+    ]
+    if not scrapers:
+        paged = [key for key in SCRAPER_REGISTRY if get_scraper_class(key).paged_feed]
+        print(f"지난 페이지를 받을 수 있는 소스가 없습니다 (지원: {', '.join(paged)})")
+        return
+
+    store = open_article_store()
+    if store is None and not seed_cache:
+        print("ARTICLE_DB_FILE이 설정되지 않았습니다. --seed-cache로 캐시에만 저장할 수 있습니다.")
+        return
+    targets = open_targets(profiles) if seed_cache else []
+
+    print(f"\n{'=' * 50}")
+    print(f"지난 아티클 채우기: {since.astimezone().strftime('%Y-%m-%d')} 이후, {', '.join(s.name for s in scrapers)}")
+    print(f"{'=' * 50}\n")
+
+    saved = 0
+
+    def save_batch(articles: list[Article]) -> None:
+        nonlocal saved
+        if store is not None:
+            store.add(articles)
+        for target in targets:
+            target.cache.mark_sent_many(
+                (article.canonical_url, article.source)
+                for article in target.profile.select(articles)
+                if article.source in target.sources
+            )
+            target.cache.save()
+        saved += len(articles)
+        print(f"  {saved}개 저장")
+
+    started = time.monotonic()
+    try:
+        stats = backfill(scrapers, since.astimezone(timezone.utc), save_batch)
+    finally:
+        if store is not None:
+            store.close()
+
+    elapsed = time.monotonic() - started
+    print(f"\n{'소스':<12} {'페이지':>6} {'엔트리':>7} {'저장':>6} {'소요':>7}  멈춘 이유")
+    for stat in stats:
+        print(
+            f"{stat.source:<12} {stat.pages:>6} {stat.entries:>7} {stat.articles:>6} "
+            f"{stat.elapsed:>6.1f}s  {stat.stopped}"
+        )
+        for failure in stat.failures:
+            print(f"  - {failure}")
+    pages = sum(stat.pages for stat in stats)
+    print(f"\n완료: {pages}페이지, 아티클 {saved}개, {elapsed:.1f}초 ({pages / elapsed if elapsed else 0:.1f}페이지/초)")
+
+
+def parse_date(value: str) -> datetime:
+    """--since 값 검사 (YYYY-MM-DD, 로컬 시각 0시)"""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").astimezone()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식이 아닙니다: {value} (예: 2026-01-01)")
+
+
+def parse_sources(value: str) -> list[str]:
+    """--sources 값 검사 (SCRAPER_REGISTRY의 소스 키만 허용)"""
+    keys = [key.strip() for key in value.split(",") if key.strip()]
+    unknown = [key for key in keys if key not in SCRAPER_REGISTRY]
+    if unknown or not keys:
+        raise argparse.ArgumentTypeError(
+            f"알 수 없는 소스: {', '.join(unknown) or value} (사용 가능: {', '.join(SCRAPER_REGISTRY)})"
+        )
+    return keys
 
 
 def main():
@@ -124,7 +750,11 @@ def main():
 사용 예시:
   python main.py --test     테스트 실행 (슬랙 전송 없이 미리보기)
   python main.py --run      즉시 실행 (슬랙 전송)
-  python main.py            스케줄러 모드로 실행
+  python main.py --test --sources geeknews,yozm   일부 소스만 실행
+  python main.py --replay 20261017-090000-123456-4242   보관된 실행을 네트워크 없이 다시 실행
+  python main.py --search "프로덕트 로드맵"   지금까지 수집한 아티클 검색
+  python main.py --backfill --since 2026-01-01   WordPress 피드의 지난 아티클 채우기
+  python main.py            데몬 모드로 실행 (소스별 주기로 확인, DIGEST_TIMES에 전송)
         """
     )
 
@@ -140,22 +770,103 @@ def main():
         help="즉시 실행 (스케줄러 없이 한 번만 실행)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--replay",
+        metavar="RUN_ID",
+        help="보관된 실행의 원본 응답으로 네트워크 없이 다시 실행 (latest: 가장 최근 실행)"
+    )
 
-    if args.test:
-        print("테스트 모드로 실행합니다...")
-        run_scraping(test_mode=True)
+    parser.add_argument(
+        "--sources",
+        type=parse_sources,
+        metavar="KEYS",
+        help=f"실행할 소스 (쉼표로 구분, SCRAPERS_ENABLED 대신 사용): {','.join(SCRAPER_REGISTRY)}"
+    )
 
-    elif args.run:
-        print("즉시 실행 모드...")
-        run_scraping(test_mode=False)
+    parser.add_argument(
+        "--search",
+        metavar="QUERY",
+        help="지금까지 수집한 아티클을 제목/요약/작성자에서 검색 (ARTICLE_DB_FILE)"
+    )
 
-    else:
-        try:
-            run_scheduler()
-        except KeyboardInterrupt:
-            print("\n스케줄러 종료")
-            sys.exit(0)
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="--search 결과 수 (기본값: 20)"
+    )
+
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="WordPress 피드(플래텀, 벤처스퀘어 등)의 지난 페이지에서 --since 이후 아티클을 보관 DB에 채우기"
+    )
+
+    parser.add_argument(
+        "--since",
+        type=parse_date,
+        metavar="YYYY-MM-DD",
+        help="--backfill로 채울 시작 날짜"
+    )
+
+    parser.add_argument(
+        "--seed-cache",
+        action="store_true",
+        help="--backfill로 모은 아티클을 캐시에도 전송한 것으로 표시 (이후 실행에서 보내지 않음)"
+    )
+
+    parser.add_argument(
+        "--compact-cache",
+        action="store_true",
+        help="캐시 로그에서 지운 항목과 중복을 정리하고 종료"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SCRAPE_WORKERS,
+        help=f"동시에 실행할 스크래퍼 수 (1이면 순차 실행, 기본값: {SCRAPE_WORKERS})"
+    )
+
+    args = parser.parse_args()
+
+    if args.search is not None:
+        if not ARTICLE_DB_FILE:
+            parser.error("ARTICLE_DB_FILE이 설정되지 않았습니다.")
+        print_search(args.search, limit=args.limit, db_file=ARTICLE_DB_FILE)
+        return
+
+    if args.compact_cache:
+        compact_caches(sources=args.sources)
+        return
+
+    if args.backfill:
+        if args.since is None:
+            parser.error("--backfill에는 --since가 필요합니다.")
+        run_backfill(args.since, sources=args.sources, seed_cache=args.seed_cache)
+        return
+
+    try:
+        if args.replay:
+            run_scraping(workers=args.workers, replay=args.replay, sources=args.sources)
+
+        elif args.test:
+            print("테스트 모드로 실행합니다...")
+            run_scraping(test_mode=True, workers=args.workers, sources=args.sources)
+
+        elif args.run:
+            print("즉시 실행 모드...")
+            run_scraping(test_mode=False, workers=args.workers, sources=args.sources)
+
+        else:
+            # 데몬 모드에서는 브라우저를 실행 사이에도 재사용
+            try:
+                run_scheduler(workers=args.workers, sources=args.sources)
+            except KeyboardInterrupt:
+                print("\n스케줄러 종료")
+                sys.exit(0)
+    finally:
+        close_browser_pool()
 
 
 if __name__ == "__main__":
@@ -3,10 +3,8 @@ import os
 import requests
 from datetime import datetime
 
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-
 from scrapers.base import Article
+from utils.http import get_client
 from config import SLACK_WEBHOOK_URL
 
 
@@ -24,6 +22,9 @@ class SlackNotifier:
         self.channel = channel or SLACK_CHANNEL
 
         if self.bot_token:
+            # slack_sdk는 Bot Token을 쓸 때만 불러옴 (Webhook만 쓰면 시작 시간 절약)
+            from slack_sdk import WebClient
+
             self.client = WebClient(token=self.bot_token)
         else:
             self.client = None
@@ -62,6 +63,8 @@ class SlackNotifier:
 
     def _send_via_bot(self, blocks: list, text: str, article_count: int) -> bool:
         """Bot Token으로 메시지 전송"""
+        from slack_sdk.errors import SlackApiError
+
         try:
             response = self.client.chat_postMessage(
                 channel=self.channel,
@@ -80,7 +83,7 @@ class SlackNotifier:
     def _send_via_webhook(self, blocks: list, text: str, article_count: int) -> bool:
         """Webhook으로 메시지 전송"""
         try:
-            response = requests.post(
+            response = get_client().post(
                 self.webhook_url,
                 json={"blocks": blocks, "text": text},
                 timeout=10
@@ -141,6 +144,9 @@ class SlackNotifier:
                 if article.summary:
                     summary = article.summary[:80] + "..." if len(article.summary) > 80 else article.summary
                     article_text += f"\n   _{summary}_"
+                if article.duplicates:
+                    related = ", ".join(f"<{a.url}|{a.source}>" for a in article.duplicates[:3])
+                    article_text += f"\n   ↳ 같은 소식: {related}"
 
                 blocks.append({
                     "type": "section",
@@ -186,6 +192,8 @@ class SlackNotifier:
         text = f"⚠️ PM Scraper Bot 오류: {error_message}"
 
         if self.bot_token and self.channel:
+            from slack_sdk.errors import SlackApiError
+
             try:
                 self.client.chat_postMessage(
                     channel=self.channel,
@@ -198,7 +206,7 @@ class SlackNotifier:
 
         if self.webhook_url:
             try:
-                requests.post(self.webhook_url, json={"blocks": blocks, "text": text}, timeout=10)
+                get_client().post(self.webhook_url, json={"blocks": blocks, "text": text}, timeout=10)
                 return True
             except requests.RequestException:
                 return False
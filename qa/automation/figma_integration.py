@@ -10,6 +10,8 @@ import os
 import json
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -44,6 +46,7 @@ class FigmaIntegration:
     """Figma API 연동 클래스"""
 
     BASE_URL = "https://api.figma.com/v1"
+    TIMEOUT = 30  # 요청 타임아웃 (초)
 
     def __init__(self, access_token: str = None):
         self.access_token = access_token or os.getenv("FIGMA_ACCESS_TOKEN")
@@ -51,13 +54,17 @@ class FigmaIntegration:
             raise ValueError("FIGMA_ACCESS_TOKEN이 필요합니다.")
 
         self.headers = {"X-Figma-Token": self.access_token}
+        # 연결을 재사용하고, 연결 실패와 429/5xx는 백오프하며 재시도
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504))
+        self.session.mount("https://", HTTPAdapter(max_retries=retry))
         self.cache_dir = Path(__file__).parent.parent / "data" / "figma_cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def get_file(self, file_key: str) -> Dict:
         """Figma 파일 정보 조회"""
         url = f"{self.BASE_URL}/files/{file_key}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers, timeout=self.TIMEOUT)
         response.raise_for_status()
         return response.json()
 
@@ -65,7 +72,7 @@ class FigmaIntegration:
         """특정 노드 정보 조회"""
         url = f"{self.BASE_URL}/files/{file_key}/nodes"
         params = {"ids": node_id, "depth": depth}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params, timeout=self.TIMEOUT)
         response.raise_for_status()
         return response.json()
 
@@ -77,13 +84,13 @@ class FigmaIntegration:
             "scale": scale,
             "format": format
         }
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params, timeout=self.TIMEOUT)
         response.raise_for_status()
         return response.json()
 
     def download_image(self, image_url: str, save_path: Path) -> Path:
         """이미지 다운로드"""
-        response = requests.get(image_url)
+        response = self.session.get(image_url, timeout=self.TIMEOUT)
         response.raise_for_status()
         save_path.parent.mkdir(parents=True, exist_ok=True)
         save_path.write_bytes(response.content)
@@ -8,6 +8,8 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -58,8 +60,13 @@ class QAReport:
 class SlackReporter:
     """Slack 알림 리포터"""
 
+    TIMEOUT = 10  # 요청 타임아웃 (초)
+
     def __init__(self, webhook_url: str = None):
         self.webhook_url = webhook_url or os.getenv("SLACK_WEBHOOK_URL")
+        # POST는 중복 전송을 막기 위해 연결 실패만 재시도
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=1)))
 
     def send_report(self, report: QAReport) -> bool:
         """Slack으로 리포트 전송"""
@@ -167,10 +174,11 @@ class SlackReporter:
 
         # 전송
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 json=message,
-                headers={"Content-Type": "application/json"}
+                headers={"Content-Type": "application/json"},
+                timeout=self.TIMEOUT
             )
             return response.status_code == 200
         except Exception as e:
@@ -1,17 +1,57 @@
+"""스크래퍼 패키지
+
+스크래퍼 클래스는 처음 사용할 때 불러옵니다 (PEP 562 모듈 __getattr__).
+bs4, playwright처럼 일부 소스만 쓰는 의존성은 그 소스를 실행할 때만 불러옵니다.
+"""
+import importlib
+
 from .base import BaseScraper, Article
-from .yozm import YozmScraper
-from .brunch import BrunchScraper
-from .medium import MediumScraper
-from .geeknews import GeekNewsScraper
-from .disquiet import DisquietScraper
-from .outstanding import OutstandingScraper
-from .venturesquare import VentureSquareScraper
-from .platum import PlatumScraper
-from .byline import BylineScraper
+from .fetch import FeedFetcher
+from .health import SourceHealth
+from .runner import run_scrapers, ScrapeResult
+
+# SCRAPERS_ENABLED 키 → (모듈, 클래스 이름). 등록 순서대로 실행 결과를 모음
+SCRAPER_REGISTRY = {
+    "yozm": ("yozm", "YozmScraper"),
+    "brunch": ("brunch", "BrunchScraper"),
+    "medium": ("medium", "MediumScraper"),
+    "geeknews": ("geeknews", "GeekNewsScraper"),
+    "disquiet": ("disquiet", "DisquietScraper"),
+    "outstanding": ("outstanding", "OutstandingScraper"),
+    "venturesquare": ("venturesquare", "VentureSquareScraper"),
+    "platum": ("platum", "PlatumScraper"),
+    "byline": ("byline", "BylineScraper"),
+}
+
+_CLASS_MODULES = {class_name: module for module, class_name in SCRAPER_REGISTRY.values()}
+
+
+def get_scraper_class(key: str) -> type:
+    """소스 키(SCRAPERS_ENABLED 키)에 해당하는 스크래퍼 클래스 (모듈은 이때 불러옴)"""
+    module, class_name = SCRAPER_REGISTRY[key]
+    return getattr(importlib.import_module(f".{module}", __name__), class_name)
+
+
+def __getattr__(name: str):
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    scraper_class = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = scraper_class
+    return scraper_class
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_CLASS_MODULES))
+
 
 __all__ = [
     "BaseScraper",
     "Article",
+    "FeedFetcher",
+    "SourceHealth",
+    "SCRAPER_REGISTRY",
+    "get_scraper_class",
     "YozmScraper",
     "BrunchScraper",
     "MediumScraper",
@@ -21,4 +61,6 @@ __all__ = [
     "VentureSquareScraper",
     "PlatumScraper",
     "BylineScraper",
+    "run_scrapers",
+    "ScrapeResult",
 ]
@@ -0,0 +1,223 @@
+"""지난 아티클 채우기(backfill) 모듈
+
+WordPress 피드는 `?paged=N`으로 지난 페이지를 제공하므로, 첫 페이지부터 거슬러 올라가며
+since 이후에 발행된 아티클을 모읍니다 (`python main.py --backfill --since 2026-01-01`).
+
+- 페이지 요청은 스레드에서, 소스(호스트)마다 동시에 최대 BACKFILL_HOST_CONCURRENCY개
+- 피드 파싱, HTML 제거, 키워드 매칭은 프로세스 풀에서 (BACKFILL_PARSE_WORKERS, 0이면 CPU 수)
+- 가장 오래된 엔트리가 since보다 오래된 페이지나 빈 페이지(404)를 만나면 그 소스는 더 요청하지 않음
+- 키워드에 매칭된 아티클은 파싱이 끝나는 대로 모았다가 batch_size개씩 on_batch로 넘김
+"""
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Optional
+
+from .base import Article, BaseScraper, iter_feed_entries
+from utils.http import get_client
+from utils.keywords import get_matcher
+from utils.text import strip_html
+from config import (
+    FEED_TIMEOUT,
+    BACKFILL_HOST_CONCURRENCY,
+    BACKFILL_PARSE_WORKERS,
+    BACKFILL_MAX_PAGES,
+    BACKFILL_BATCH_SIZE,
+)
+
+
+@dataclass
+class PageResult:
+    """피드 페이지 하나의 파싱 결과"""
+
+    articles: list[Article]            # since 이후에 발행되고 키워드에 매칭된 아티클
+    entries: int                       # 페이지의 엔트리 수
+    oldest: Optional[datetime] = None  # 페이지에서 가장 오래된 발행 시각
+
+
+@dataclass
+class BackfillStats:
+    """소스별 채우기 결과"""
+
+    source: str
+    pages: int = 0
+    entries: int = 0
+    articles: int = 0
+    elapsed: float = 0.0
+    stopped: str = ""  # 멈춘 이유
+    failures: list[str] = field(default_factory=list)
+
+
+def parse_page(source: str, content: bytes, since: datetime, keywords: tuple) -> PageResult:
+    """피드 페이지를 Article 목록으로 변환 (프로세스 풀에서 실행)"""
+    matcher = get_matcher(keywords)
+    articles = []
+    entries = 0
+    oldest = None
+    for entry in iter_feed_entries([content]):
+        entries += 1
+        published = BaseScraper.entry_published(entry)
+        if published:
+            oldest = published if oldest is None else min(oldest, published)
+            if published < since:
+                continue
+
+        title = entry.get("title", "")
+        link = entry.get("link", "")
+        if not title or not link:
+            continue
+        summary = strip_html(entry.get("summary", ""), 200)
+        article = Article(
+            title=title,
+            url=link,
+            source=source,
+            summary=summary if summary else None,
+            author=entry.get("author") or None,
+            published_at=published,
+        )
+        article.keyword_hits = matcher.find(f"{title}\n{summary}" if summary else title)
+        if article.keyword_hits:
+            articles.append(article)
+    return PageResult(articles=articles, entries=entries, oldest=oldest)
+
+
+def fetch_page(url: str, headers: dict) -> Optional[bytes]:
+    """피드 페이지 본문 (마지막 페이지를 지나 404이면 None)"""
+    response = get_client().get(url, headers=headers, timeout=FEED_TIMEOUT)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.content
+
+
+def page_url(feed_url: str, page: int) -> str:
+    """WordPress 피드의 page번째 페이지 URL (1페이지는 피드 자체)"""
+    if page == 1:
+        return feed_url
+    separator = "&" if "?" in feed_url else "?"
+    return f"{feed_url}{separator}paged={page}"
+
+
+class _SourceState:
+    """채우기 중인 소스 하나의 진행 상태"""
+
+    def __init__(self, scraper: BaseScraper):
+        self.scraper = scraper
+        self.stats = BackfillStats(source=scraper.name)
+        self.next_page = 1
+        self.in_flight = 0  # 요청 또는 파싱 중인 페이지 수
+        self.done = False
+        self.started = time.monotonic()
+
+    def stop(self, reason: str) -> None:
+        if not self.done:
+            self.done = True
+            self.stats.stopped = reason
+
+
+def backfill(
+    scrapers: list[BaseScraper],
+    since: datetime,
+    on_batch: Callable[[list[Article]], None],
+    host_concurrency: int = BACKFILL_HOST_CONCURRENCY,
+    parse_workers: int = BACKFILL_PARSE_WORKERS,
+    max_pages: int = BACKFILL_MAX_PAGES,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+) -> list[BackfillStats]:
+    """paged_feed가 있는 스크래퍼의 지난 페이지를 동시에 받아 since 이후 아티클을 on_batch로 넘김
+
+    소스마다 요청 또는 파싱 중인 페이지는 host_concurrency개를 넘지 않으므로,
+    끝을 확인하기 전에 미리 요청하는 페이지도 그 수를 넘지 않습니다.
+    on_batch가 예외를 내면(DB 잠김 등) 그 묶음은 소스별 실패로 기록하고 나머지 페이지는 계속 받습니다.
+    """
+    states = [_SourceState(scraper) for scraper in scrapers if scraper.paged_feed]
+    if not states:
+        return []
+
+    keywords = tuple(scrapers[0].keywords)
+    fetch_pool = ThreadPoolExecutor(max_workers=host_concurrency * len(states), thread_name_prefix="backfill")
+    # 요청 스레드가 도는 중에 fork하지 않도록 spawn으로 작업 프로세스 생성
+    parse_pool = ProcessPoolExecutor(
+        max_workers=parse_workers or None,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    pending: dict[Future, tuple[str, _SourceState, int]] = {}
+    batch: list[Article] = []
+
+    def flush(articles: list[Article]) -> None:
+        """on_batch 호출 (저장 실패는 그 묶음만 소스별 실패로 기록하고, 진행 중인 요청/파싱은 계속)"""
+        try:
+            on_batch(articles)
+        except Exception as e:
+            print(f"아티클 {len(articles)}개 저장 실패: {e}")
+            for state in states:
+                count = sum(1 for article in articles if article.source == state.scraper.name)
+                if count:
+                    state.stats.articles -= count
+                    state.stats.failures.append(f"{count}개 저장 실패: {e}")
+
+    def submit_fetches(state: _SourceState) -> None:
+        while not state.done and state.in_flight < host_concurrency:
+            if state.next_page > max_pages:
+                state.stop(f"최대 {max_pages}페이지")
+                return
+            page = state.next_page
+            state.next_page += 1
+            state.in_flight += 1
+            url = page_url(state.scraper.paged_feed, page)
+            pending[fetch_pool.submit(fetch_page, url, state.scraper.headers)] = ("fetch", state, page)
+
+    try:
+        for state in states:
+            submit_fetches(state)
+
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                kind, state, page = pending.pop(future)
+                if kind == "fetch":
+                    try:
+                        content = future.result()
+                    except Exception as e:
+                        state.stats.failures.append(f"{page}페이지: {e}")
+                        state.stop("요청 실패")
+                        content = None
+                    if content is None:
+                        state.in_flight -= 1
+                        state.stop("마지막 페이지")
+                    else:
+                        parse_future = parse_pool.submit(parse_page, state.scraper.name, content, since, keywords)
+                        pending[parse_future] = ("parse", state, page)
+                else:
+                    state.in_flight -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        state.stats.failures.append(f"{page}페이지 파싱 실패: {e}")
+                        state.stop("파싱 실패")
+                        continue
+                    state.stats.pages += 1
+                    state.stats.entries += result.entries
+                    state.stats.articles += len(result.articles)
+                    if not result.entries:
+                        state.stop("마지막 페이지")
+                    elif result.oldest and result.oldest < since:
+                        state.stop("since 도달")
+
+                    batch.extend(result.articles)
+                    if len(batch) >= batch_size:
+                        flush(batch)
+                        batch = []
+
+                state.stats.elapsed = time.monotonic() - state.started
+                submit_fetches(state)
+
+        if batch:
+            flush(batch)
+    finally:
+        fetch_pool.shutdown(wait=False, cancel_futures=True)
+        parse_pool.shutdown(wait=True, cancel_futures=True)
+
+    return [state.stats for state in states]
@@ -1,10 +1,21 @@
 """베이스 스크래퍼 클래스"""
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass, field
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Iterator, Optional
 
-from config import KEYWORDS
+from .fetch import FeedFetcher
+from utils.archive import ArchiveMiss, get_archive
+from utils.http import get_client
+from utils.keywords import get_matcher
+from utils.metrics import get_metrics
+from utils.text import strip_html
+from utils.url import canonicalize_url
+from config import KEYWORDS, FEED_TIMEOUT, FEED_PARSER, HOURS_LIMIT, BROWSER_TIMEOUT
 
 
 @dataclass
@@ -17,29 +28,409 @@ class Article:
     summary: Optional[str] = None
     author: Optional[str] = None
     published_at: Optional[datetime] = None
+    keyword_hits: dict[str, int] = field(default_factory=dict)
+    canonical_url: str = field(init=False, default="")  # 중복 확인/캐시 키
+    duplicates: list["Article"] = field(default_factory=list, repr=False)  # 같은 소식으로 묶인 다른 아티클
+
+    def __post_init__(self):
+        self.canonical_url = canonicalize_url(self.url)
 
     def to_dict(self) -> dict:
         return {
             "title": self.title,
             "url": self.url,
+            "canonical_url": self.canonical_url,
             "source": self.source,
             "summary": self.summary,
             "author": self.author,
             "published_at": self.published_at.isoformat() if self.published_at else None,
+            "keyword_hits": self.keyword_hits,
+            "duplicates": [{"source": a.source, "url": a.url} for a in self.duplicates],
         }
 
 
+def _local_name(tag: str) -> str:
+    """'{namespace}name' 형식 태그에서 이름만 반환"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_feed_date(text: Optional[str]):
+    """RSS(RFC 822)/Atom(ISO 8601) 날짜를 UTC struct_time으로 변환"""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.utctimetuple()
+
+
+def _element_to_entry(element: ET.Element) -> dict:
+    """RSS <item> / Atom <entry> 요소를 feedparser 엔트리와 같은 키의 dict로 변환"""
+    fields: dict[str, str] = {}
+    link = None
+    for child in element:
+        name = _local_name(child.tag)
+        if name == "link" and child.get("href") is not None:
+            # Atom: rel="alternate"(또는 rel 없음) 링크 우선
+            if link is None or child.get("rel", "alternate") == "alternate":
+                link = child.get("href")
+            continue
+        if name == "author" and len(child):
+            text = next((c.text for c in child if _local_name(c.tag) == "name"), None)
+        else:
+            text = "".join(child.itertext())
+        if text and name not in fields:
+            fields[name] = text.strip()
+
+    return {
+        "title": fields.get("title", ""),
+        "link": link or fields.get("link", ""),
+        "summary": fields.get("description") or fields.get("summary") or fields.get("encoded") or fields.get("content", ""),
+        "id": fields.get("guid") or fields.get("id"),
+        "author": fields.get("creator") or fields.get("author"),
+        "published_parsed": _parse_feed_date(fields.get("pubDate") or fields.get("published")),
+    }
+
+
+def iter_feed_entries(
+    chunks: Iterable[bytes],
+    limit: Optional[int] = None,
+    on_complete: Optional[Callable[[], None]] = None,
+) -> Iterator[dict]:
+    """RSS/Atom 문서를 조각 단위로 읽으며 엔트리를 하나씩 반환
+
+    limit개를 반환하거나 호출한 쪽이 중간에 멈추면 문서의 나머지는 읽지 않습니다.
+    처리한 엔트리 요소는 바로 비워서 전체 트리를 메모리에 들고 있지 않습니다.
+    XML로 파싱할 수 없는 문서(정의되지 않은 HTML 엔티티 등)는
+    남은 본문까지 받아 feedparser로 다시 파싱합니다.
+    on_complete는 본문을 받거나 파싱하다 예외가 나지 않고 끝났을 때(문서 끝, limit, 호출한 쪽이 멈춤)만 호출합니다.
+    """
+    failed = False
+    try:
+        yield from _parse_feed_entries(chunks, limit)
+    except Exception:
+        failed = True
+        raise
+    finally:
+        if on_complete is not None and not failed:
+            on_complete()
+
+
+def _parse_feed_entries(chunks: Iterable[bytes], limit: Optional[int]) -> Iterator[dict]:
+    if limit is not None and limit <= 0:
+        return
+
+    parser = ET.XMLPullParser(events=("end",))
+    received: list[bytes] = []
+    count = 0
+
+    try:
+        for chunk in chunks:
+            received.append(chunk)
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                if _local_name(element.tag) not in ("item", "entry"):
+                    continue
+                entry = _element_to_entry(element)
+                element.clear()
+                yield entry
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+        parser.close()
+        for _, element in parser.read_events():
+            if _local_name(element.tag) in ("item", "entry"):
+                yield _element_to_entry(element)
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    except ET.ParseError:
+        import feedparser
+
+        received.extend(chunks)
+        entries = feedparser.parse(b"".join(received)).entries
+        end = None if limit is None else limit
+        yield from entries[count:end]
+
+
 class BaseScraper(ABC):
     """스크래퍼 베이스 클래스"""
 
     name: str = "base"
     base_url: str = ""
+    paged_feed: Optional[str] = None  # ?paged=N으로 지난 페이지를 주는 WordPress 피드 (--backfill용)
 
-    def __init__(self, keywords: list[str] = None):
+    def __init__(self, keywords: list[str] = None, fetcher: FeedFetcher = None):
         self.keywords = keywords or KEYWORDS
+        self.matcher = get_matcher(self.keywords)
+        self.fetcher = fetcher or FeedFetcher()
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
+        self.deadline: Optional[float] = None
+        self._cancelled = threading.Event()
+        self.published_seen: list[datetime] = []  # 이번 실행에서 확인한 새 엔트리의 발행 시각
+        self.failures: list[str] = []             # 이번 실행에서 실패한 요청
+        self.successes = 0                         # 이번 실행에서 성공한 요청 (304 포함)
+        self.reference_time: Optional[datetime] = None  # HOURS_LIMIT 기준 시각 (재실행에서는 원래 실행 시각)
+        # 피드별로 끝까지 확인한 새 엔트리 (최신순 (엔트리 ID, 발행 시각, 정규화 링크)), commit_cursors에서 커서 이동에 사용
+        self.walks: dict[str, list[tuple[str, Optional[datetime], str]]] = {}
+
+    def start(self, timeout: Optional[float] = None) -> None:
+        """실행 제한 시간 설정 (time.monotonic 기준)"""
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self._cancelled.clear()
+        self.published_seen = []
+        self.failures = []
+        self.successes = 0
+
+    def record_failure(self, message: str) -> None:
+        """요청 실패 기록 (소스 상태 판단 및 실행 요약에 사용)"""
+        print(f"[{self.name}] {message}")
+        self.failures.append(message)
+
+    def cancel(self) -> None:
+        """실행 중인 스크래핑 중단 요청"""
+        self._cancelled.set()
+
+    def time_left(self) -> Optional[float]:
+        """남은 실행 시간 (제한 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def request_timeout(self, default: float) -> float:
+        """네트워크 요청 타임아웃 (남은 실행 시간을 넘지 않도록 제한)"""
+        left = self.time_left()
+        return default if left is None else max(0.1, min(default, left))
+
+    def should_stop(self) -> bool:
+        """중단 요청을 받았거나 제한 시간이 지났는지 확인
+
+        스크래퍼는 엔트리/피드 단위 루프마다 확인하고,
+        True이면 그때까지 수집한 아티클만 반환합니다.
+        """
+        if self._cancelled.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def fetch_feed(self, url: str) -> list:
+        """RSS 피드 엔트리 목록 반환 (304 Not Modified이면 빈 목록)"""
+        metrics = get_metrics()
+        with metrics.timer(self.name, "fetch"):
+            response = self.fetcher.fetch(
+                url,
+                source=self.name,
+                headers=self.headers,
+                timeout=self.request_timeout(FEED_TIMEOUT),
+            )
+        self.successes += 1
+        if response.not_modified:
+            return []
+        import feedparser  # 불러오는 데 수십 ms가 걸리므로 처음 파싱할 때 불러옴
+
+        started = time.perf_counter()
+        entries = feedparser.parse(response.content).entries
+        metrics.add_time(self.name, "parse", time.perf_counter() - started, calls=0)  # 피드 수는 iter_feed_articles에서 셈
+        return entries
+
+    def iter_feed(self, url: str, limit: Optional[int] = None) -> Iterator:
+        """피드 엔트리를 최대 limit개까지 반환 (304 Not Modified이면 없음)
+
+        FEED_PARSER가 "stream"이면 본문을 받는 대로 파싱하고 필요한 만큼만 읽으며,
+        그 외에는 feedparser로 문서 전체를 파싱합니다.
+        """
+        if FEED_PARSER != "stream":
+            return iter(self.fetch_feed(url)[:limit])
+
+        with get_metrics().timer(self.name, "fetch"):
+            response = self.fetcher.fetch(
+                url,
+                source=self.name,
+                headers=self.headers,
+                timeout=self.request_timeout(FEED_TIMEOUT),
+                stream=True,
+            )
+        self.successes += 1
+        if response.not_modified:
+            return iter(())
+
+        def complete() -> None:
+            # 제한 시간 초과로 중간에 멈췄으면 남은 엔트리를 다음 실행에서 받도록 새 검증자를 반영하지 않음
+            if not self.should_stop():
+                response.complete()
+
+        return iter_feed_entries(response.iter_content(), limit, on_complete=complete)
+
+    def iter_feed_articles(self, url: str, limit: Optional[int] = None) -> Iterator[Article]:
+        """피드의 새 엔트리를 Article로 변환해 하나씩 반환
+
+        커서/HOURS_LIMIT에 닿거나 호출한 쪽이 멈추면 피드 읽기도 멈춥니다.
+        스트리밍 파싱에서는 엔트리를 읽는 동안 받은 본문 시간도 parse 단계에 포함됩니다.
+        """
+        entries = self.iter_feed(url, limit)
+        new_entries = self.iter_new_entries(url, entries)
+        parse_time = strip_time = 0.0
+        seen = 0
+        try:
+            while True:
+                started = time.perf_counter()
+                entry = next(new_entries, None)
+                parse_time += time.perf_counter() - started
+                if entry is None:
+                    break
+                seen += 1
+                try:
+                    title = entry.get("title", "")
+                    link = entry.get("link", "")
+                    started = time.perf_counter()
+                    summary = self.strip_html(entry.get("summary", ""))
+                    strip_time += time.perf_counter() - started
+
+                    if title and link:
+                        yield Article(
+                            title=title,
+                            url=link,
+                            source=self.name,
+                            summary=summary if summary else None,
+                            author=entry.get("author") or None,
+                            published_at=self.entry_published(entry),
+                        )
+                except Exception:
+                    continue
+        finally:
+            new_entries.close()
+            close = getattr(entries, "close", None)
+            if close:
+                close()
+            metrics = get_metrics()
+            metrics.add_time(self.name, "parse", parse_time)
+            metrics.add_time(self.name, "strip", strip_time, calls=seen)
+            metrics.count(self.name, "entries_seen", seen)
+
+    def browser_available(self) -> bool:
+        """render_page를 쓸 수 있는지 (playwright 설치 또는 보관된 응답으로 재실행 중)"""
+        from .browser import PLAYWRIGHT_AVAILABLE
+
+        archive = get_archive()
+        return PLAYWRIGHT_AVAILABLE or (archive is not None and archive.replaying)
+
+    def render_page(self, url: str, wait_for: str) -> str:
+        """헤드리스 브라우저로 렌더링한 페이지 HTML 반환 (wait_for 셀렉터가 나타날 때까지 대기)
+
+        브라우저를 띄울 수 없거나 제한 시간 안에 목록이 나타나지 않으면 BrowserError를 냅니다.
+        """
+        from .browser import BrowserError, get_browser_pool
+
+        archive = get_archive()
+        if archive is not None and archive.replaying:
+            try:
+                _, content = archive.lookup(url)
+            except ArchiveMiss as e:
+                raise BrowserError(str(e)) from e
+            self.successes += 1
+            return content.decode("utf-8")
+
+        with get_metrics().timer(self.name, "fetch"):
+            html = get_browser_pool().render(url, wait_for, timeout=self.request_timeout(BROWSER_TIMEOUT))
+        self.successes += 1
+        if archive is not None:
+            archive.record("page", self.name, url, 200, html.encode("utf-8"))
+        return html
+
+    def get_page(self, url: str, timeout: float) -> tuple[int, str]:
+        """일반 HTTP로 페이지를 받아 (상태 코드, 본문) 반환 (재실행 중이면 보관된 응답)"""
+        archive = get_archive()
+        if archive is not None and archive.replaying:
+            status, content = archive.lookup(url)
+            return status, content.decode("utf-8")
+
+        with get_metrics().timer(self.name, "fetch"):
+            response = get_client().get(url, headers=self.headers, timeout=self.request_timeout(timeout))
+        if archive is not None:
+            archive.record("page", self.name, url, response.status_code, response.content)
+        return response.status_code, response.text
+
+    @staticmethod
+    def entry_published(entry) -> Optional[datetime]:
+        """피드 엔트리의 발행 시각 (UTC)"""
+        parsed = entry.get("published_parsed")
+        if parsed:
+            return datetime(*parsed[:6], tzinfo=timezone.utc)
+        return None
+
+    def iter_new_entries(self, url: str, entries: Iterable) -> Iterator:
+        """커서 이후의 새 엔트리만 순서대로 반환
+
+        피드는 최신순이라고 보고, 다음 중 하나를 만나면 멈춥니다.
+        - 지난 실행에서 마지막으로 확인한 엔트리 (커서)
+        - 커서보다 먼저 발행된 엔트리
+        - HOURS_LIMIT보다 오래된 엔트리
+
+        커서는 여기서 옮기지 않고, 주어진 엔트리를 끝까지 확인한 경우에만 확인한 엔트리를
+        walks에 기록합니다. 전송 결과가 나온 뒤 commit_cursors가 결과가 확정된 엔트리까지만
+        커서를 옮기므로, 제한 시간 초과로 중단되거나 한도 초과 등으로 보내지 못한 엔트리는 다음 실행에서 다시 확인합니다.
+        """
+        cursor = self.fetcher.get_cursor(url) or {}
+        cursor_id = cursor.get("id")
+        cursor_published = datetime.fromisoformat(cursor["published"]) if cursor.get("published") else None
+        cutoff = (self.reference_time or datetime.now(timezone.utc)) - timedelta(hours=HOURS_LIMIT)
+
+        walked = []
+        for entry in entries:
+            if self.should_stop():
+                return
+
+            entry_id = entry.get("id") or entry.get("link")
+            published = self.entry_published(entry)
+
+            if cursor_id and entry_id == cursor_id:
+                break
+            if published and cursor_published and published < cursor_published:
+                break
+            if published and published < cutoff:
+                break
+
+            walked.append((entry_id, published, canonicalize_url(entry.get("link") or "")))
+            if published:
+                self.published_seen.append(published)
+            yield entry
+
+        if walked:  # 304 등으로 확인한 엔트리가 없으면 이전 확인 결과를 유지 (데몬은 전송 시각에 한 번에 반영)
+            self.walks[url] = walked
+
+    def commit_cursors(self, unsent: set[str]) -> None:
+        """확인한 엔트리 중 결과가 확정된 것(전송했거나 키워드로 걸러짐)까지만 피드 커서를 옮김
+
+        unsent는 키워드에 매칭되었지만 아직 보내지 못한 아티클의 정규화 URL입니다 (한도 초과,
+        전송 실패 등). 가장 오래된 미전송 엔트리보다 새 엔트리로는 커서를 옮기지 않아
+        다음 실행에서 다시 확인하며, 이미 보낸 엔트리는 캐시가 걸러 냅니다.
+        """
+        for url, walked in self.walks.items():
+            cursor = None
+            for entry_id, published, link in reversed(walked):
+                if link in unsent:
+                    break
+                if entry_id:
+                    cursor = (entry_id, published)
+            if cursor:
+                self.fetcher.set_cursor(url, *cursor)
+            if any(link in unsent for _, _, link in walked):
+                # 피드가 바뀌지 않아도 다음 실행에서 남은 엔트리를 다시 확인하도록 304를 받지 않음
+                self.fetcher.forget_validators(url)
+        self.walks = {}
+
+    @staticmethod
+    def strip_html(html: Optional[str], max_length: int = 200) -> str:
+        """HTML 요약문에서 텍스트만 추출 (max_length 글자까지)"""
+        return strip_html(html, max_length)
 
     @abstractmethod
     def scrape(self) -> list[Article]:
@@ -48,19 +439,25 @@ class BaseScraper(ABC):
 
     def matches_keywords(self, text: str) -> bool:
         """텍스트가 키워드와 매칭되는지 확인"""
-        if not text:
-            return False
-        text_lower = text.lower()
-        for keyword in self.keywords:
-            if keyword.lower() in text_lower:
-                return True
-        return False
+        return self.matcher.matches(text)
+
+    def keyword_hits(self, article: Article) -> dict[str, int]:
+        """제목과 요약에서 키워드별 등장 횟수 계산 (한 번에 스캔)"""
+        text = article.title or ""
+        if article.summary:
+            text = f"{text}\n{article.summary}"
+        return self.matcher.find(text)
 
     def filter_by_keywords(self, articles: list[Article]) -> list[Article]:
-        """키워드에 매칭되는 아티클만 필터링"""
+        """키워드에 매칭되는 아티클만 필터링 (매칭 결과는 article.keyword_hits에 기록)"""
+        metrics = get_metrics()
         filtered = []
-        for article in articles:
-            # 제목 또는 요약에서 키워드 매칭
-            if self.matches_keywords(article.title) or self.matches_keywords(article.summary):
-                filtered.append(article)
+        with metrics.timer(self.name, "keyword_filter"):
+            for article in articles:
+                # 제목 또는 요약에서 키워드 매칭
+                article.keyword_hits = self.keyword_hits(article)
+                if article.keyword_hits:
+                    filtered.append(article)
+        metrics.count(self.name, "keyword_checked", len(articles))
+        metrics.count(self.name, "keyword_kept", len(filtered))
         return filtered
@@ -0,0 +1,232 @@
+"""헤드리스 브라우저 풀 - 클라이언트 사이드 렌더링(CSR) 사이트용
+
+Chromium 하나를 프로세스 동안 띄워 두고, 미리 만든 브라우저 컨텍스트 몇 개를
+스크래퍼끼리 돌려 씁니다. 그래서 실행할 때마다 브라우저를 새로 띄우지 않습니다.
+- 이미지/폰트/미디어와 분석·광고 스크립트 요청은 차단
+- 페이지 전체 로드를 기다리지 않고 목록 셀렉터가 나타나면 바로 HTML 반환
+
+Playwright의 동기 API는 만든 스레드에서만 쓸 수 있으므로, 브라우저는 전용
+스레드의 이벤트 루프에서 실행하고 스크래퍼 스레드는 작업을 넘겨 결과를 기다립니다.
+playwright가 설치되지 않은 환경에서는 PLAYWRIGHT_AVAILABLE이 False입니다.
+"""
+import asyncio
+import atexit
+import importlib.util
+import threading
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Optional
+from urllib.parse import urlsplit
+
+from config import BROWSER_CONTEXTS, BROWSER_TIMEOUT
+
+# playwright는 불러오는 데만 수십 ms가 걸리므로 설치 여부만 확인하고, 실제 import는 브라우저를 띄울 때 함
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+
+# 목록 렌더링에 필요 없는 리소스 종류
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# 분석/광고/모니터링 요청 호스트 (하위 도메인 포함)
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "connect.facebook.com",
+    "analytics.tiktok.com",
+    "hotjar.com",
+    "amplitude.com",
+    "mixpanel.com",
+    "segment.io",
+    "segment.com",
+    "sentry.io",
+    "clarity.ms",
+    "channel.io",
+    "braze.com",
+    "kakao.com/analytics",
+    "daumcdn.net/tiara",
+)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+class BrowserError(Exception):
+    """브라우저를 띄우지 못했거나 페이지를 렌더링하지 못함"""
+
+
+class BrowserLaunchError(BrowserError):
+    """브라우저 실행 실패 (playwright 미설치, 브라우저 바이너리 없음 등)"""
+
+
+def _is_blocked(url: str, resource_type: str) -> bool:
+    """차단할 요청인지 확인"""
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    parts = urlsplit(url)
+    target = parts.netloc + parts.path
+    return any(host in target for host in BLOCKED_HOSTS)
+
+
+class BrowserPool:
+    """Chromium 하나와 컨텍스트 풀을 공유하는 렌더러"""
+
+    def __init__(self, contexts: int = BROWSER_CONTEXTS, timeout: float = BROWSER_TIMEOUT):
+        if not PLAYWRIGHT_AVAILABLE:
+            raise BrowserLaunchError("playwright가 설치되지 않았습니다. `pip install playwright && playwright install chromium` 실행")
+
+        self.size = max(1, contexts)
+        self.timeout = timeout
+        self.renders = 0
+        self.blocked_requests = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._playwright = None
+        self._browser = None
+        self._contexts: Optional[asyncio.Queue] = None
+        self._start_lock = threading.Lock()
+        self._launch_error: Optional[str] = None
+
+    @property
+    def started(self) -> bool:
+        return self._browser is not None
+
+    def start(self) -> None:
+        """브라우저 실행 (이미 실행 중이면 그대로 사용)"""
+        with self._start_lock:
+            if self.started:
+                return
+            if self._launch_error:
+                # 실행에 실패한 브라우저는 같은 프로세스에서 다시 띄우지 않음
+                raise BrowserLaunchError(self._launch_error)
+
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="browser", daemon=True)
+            self._thread.start()
+
+            future = asyncio.run_coroutine_threadsafe(self._launch(), self._loop)
+            try:
+                future.result(timeout=self.timeout * 2)
+            except Exception as e:
+                self._stop_loop()
+                self._launch_error = f"브라우저 실행 실패: {str(e).splitlines()[0] if str(e) else type(e).__name__}"
+                raise BrowserLaunchError(self._launch_error) from e
+
+    async def _launch(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        try:
+            browser = await self._playwright.chromium.launch(headless=True)
+            contexts: asyncio.Queue = asyncio.Queue()
+            for _ in range(self.size):
+                context = await browser.new_context(user_agent=USER_AGENT, locale="ko-KR")
+                await context.route("**/*", self._route)
+                contexts.put_nowait(context)
+        except Exception:
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+        self._browser = browser
+        self._contexts = contexts
+
+    async def _route(self, route) -> None:
+        request = route.request
+        if _is_blocked(request.url, request.resource_type):
+            self.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def render(self, url: str, wait_for: str, timeout: Optional[float] = None) -> str:
+        """페이지를 열고 wait_for 셀렉터가 나타나면 그 시점의 HTML 반환"""
+        self.start()
+        timeout = timeout or self.timeout
+        future = asyncio.run_coroutine_threadsafe(self._render(url, wait_for, timeout), self._loop)
+        try:
+            # 빈 컨텍스트를 기다리는 시간까지 고려해 여유를 둠
+            return future.result(timeout=timeout * 2)
+        except FuturesTimeoutError as e:
+            future.cancel()
+            raise BrowserError(f"렌더링 시간 초과: {url}") from e
+        except BrowserError:
+            raise
+        except Exception as e:
+            raise BrowserError(f"렌더링 실패: {url} ({e})") from e
+
+    async def _render(self, url: str, wait_for: str, timeout: float) -> str:
+        context = await self._contexts.get()
+        page = None
+        try:
+            page = await context.new_page()
+            timeout_ms = timeout * 1000
+            # load 이벤트를 기다리지 않고, 목록이 그려지는 시점까지만 대기
+            await page.goto(url, wait_until="commit", timeout=timeout_ms)
+            await page.wait_for_selector(wait_for, state="attached", timeout=timeout_ms)
+            self.renders += 1
+            return await page.content()
+        finally:
+            if page is not None:
+                await page.close()
+            self._contexts.put_nowait(context)
+
+    def close(self) -> None:
+        """브라우저 종료"""
+        with self._start_lock:
+            if not self.started:
+                return
+            future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+            try:
+                future.result(timeout=10)
+            except Exception:
+                pass
+            self._stop_loop()
+
+    async def _shutdown(self) -> None:
+        browser, self._browser = self._browser, None
+        try:
+            await browser.close()
+        finally:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def _stop_loop(self) -> None:
+        self._browser = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def summary_line(self) -> str:
+        return f"브라우저 렌더링 {self.renders}회, 차단한 요청 {self.blocked_requests}건"
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 공용 브라우저 풀 반환 (처음 렌더링할 때 브라우저 실행)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.close)
+        return _pool
+
+
+def active_browser_pool() -> Optional[BrowserPool]:
+    """실행 중인 공용 브라우저 풀 (아직 렌더링한 적이 없으면 None)"""
+    with _pool_lock:
+        return _pool if _pool is not None and _pool.started else None
+
+
+def close_browser_pool() -> None:
+    """공용 브라우저 풀을 사용했다면 종료"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -1,21 +1,92 @@
-"""브런치 스크래퍼 - 현재 비활성화됨
+"""브런치 스크래퍼
 
-브런치는 클라이언트 사이드 렌더링을 사용하여
-일반적인 HTTP 요청으로는 콘텐츠를 가져올 수 없습니다.
-Selenium/Playwright 등의 헤드리스 브라우저가 필요합니다.
+브런치는 클라이언트 사이드 렌더링을 사용하여 일반적인 HTTP 요청으로는
+콘텐츠를 가져올 수 없으므로, 공용 헤드리스 브라우저 풀로 검색 결과를 렌더링합니다.
+playwright가 설치되지 않은 환경에서는 건너뜁니다.
 """
+import re
+from urllib.parse import quote
+
+from bs4 import BeautifulSoup
+
 from .base import BaseScraper, Article
+from .browser import BrowserError, BrowserLaunchError
+
+# 글 주소: /@작가아이디/글번호
+ARTICLE_PATH = re.compile(r"^(?:https?://brunch\.co\.kr)?(/@[^/?#]+/\d+)/?$")
 
 
 class BrunchScraper(BaseScraper):
-    """브런치 (brunch.co.kr) 스크래퍼 - 현재 비활성화"""
+    """브런치 (brunch.co.kr) 스크래퍼 - 헤드리스 브라우저 사용"""
 
     name = "브런치"
     base_url = "https://brunch.co.kr"
 
+    # 검색어별로 결과 페이지를 렌더링
+    search_queries = ["PM", "프로덕트 매니저", "서비스 기획"]
+
+    # 검색 결과 목록 (이 셀렉터가 나타나면 렌더링 완료로 판단)
+    list_selector = "ul.list_article li"
+
     def scrape(self) -> list[Article]:
-        """브런치 스크래핑 - CSR로 인해 현재 비활성화"""
-        # 브런치는 클라이언트 사이드 렌더링(CSR)을 사용하여
-        # 일반 HTTP 요청으로는 콘텐츠를 가져올 수 없음
-        # 추후 Selenium/Playwright 통합 시 구현 예정
-        return []
+        """브런치 검색 결과에서 아티클 스크래핑"""
+        if not self.browser_available():
+            print(f"[{self.name}] playwright가 설치되지 않아 건너뜁니다.")
+            return []
+
+        articles = []
+        seen_urls = set()
+
+        for query in self.search_queries:
+            if self.should_stop():
+                break
+
+            search_url = f"{self.base_url}/search?q={quote(query)}&type=article"
+            try:
+                html = self.render_page(search_url, self.list_selector)
+            except BrowserLaunchError as e:
+                self.record_failure(str(e))
+                break
+            except BrowserError as e:
+                self.record_failure(f"렌더링 실패 ({query}): {e}")
+                continue
+
+            for article in self.parse_list(html):
+                if article.canonical_url not in seen_urls:
+                    seen_urls.add(article.canonical_url)
+                    articles.append(article)
+
+        # 키워드 필터링
+        return self.filter_by_keywords(articles)
+
+    def parse_list(self, html: str) -> list[Article]:
+        """렌더링된 검색 결과에서 아티클 목록 추출 (최대 20개)"""
+        soup = BeautifulSoup(html, "html.parser")
+        articles = []
+
+        for item in soup.select(self.list_selector)[:20]:
+            try:
+                link = next(
+                    (a for a in item.select("a[href]") if ARTICLE_PATH.match(a["href"])),
+                    None,
+                )
+                if link is None:
+                    continue
+
+                title_elem = item.select_one(".tit_subject, strong, h3")
+                title = title_elem.get_text(strip=True) if title_elem else link.get_text(strip=True)
+                summary_elem = item.select_one(".article_content, .wrap_sub_content")
+                author_elem = item.select_one(".name_txt, .txt_by")
+
+                if title:
+                    articles.append(Article(
+                        title=title,
+                        url=f"{self.base_url}{ARTICLE_PATH.match(link['href']).group(1)}",
+                        source=self.name,
+                        summary=summary_elem.get_text(strip=True)[:200] if summary_elem else None,
+                        author=author_elem.get_text(strip=True) if author_elem else None,
+                    ))
+            except Exception:
+                continue
+
+        return articles
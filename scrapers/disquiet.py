@@ -1,21 +1,76 @@
-"""디스콰이엇 스크래퍼 - 현재 비활성화됨
+"""디스콰이엇 스크래퍼
 
-디스콰이엇은 클라이언트 사이드 렌더링을 사용하여
-일반적인 HTTP 요청으로는 콘텐츠를 가져올 수 없습니다.
-Selenium/Playwright 등의 헤드리스 브라우저가 필요합니다.
+디스콰이엇은 클라이언트 사이드 렌더링을 사용하여 일반적인 HTTP 요청으로는
+콘텐츠를 가져올 수 없으므로, 공용 헤드리스 브라우저 풀로 메이커로그 목록을 렌더링합니다.
+playwright가 설치되지 않은 환경에서는 건너뜁니다.
 """
+import re
+
+from bs4 import BeautifulSoup
+
 from .base import BaseScraper, Article
+from .browser import BrowserError
+
+# 메이커로그 주소: /@작성자/makerlog/슬러그
+MAKERLOG_PATH = re.compile(r"^(?:https?://disquiet\.io)?(/@[^/?#]+/makerlog/[^/?#]+)/?$")
 
 
 class DisquietScraper(BaseScraper):
-    """디스콰이엇 (disquiet.io) 스크래퍼 - 현재 비활성화"""
+    """디스콰이엇 (disquiet.io) 스크래퍼 - 헤드리스 브라우저 사용"""
 
     name = "디스콰이엇"
     base_url = "https://disquiet.io"
 
+    # 메이커로그 링크 (이 셀렉터가 나타나면 렌더링 완료로 판단)
+    list_selector = "a[href*='/makerlog/']"
+
     def scrape(self) -> list[Article]:
-        """디스콰이엇 스크래핑 - CSR로 인해 현재 비활성화"""
-        # 디스콰이엇은 클라이언트 사이드 렌더링(CSR)을 사용하여
-        # 일반 HTTP 요청으로는 콘텐츠를 가져올 수 없음
-        # 추후 Selenium/Playwright 통합 시 구현 예정
-        return []
+        """디스콰이엇 메이커로그 목록에서 아티클 스크래핑"""
+        if not self.browser_available():
+            print(f"[{self.name}] playwright가 설치되지 않아 건너뜁니다.")
+            return []
+
+        try:
+            html = self.render_page(self.base_url, self.list_selector)
+        except BrowserError as e:
+            self.record_failure(f"렌더링 실패: {e}")
+            return []
+
+        # 키워드 필터링
+        return self.filter_by_keywords(self.parse_list(html))
+
+    def parse_list(self, html: str) -> list[Article]:
+        """렌더링된 페이지에서 메이커로그 목록 추출 (최대 30개)"""
+        soup = BeautifulSoup(html, "html.parser")
+        articles = []
+        seen_urls = set()
+
+        for link in soup.select(self.list_selector):
+            try:
+                match = MAKERLOG_PATH.match(link.get("href", ""))
+                if not match:
+                    continue
+
+                article_url = f"{self.base_url}{match.group(1)}"
+                if article_url in seen_urls:
+                    continue
+
+                title_elem = link.select_one("h1, h2, h3, h4, strong")
+                title = title_elem.get_text(strip=True) if title_elem else link.get_text(strip=True)
+                summary_elem = link.select_one("p")
+
+                if title:
+                    seen_urls.add(article_url)
+                    articles.append(Article(
+                        title=title[:200],
+                        url=article_url,
+                        source=self.name,
+                        summary=summary_elem.get_text(strip=True)[:200] if summary_elem else None,
+                    ))
+            except Exception:
+                continue
+
+            if len(articles) >= 30:
+                break
+
+        return articles
@@ -0,0 +1,243 @@
+"""RSS 피드 조건부 요청 모듈
+
+피드 URL별 ETag/Last-Modified 값을 상태 파일에 저장해 두고
+If-None-Match/If-Modified-Since 헤더로 요청합니다.
+304 응답이면 본문을 받지 않고 파싱도 건너뜁니다.
+
+같은 상태 파일에 피드별 커서(마지막으로 확인한 최신 엔트리)도 저장하여
+다음 실행에서는 커서 이후의 새 엔트리만 처리합니다.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+from utils.archive import get_archive
+from utils.http import HttpClient, get_client
+from utils.metrics import get_metrics
+from config import FEED_STATE_FILE, FEED_TIMEOUT
+
+
+@dataclass
+class FeedResponse:
+    """피드 요청 결과"""
+
+    url: str
+    status: int
+    content: bytes = b""
+    chunks: Optional[Iterator[bytes]] = None  # stream=True로 요청한 경우의 본문
+    on_complete: Optional[Callable[[], None]] = None  # 스트리밍 본문을 문제없이 읽은 뒤 호출 (검증자, 보관소 반영)
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    def complete(self) -> None:
+        """스트리밍 본문을 필요한 만큼 오류 없이 읽었음을 알림 (한 번만 반영)"""
+        on_complete, self.on_complete = self.on_complete, None
+        if on_complete is not None:
+            on_complete()
+
+    def iter_content(self) -> Iterator[bytes]:
+        """본문을 조각 단위로 반환"""
+        if self.chunks is not None:
+            return self.chunks
+        return iter((self.content,) if self.content else ())
+
+
+@dataclass
+class FetchStats:
+    """소스별 피드 요청 통계"""
+
+    requests: int = 0
+    not_modified: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """304 응답 비율 (0~1)"""
+        return self.not_modified / self.requests if self.requests else 0.0
+
+
+class FeedFetcher:
+    """검증자(ETag/Last-Modified)를 저장해 두고 조건부 GET으로 피드를 가져옴
+
+    여러 스크래퍼가 동시에 사용할 수 있도록 상태 변경은 잠금으로 보호합니다.
+    새로 받은 검증자는 save()를 호출해야 파일에 반영됩니다.
+    """
+
+    def __init__(self, state_file: str = FEED_STATE_FILE, client: HttpClient = None):
+        self.state_file = state_file
+        self.client = client or get_client()
+        self.validators: dict[str, dict] = {}
+        self.cursors: dict[str, dict] = {}
+        self.stats: dict[str, FetchStats] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """상태 파일에서 피드별 검증자 로드"""
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                    self.validators = data.get("feeds", {})
+                    self.cursors = data.get("cursors", {})
+            except (json.JSONDecodeError, IOError):
+                self.validators = {}
+                self.cursors = {}
+
+    def save(self) -> None:
+        """상태 파일에 피드별 검증자 저장"""
+        with self._lock:
+            data = {
+                "feeds": self.validators,
+                "cursors": self.cursors,
+                "last_updated": datetime.now().isoformat(),
+            }
+            with open(self.state_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def get_cursor(self, url: str) -> Optional[dict]:
+        """피드의 커서 반환 ({"id": ..., "published": ISO 시각 또는 None})"""
+        with self._lock:
+            return self.cursors.get(url)
+
+    def set_cursor(self, url: str, entry_id: str, published: Optional[datetime]) -> None:
+        """피드의 커서를 가장 최신 엔트리로 이동"""
+        with self._lock:
+            self.cursors[url] = {
+                "id": entry_id,
+                "published": published.isoformat() if published else None,
+            }
+
+    def forget_validators(self, url: str) -> None:
+        """검증자를 지워 다음 요청은 304 없이 피드 전체를 받음 (아직 보내지 못한 엔트리를 다시 확인할 때)"""
+        with self._lock:
+            self.validators.pop(url, None)
+
+    def _conditional_headers(self, url: str) -> dict:
+        """저장된 검증자로 조건부 요청 헤더 구성"""
+        with self._lock:
+            saved = self.validators.get(url, {})
+        headers = {}
+        if saved.get("etag"):
+            headers["If-None-Match"] = saved["etag"]
+        if saved.get("last_modified"):
+            headers["If-Modified-Since"] = saved["last_modified"]
+        return headers
+
+    def fetch(
+        self,
+        url: str,
+        source: str = "",
+        headers: Optional[dict] = None,
+        timeout: float = FEED_TIMEOUT,
+        stream: bool = False,
+    ) -> FeedResponse:
+        """피드 요청 (변경이 없으면 status 304, 본문 없음)
+
+        stream=True이면 본문을 미리 받지 않고 FeedResponse.chunks로 넘깁니다. 새 검증자와 보관소 기록은
+        읽는 쪽이 FeedResponse.complete()를 호출해야 반영되므로, 본문을 받다가 연결이 끊기거나 파싱에 실패하면
+        이전 검증자가 남아 다음 실행에서 피드를 다시 받습니다.
+        HTTP 오류는 requests.HTTPError로 전달됩니다.
+        보관소가 재실행 중이면 네트워크 대신 보관된 응답을 반환합니다.
+        """
+        archive = get_archive()
+        if archive is not None and archive.replaying:
+            status, content = archive.lookup(url)
+            get_metrics().count(source, "feed_requests")
+            return FeedResponse(url=url, status=status, content=content)
+
+        request_headers = dict(headers or {})
+        request_headers.update(self._conditional_headers(url))
+
+        response = self.client.get(url, headers=request_headers, timeout=timeout, stream=stream)
+
+        if response.status_code == 304:
+            response.close()
+            with self._lock:
+                stats = self.stats.setdefault(source, FetchStats())
+                stats.requests += 1
+                stats.not_modified += 1
+                stats.bytes_saved += self.validators.get(url, {}).get("size", 0)
+            get_metrics().count(source, "feed_requests")
+            get_metrics().count(source, "feed_not_modified")
+            if archive is not None:
+                archive.record("feed", source, url, 304)
+            return FeedResponse(url=url, status=304)
+
+        if not response.ok:
+            response.close()
+        response.raise_for_status()
+
+        with self._lock:
+            stats = self.stats.setdefault(source, FetchStats())
+            stats.requests += 1
+        get_metrics().count(source, "feed_requests")
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if stream:
+            content_length = response.headers.get("Content-Length")
+            size = int(content_length) if content_length and content_length.isdigit() else 0
+            received: list[bytes] = []
+            chunks = self._count_bytes(source, self.client.iter_content(response), received if archive else None)
+
+            def complete() -> None:
+                self._update_validators(url, etag, last_modified, size)
+                # 파서가 중간에 멈췄으면 그때까지 읽은 부분만 기록 (재실행할 때도 같은 엔트리에서 멈춤)
+                if archive is not None:
+                    archive.record("feed", source, url, response.status_code, b"".join(received))
+
+            return FeedResponse(url=url, status=response.status_code, chunks=chunks, on_complete=complete)
+
+        content = response.content
+        self._update_validators(url, etag, last_modified, len(content))
+        with self._lock:
+            stats.bytes_downloaded += len(content)
+        get_metrics().count(source, "bytes_downloaded", len(content))
+        if archive is not None:
+            archive.record("feed", source, url, response.status_code, content)
+        return FeedResponse(url=url, status=response.status_code, content=content)
+
+    def _update_validators(self, url: str, etag: Optional[str], last_modified: Optional[str], size: int) -> None:
+        with self._lock:
+            if etag or last_modified:
+                self.validators[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "size": size,
+                }
+            else:
+                self.validators.pop(url, None)
+
+    def _count_bytes(self, source: str, chunks: Iterator[bytes], received: Optional[list[bytes]] = None) -> Iterator[bytes]:
+        """스트리밍으로 읽은 본문 크기를 소스 통계에 반영 (received를 주면 읽은 조각도 모음)"""
+        size = 0
+        try:
+            for chunk in chunks:
+                size += len(chunk)
+                if received is not None:
+                    received.append(chunk)
+                yield chunk
+        finally:
+            chunks.close()
+            with self._lock:
+                self.stats.setdefault(source, FetchStats()).bytes_downloaded += size
+            get_metrics().count(source, "bytes_downloaded", size)
+
+    def summary_lines(self) -> list[str]:
+        """소스별 304 비율과 절약한 전송량 요약"""
+        lines = []
+        with self._lock:
+            for source, stats in sorted(self.stats.items()):
+                lines.append(
+                    f"{source:<12} 304 {stats.not_modified}/{stats.requests} ({stats.hit_rate:.0%})  "
+                    f"수신 {stats.bytes_downloaded / 1024:.1f}KB  절약 {stats.bytes_saved / 1024:.1f}KB"
+                )
+        return lines
@@ -0,0 +1,150 @@
+"""소스별 상태(서킷 브레이커) 모듈
+
+연속으로 실패한 소스는 일정 시간 동안 건너뛰어, 죽은 호스트를 매번
+제한 시간까지 기다리지 않도록 합니다.
+- closed: 정상. 연속 실패가 CIRCUIT_FAILURE_THRESHOLD회가 되면 open
+- open: 건너뜀. 대기 시간은 실패가 이어질수록 두 배씩 늘어남 (최대 CIRCUIT_MAX_BACKOFF_MINUTES)
+- half_open: 대기 시간이 지나 한 번 시험 실행. 성공하면 closed, 실패하면 다시 open
+
+상태는 캐시 파일 옆(SOURCE_HEALTH_FILE)에 저장되어 실행 간에 유지됩니다.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from config import (
+    SOURCE_HEALTH_FILE,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_BACKOFF_MINUTES,
+    CIRCUIT_MAX_BACKOFF_MINUTES,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class SourceState:
+    """소스 하나의 상태"""
+
+    state: str = CLOSED
+    failures: int = 0                    # 연속 실패 횟수
+    open_until: Optional[str] = None     # open 상태가 끝나는 시각 (ISO 형식)
+    last_error: Optional[str] = None
+    last_failure: Optional[str] = None
+    last_success: Optional[str] = None
+
+
+class SourceHealth:
+    """소스별 서킷 브레이커"""
+
+    def __init__(
+        self,
+        state_file: str = SOURCE_HEALTH_FILE,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        backoff_minutes: float = CIRCUIT_BACKOFF_MINUTES,
+        max_backoff_minutes: float = CIRCUIT_MAX_BACKOFF_MINUTES,
+    ):
+        self.state_file = state_file
+        self.threshold = max(1, threshold)
+        self.backoff_minutes = backoff_minutes
+        self.max_backoff_minutes = max_backoff_minutes
+        self.sources: dict[str, SourceState] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.sources = {
+                source: SourceState(**state)
+                for source, state in data.get("sources", {}).items()
+            }
+        except (json.JSONDecodeError, IOError, TypeError):
+            self.sources = {}
+
+    def save(self) -> None:
+        with self._lock:
+            data = {
+                "sources": {source: asdict(state) for source, state in self.sources.items()},
+                "last_updated": datetime.now().isoformat(),
+            }
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def get(self, source: str) -> SourceState:
+        with self._lock:
+            return self.sources.setdefault(source, SourceState())
+
+    def allow(self, source: str, now: Optional[datetime] = None) -> bool:
+        """이번에 실행해도 되는지 확인 (대기 시간이 지난 open 상태는 half_open으로 전환)"""
+        now = now or datetime.now()
+        with self._lock:
+            state = self.sources.setdefault(source, SourceState())
+            if state.state != OPEN:
+                return True
+            if state.open_until and now < datetime.fromisoformat(state.open_until):
+                return False
+            state.state = HALF_OPEN
+            return True
+
+    def retry_at(self, source: str) -> Optional[datetime]:
+        """open 상태인 소스를 다시 시도할 시각"""
+        state = self.get(source)
+        if state.state == OPEN and state.open_until:
+            return datetime.fromisoformat(state.open_until)
+        return None
+
+    def record_success(self, source: str, now: Optional[datetime] = None) -> None:
+        now = now or datetime.now()
+        with self._lock:
+            state = self.sources.setdefault(source, SourceState())
+            state.state = CLOSED
+            state.failures = 0
+            state.open_until = None
+            state.last_success = now.isoformat()
+
+    def record_failure(self, source: str, error: str, now: Optional[datetime] = None) -> bool:
+        """실패 기록 후 정상 상태였던 서킷이 이번 실패로 열렸으면 True"""
+        now = now or datetime.now()
+        with self._lock:
+            state = self.sources.setdefault(source, SourceState())
+            was_closed = state.state == CLOSED
+            state.failures += 1
+            state.last_error = error[:300]
+            state.last_failure = now.isoformat()
+
+            if state.state == HALF_OPEN or state.failures >= self.threshold:
+                # 임계값을 넘은 뒤로 실패할 때마다 대기 시간 두 배
+                exponent = max(0, state.failures - self.threshold)
+                minutes = min(self.max_backoff_minutes, self.backoff_minutes * 2 ** exponent)
+                state.state = OPEN
+                state.open_until = (now + timedelta(minutes=minutes)).isoformat()
+                return was_closed
+            return False
+
+    def record_result(self, result) -> bool:
+        """스크래핑 결과 반영 (ScrapeResult.failed 기준), 서킷이 새로 열렸으면 True"""
+        if result.failed:
+            return self.record_failure(result.source, result.failure_reason)
+        self.record_success(result.source)
+        return False
+
+    def describe(self, source: str) -> str:
+        """실행 요약용 상태 설명"""
+        state = self.get(source)
+        if state.state == OPEN:
+            until = datetime.fromisoformat(state.open_until).strftime("%m-%d %H:%M") if state.open_until else "?"
+            return f"차단 중 (연속 실패 {state.failures}회, {until}까지)"
+        if state.state == HALF_OPEN:
+            return "시험 실행"
+        if state.failures:
+            return f"연속 실패 {state.failures}회"
+        return "정상"
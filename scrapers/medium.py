@@ -1,9 +1,9 @@
 """Medium 스크래퍼"""
 import requests
 from bs4 import BeautifulSoup
-import feedparser
 
 from .base import BaseScraper, Article
+from utils.archive import ArchiveMiss
 
 
 class MediumScraper(BaseScraper):
@@ -18,55 +18,45 @@ class MediumScraper(BaseScraper):
 
         # Medium RSS 피드 사용
         rss_urls = [
-            "https://medium.com/feed/tag/product-management",
-            "https://medium.com/feed/tag/product-manager",
-            "https://medium.com/feed/tag/product-owner",
+            f"{self.base_url}/feed/tag/product-management",
+            f"{self.base_url}/feed/tag/product-manager",
+            f"{self.base_url}/feed/tag/product-owner",
         ]
 
+        rss_ok = False  # 304(변경 없음) 응답도 성공으로 취급
+        seen_urls = set()  # 태그끼리 겹치는 글 제외 (정규화 URL 기준)
+
         for rss_url in rss_urls:
+            if self.should_stop():
+                break
+
             try:
-                feed = feedparser.parse(rss_url)
-
-                for entry in feed.entries[:10]:  # 태그당 최근 10개
-                    try:
-                        title = entry.get("title", "")
-                        link = entry.get("link", "")
-                        summary = entry.get("summary", "")
-
-                        # HTML 태그 제거
-                        if summary:
-                            soup = BeautifulSoup(summary, "html.parser")
-                            summary = soup.get_text(strip=True)[:200]
-
-                        if title and link:
-                            # 중복 체크
-                            if not any(a.url == link for a in articles):
-                                articles.append(Article(
-                                    title=title,
-                                    url=link,
-                                    source=self.name,
-                                    summary=summary if summary else None,
-                                ))
-                    except Exception:
-                        continue
+                for article in self.iter_feed_articles(rss_url, limit=10):  # 태그당 최근 10개
+                    # 중복 체크
+                    if article.canonical_url not in seen_urls:
+                        seen_urls.add(article.canonical_url)
+                        articles.append(article)
+                rss_ok = True
 
             except Exception as e:
-                print(f"[{self.name}] RSS 파싱 실패 ({rss_url}): {e}")
+                self.record_failure(f"RSS 파싱 실패 ({rss_url}): {e}")
                 continue
 
         # RSS가 실패하면 웹 스크래핑 시도
-        if not articles:
+        if not articles and not rss_ok and not self.should_stop():
             try:
                 tag_url = f"{self.base_url}/tag/product-management"
-                response = requests.get(tag_url, headers=self.headers, timeout=10)
+                status, html = self.get_page(tag_url, timeout=10)
 
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
+                if status != 200:
+                    self.record_failure(f"웹 스크래핑 실패: HTTP {status}")
+                else:
+                    self.successes += 1
+                    soup = BeautifulSoup(html, "html.parser")
 
                     # 아티클 링크 찾기
                     article_links = soup.select("article a[href*='/'], div[data-testid] a[href*='/']")
 
-                    seen_urls = set()
                     for link in article_links:
                         try:
                             href = link.get("href", "")
@@ -80,17 +70,14 @@ class MediumScraper(BaseScraper):
                             if href and title and len(title) > 10:
                                 article_url = href if href.startswith("http") else f"{self.base_url}{href}"
 
-                                if article_url not in seen_urls:
-                                    seen_urls.add(article_url)
-                                    articles.append(Article(
-                                        title=title,
-                                        url=article_url,
-                                        source=self.name,
-                                    ))
+                                article = Article(title=title, url=article_url, source=self.name)
+                                if article.canonical_url not in seen_urls:
+                                    seen_urls.add(article.canonical_url)
+                                    articles.append(article)
                         except Exception:
                             continue
 
-            except requests.RequestException as e:
-                print(f"[{self.name}] 웹 스크래핑 실패: {e}")
+            except (requests.RequestException, ArchiveMiss) as e:
+                self.record_failure(f"웹 스크래핑 실패: {e}")
 
         return articles  # Medium은 이미 PM 태그이므로 추가 필터링 불필요
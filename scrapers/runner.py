@@ -0,0 +1,160 @@
+"""스크래퍼 실행기 - 소스별 제한 시간을 두고 동시에 실행"""
+import math
+import time
+from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from .base import BaseScraper, Article
+from config import SCRAPE_WORKERS, SCRAPE_TIMEOUT
+
+# 제한 시간이 지난 스크래퍼가 부분 결과를 반환할 때까지 기다리는 여유 시간 (초)
+GRACE_SECONDS = 2.0
+
+
+@dataclass
+class ScrapeResult:
+    """소스별 스크래핑 결과"""
+
+    source: str
+    articles: list[Article] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+    published: list[datetime] = field(default_factory=list)  # 키워드 필터 전 새 엔트리의 발행 시각
+    failures: list[str] = field(default_factory=list)        # 실패한 요청 메시지
+    successes: int = 0                                         # 성공한 요청 수 (304 포함)
+
+    @property
+    def failed(self) -> bool:
+        """소스가 실패했는지 (예외 발생, 또는 요청이 모두 실패하거나 하나도 끝나지 않음)"""
+        if self.error:
+            return True
+        if self.articles or self.successes:
+            return False
+        return bool(self.failures) or self.timed_out
+
+    @property
+    def failure_reason(self) -> str:
+        if self.error:
+            return self.error
+        if self.failures:
+            return self.failures[-1]
+        return "시간 초과" if self.timed_out else ""
+
+    @property
+    def status(self) -> str:
+        if self.error:
+            return "오류"
+        if self.failed:
+            return "실패"
+        if self.timed_out:
+            return "시간 초과(부분 결과)" if self.articles else "시간 초과"
+        return "완료"
+
+
+def _run_one(scraper: BaseScraper, timeout: Optional[float]) -> ScrapeResult:
+    """스크래퍼 하나를 제한 시간 안에서 실행"""
+    scraper.start(timeout)
+    started = time.monotonic()
+    try:
+        articles = scraper.scrape()
+        error = None
+    except Exception as e:
+        articles, error = [], str(e)
+
+    return ScrapeResult(
+        source=scraper.name,
+        articles=articles,
+        elapsed=time.monotonic() - started,
+        error=error,
+        timed_out=scraper.should_stop(),
+        published=list(scraper.published_seen),
+        failures=list(scraper.failures),
+        successes=scraper.successes,
+    )
+
+
+def run_scrapers(
+    scrapers: list[BaseScraper],
+    max_workers: int = SCRAPE_WORKERS,
+    timeout: Optional[float] = SCRAPE_TIMEOUT,
+) -> Iterator[ScrapeResult]:
+    """스크래퍼를 실행하고 끝나는 순서대로 결과 반환
+
+    max_workers가 1 이하이면 순차 실행합니다. 각 소스는 시작 시점부터
+    timeout 초 안에 끝나야 하며, 제한 시간을 넘긴 소스는 그때까지
+    수집한 아티클만 반환합니다. 네트워크 대기 등으로 응답하지 않는
+    소스는 자기 제한 시간이 지나면 취소하고 시간 초과 결과로 대체하며,
+    다른 소스의 결과는 끝나는 대로 그대로 반환합니다.
+    """
+    if not scrapers:
+        return
+
+    if max_workers <= 1:
+        for scraper in scrapers:
+            yield _run_one(scraper, timeout)
+        return
+
+    workers = min(max_workers, len(scrapers))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper")
+    started_at: dict[BaseScraper, float] = {}  # 워커가 실행을 시작한 시각 (대기열에 있으면 없음)
+
+    def run(scraper: BaseScraper) -> ScrapeResult:
+        started_at[scraper] = time.monotonic()
+        return _run_one(scraper, timeout)
+
+    futures = {executor.submit(run, scraper): scraper for scraper in scrapers}
+
+    # 응답하지 않는 소스가 워커를 붙잡아 대기열의 소스가 시작하지 못할 때를 위한 전체 대기 한도
+    # (대기열에 밀린 소스도 자기 몫의 제한 시간을 다 쓸 수 있도록 계산)
+    started = time.monotonic()
+    overall = None
+    if timeout:
+        rounds = math.ceil(len(scrapers) / workers)
+        overall = started + timeout * rounds + GRACE_SECONDS
+
+    def timed_out(scraper: BaseScraper, now: float) -> ScrapeResult:
+        scraper.cancel()
+        return ScrapeResult(
+            source=scraper.name,
+            elapsed=now - started_at.get(scraper, now),
+            error=None,
+            timed_out=True,
+            published=list(scraper.published_seen),
+            failures=list(scraper.failures),
+            successes=scraper.successes,
+        )
+
+    pending = set(futures)
+    try:
+        while pending:
+            wait_timeout = None
+            if timeout:
+                # 실행 중인 소스 중 가장 먼저 제한 시간(+여유)이 끝나는 시각까지만 대기
+                limits = [
+                    started_at[futures[f]] + timeout + GRACE_SECONDS if futures[f] in started_at else overall
+                    for f in pending
+                ]
+                wait_timeout = max(0.0, min(limits) - time.monotonic())
+            done, pending = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            if not timeout:
+                continue
+
+            now = time.monotonic()
+            for future in list(pending):
+                scraper = futures[future]
+                start = started_at.get(scraper)
+                if start is not None and now >= start + timeout + GRACE_SECONDS:
+                    print(f"[{scraper.name}] 제한 시간({timeout:g}초)이 지나도 응답이 없어 건너뜁니다")
+                elif start is None and now >= overall:
+                    print(f"[{scraper.name}] 실행 대기 중 전체 제한 시간이 지나 건너뜁니다")
+                else:
+                    continue
+                pending.discard(future)
+                yield timed_out(scraper, now)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
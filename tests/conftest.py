@@ -0,0 +1,5 @@
+"""스크래퍼 봇 단위 테스트 공통 설정 (QA 자동화 테스트는 qa/tests)"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,37 @@
+"""원본 응답 보관 테스트 - 실행 ID 중복과 진행 중인 실행의 본문 정리"""
+import os
+import time
+
+from utils.archive import RawArchive, list_runs, prune
+from utils.metrics import RunMetrics
+
+
+def test_run_ids_are_unique_within_a_second():
+    run_ids = {RunMetrics().run_id for _ in range(100)}
+    assert len(run_ids) == 100
+
+
+def test_prune_keeps_objects_of_unsaved_run(tmp_path):
+    """목록을 아직 저장하지 않은 실행의 본문은 지우지 않음"""
+    finished = RawArchive("20261017-090000-000001-1", root=str(tmp_path))
+    finished.record("feed", "test", "https://example.com/a", 200, b"a")
+    finished.save()
+
+    running = RawArchive("20261017-090000-000002-2", root=str(tmp_path))
+    running.record("feed", "test", "https://example.com/b", 200, b"b")
+    prune(tmp_path, keep_days=7)
+    running.save()
+
+    assert list_runs(str(tmp_path)) == ["20261017-090000-000001-1", "20261017-090000-000002-2"]
+    assert RawArchive.load("latest", root=str(tmp_path)).lookup("https://example.com/b") == (200, b"b")
+
+
+def test_prune_removes_old_unreferenced_objects(tmp_path):
+    archive = RawArchive("20261017-090000-000001-1", root=str(tmp_path))
+    archive.record("feed", "test", "https://example.com/a", 200, b"a")
+    path = archive._object_path(archive.responses["https://example.com/a"]["sha256"])
+    old = time.time() - 8 * 86400
+    os.utime(path, (old, old))
+
+    prune(tmp_path, keep_days=7)
+    assert not path.exists()
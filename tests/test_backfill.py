@@ -0,0 +1,60 @@
+"""지난 아티클 채우기 테스트 - 저장 실패한 묶음만 건너뛰고 나머지 페이지는 계속"""
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import scrapers.backfill as backfill_module
+from scrapers.backfill import backfill
+from scrapers.base import BaseScraper
+
+FEED_URL = "https://example.com/feed"
+PAGES = 3
+
+
+def page_feed(page: int) -> bytes:
+    published = datetime.now(timezone.utc) - timedelta(hours=page)
+    items = "".join(
+        f"<item><title>PM 글 {page}-{i}</title><link>https://example.com/{page}/{i}</link>"
+        f"<pubDate>{format_datetime(published)}</pubDate></item>"
+        for i in range(2)
+    )
+    return f'<?xml version="1.0"?><rss><channel>{items}</channel></rss>'.encode()
+
+
+def fake_fetch_page(url: str, headers: dict):
+    page = int(url.rsplit("paged=", 1)[1]) if "paged=" in url else 1
+    return page_feed(page) if page <= PAGES else None
+
+
+class PagedScraper(BaseScraper):
+    name = "paged"
+    paged_feed = FEED_URL
+
+    def scrape(self):
+        return []
+
+
+def test_failed_batch_is_reported_and_backfill_continues(monkeypatch):
+    monkeypatch.setattr(backfill_module, "fetch_page", fake_fetch_page)
+    saved = []
+    calls = 0
+
+    def on_batch(articles):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise sqlite3.OperationalError("database is locked")
+        saved.extend(articles)
+
+    since = datetime.now(timezone.utc) - timedelta(days=1)
+    stats = backfill(
+        [PagedScraper(keywords=["PM"])], since, on_batch,
+        host_concurrency=1, parse_workers=1, batch_size=2,
+    )
+
+    [stat] = stats
+    assert stat.pages == PAGES
+    assert calls == PAGES
+    assert len(saved) == 2 * (PAGES - 1)
+    assert stat.articles == len(saved)
+    assert stat.failures == ["2개 저장 실패: database is locked"]
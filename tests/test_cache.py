@@ -0,0 +1,94 @@
+"""중복 방지 캐시 백엔드 테스트 (log, sqlite, index 공통 동작)"""
+import pytest
+
+from utils.cache import Cache
+from utils.index_cache import IndexCache
+from utils.sent_history import FingerprintIndex
+from utils.sqlite_cache import SqliteCache
+
+URLS = [f"https://example.com/posts/{i}" for i in range(10)]
+
+
+def open_log(path):
+    return Cache(str(path), ttl_days=0, max_entries=0, source_policies={}, history=False)
+
+
+def open_bloom(path):
+    return Cache(str(path), ttl_days=0, max_entries=3, source_policies={}, history=True)
+
+
+BACKENDS = {"log": open_log, "bloom": open_bloom, "sqlite": SqliteCache, "index": IndexCache}
+
+
+@pytest.fixture(params=list(BACKENDS))
+def open_cache(request, tmp_path):
+    opener = BACKENDS[request.param]
+    return lambda: opener(str(tmp_path / "cache.log"))
+
+
+class TestFilterNew:
+    def test_filters_sent_urls_in_batch(self, open_cache):
+        cache = open_cache()
+        cache.mark_sent_many((url, "test") for url in URLS[:5])
+        cache.save()
+        assert cache.filter_new(URLS) == URLS[5:]
+
+    def test_survives_reopen(self, open_cache):
+        cache = open_cache()
+        cache.mark_sent_many((url, "test") for url in URLS[:5])
+        cache.save()
+        cache.wait()
+        reopened = open_cache()
+        assert reopened.filter_new(URLS) == URLS[5:]
+        assert reopened.is_sent("http://www.example.com/posts/1/")  # 정규화 URL 기준
+
+    def test_claim_returns_only_new_urls(self, open_cache):
+        cache = open_cache()
+        cache.mark_sent("https://example.com/posts/0", "test")
+        assert cache.claim(URLS[:3]) == set(URLS[1:3])
+
+
+class TestSqliteClaim:
+    def test_claimed_urls_are_taken_by_other_instances(self, tmp_path):
+        first = SqliteCache(str(tmp_path / "cache.log"))
+        second = SqliteCache(str(tmp_path / "cache.log"))
+        assert first.claim(URLS[:3]) == set(URLS[:3])
+        assert second.claim(URLS[:4]) == {URLS[3]}
+        assert second.filter_new(URLS[:5]) == [URLS[4]]
+
+        first.release(URLS[:1])
+        assert second.claim(URLS[:1]) == {URLS[0]}
+
+
+class TestFingerprintIndex:
+    def test_delta_merge_and_torn_tail(self, tmp_path):
+        path = str(tmp_path / "index.fp")
+        index = FingerprintIndex(path, delta_max=4)
+        assert index.add(range(10, 0, -1)) == 10  # delta_max를 넘어 병합
+        assert index.add([5, 11]) == 1
+        with open(f"{path}.delta", "ab") as f:
+            f.write(b"\x01\x02")  # 추가하다 잘린 지문
+
+        reopened = FingerprintIndex(path, delta_max=4)
+        assert len(reopened) == 11
+        assert reopened.contains_many([0, 1, 10, 11, 12]) == [False, True, True, True, False]
+        assert list(reopened.to_array()) == list(range(1, 12))
+
+
+class TestLogCacheEviction:
+    def test_open_does_not_write_history(self, tmp_path):
+        """캐시를 열기만 해서는 (--test) 내보내기로 .history/.bloom을 만들지 않음"""
+        path = tmp_path / "cache.log"
+        cache = open_bloom(path)
+        cache.mark_sent_many((url, "test") for url in URLS)
+        cache._flush()
+
+        reopened = open_bloom(path)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["cache.log"]
+        assert reopened.filter_new(URLS) == []
+
+        reopened.save()
+        reopened.wait()
+        assert len(reopened) == 3
+        assert (tmp_path / "cache.bloom").exists()
+        assert reopened.filter_new(URLS) == []
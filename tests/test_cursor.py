@@ -0,0 +1,152 @@
+"""피드 커서 테스트 - 보내지 못한 엔트리는 다음 실행에서 다시 확인"""
+from datetime import datetime, timedelta, timezone
+
+import main
+from scrapers.base import Article, BaseScraper
+from scrapers.fetch import FeedFetcher
+from utils.cache import Cache
+from utils.near_dup import NearDuplicateFilter
+from utils.profiles import default_profile
+from utils.url import canonicalize_url
+
+FEED_URL = "https://example.com/feed"
+
+
+class FakeScraper(BaseScraper):
+    name = "fake"
+
+    def __init__(self, entries: list[dict], fetcher: FeedFetcher):
+        super().__init__(keywords=["PM"], fetcher=fetcher)
+        self.entries = entries
+
+    def scrape(self):
+        return list(self.iter_new_entries(FEED_URL, self.entries))
+
+
+def make_entries(count: int, start: int = 0) -> list[dict]:
+    """최신순 피드 엔트리 (post-{start}가 가장 최신)"""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": f"post-{i}",
+            "link": f"https://example.com/posts/{i}",
+            "published_parsed": (now - timedelta(minutes=i)).utctimetuple(),
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def links(entries: list[dict]) -> set[str]:
+    return {canonicalize_url(entry["link"]) for entry in entries}
+
+
+class FakeNotifier:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, articles, test_mode=False):
+        self.sent.extend(articles)
+        return True
+
+
+def make_target(tmp_path) -> main.ProfileTarget:
+    return main.ProfileTarget(
+        profile=default_profile(),
+        cache=Cache(cache_file="", history=False),
+        near_dup=NearDuplicateFilter(state_file=str(tmp_path / "fingerprints.json")),
+        notifier=FakeNotifier(),
+        sources={"fake"},
+    )
+
+
+PRESS_RELEASE = (
+    "프로덕트 분석 스타트업 C사가 50억 원 규모의 시리즈A 투자를 유치했다. C사는 이번 투자로 PM과 "
+    "데이터 분석 인력을 늘리고, 제품 실험 플랫폼을 고도화해 국내외 고객사를 확대할 계획이다."
+)
+
+
+class TestCommitCursors:
+    def test_overflow_entries_are_offered_again(self):
+        """25개 중 20개만 보냈으면 남은 5개는 다음 실행에서 다시 확인"""
+        fetcher = FeedFetcher(state_file="")
+        entries = make_entries(25)
+        scraper = FakeScraper(entries, fetcher)
+
+        first = scraper.scrape()
+        assert len(first) == 25
+        unsent = links(first[20:])  # 전체 한도 초과로 보내지 못함
+        scraper.commit_cursors(unsent)
+
+        second = scraper.scrape()
+        assert unsent <= links(second)
+
+        # 남은 아티클까지 보냈으면 커서가 가장 최신 엔트리로 이동
+        scraper.commit_cursors(set())
+        assert fetcher.get_cursor(FEED_URL)["id"] == "post-0"
+        assert scraper.scrape() == []
+
+    def test_cursor_moves_past_final_older_entries(self):
+        """가장 최신 엔트리만 못 보냈으면 그보다 오래된 엔트리까지 커서 이동"""
+        fetcher = FeedFetcher(state_file="")
+        scraper = FakeScraper(make_entries(10), fetcher)
+        scraper.commit_cursors(links(scraper.scrape()[:2]))
+
+        assert fetcher.get_cursor(FEED_URL)["id"] == "post-2"
+        assert [entry["id"] for entry in scraper.scrape()] == ["post-0", "post-1"]
+
+    def test_unsent_entries_skip_conditional_get(self):
+        """보내지 못한 엔트리가 남은 피드는 다음 요청에서 304를 받지 않도록 검증자 삭제"""
+        fetcher = FeedFetcher(state_file="")
+        fetcher.validators[FEED_URL] = {"etag": '"abc"', "last_modified": None, "size": 0}
+        scraper = FakeScraper(make_entries(3), fetcher)
+        scraper.commit_cursors(links(scraper.scrape()[-1:]))
+
+        assert FEED_URL not in fetcher.validators
+        assert fetcher.get_cursor(FEED_URL) is None
+
+    def test_interrupted_walk_keeps_cursor(self):
+        """제한 시간 초과로 중단된 확인은 커서를 옮기지 않음"""
+        fetcher = FeedFetcher(state_file="")
+        scraper = FakeScraper(make_entries(5), fetcher)
+        scraper.cancel()
+        assert scraper.scrape() == []
+        scraper.commit_cursors(set())
+        assert fetcher.get_cursor(FEED_URL) is None
+
+    def test_cursor_moves_past_collapsed_duplicates(self, tmp_path):
+        """같은 보도자료로 묶여 대표만 보낸 엔트리도 결과가 확정된 것으로 보고 커서를 넘김"""
+        fetcher = FeedFetcher(state_file="")
+        fetcher.validators[FEED_URL] = {"etag": '"abc"', "last_modified": None, "size": 0}
+        entries = make_entries(2)
+        scraper = FakeScraper(entries, fetcher)
+        titles = ["C사, 50억 원 규모 시리즈A 투자 유치", "C사 시리즈A 50억 투자 유치… PM 조직 확대"]
+        articles = [
+            Article(title=title, url=entry["link"], source="fake", summary=PRESS_RELEASE)
+            for title, entry in zip(titles, scraper.scrape())
+        ]
+        target = make_target(tmp_path)
+
+        assert main.deliver(articles, target)
+        assert len(target.notifier.sent) == 1 and len(target.notifier.sent[0].duplicates) == 1
+        main.commit_cursors([scraper], [target], [articles])
+
+        assert fetcher.get_cursor(FEED_URL)["id"] == "post-0"
+        assert FEED_URL in fetcher.validators
+        assert scraper.scrape() == []
+
+    def test_cursor_moves_past_recently_sent_duplicates(self, tmp_path):
+        """최근 전송한 글과 유사해 제외한 엔트리도 커서를 넘김"""
+        target = make_target(tmp_path)
+        target.near_dup.add([Article(title="C사, 50억 원 규모 시리즈A 투자 유치", url="https://other.com/1",
+                                     source="other", summary=PRESS_RELEASE)])
+        fetcher = FeedFetcher(state_file="")
+        scraper = FakeScraper(make_entries(1), fetcher)
+        articles = [
+            Article(title="C사 시리즈A 50억 투자 유치… PM 조직 확대", url=entry["link"], source="fake", summary=PRESS_RELEASE)
+            for entry in scraper.scrape()
+        ]
+
+        assert main.deliver(articles, target)
+        assert target.notifier.sent == []
+        main.commit_cursors([scraper], [target], [articles])
+        assert fetcher.get_cursor(FEED_URL)["id"] == "post-0"
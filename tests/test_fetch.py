@@ -0,0 +1,82 @@
+"""스트리밍 피드 요청 테스트 - 본문을 끝까지 읽지 못하면 새 검증자와 보관 기록을 반영하지 않음"""
+import pytest
+import requests
+
+from scrapers.base import iter_feed_entries
+from scrapers.fetch import FeedFetcher
+from utils.archive import RawArchive, set_archive
+
+FEED_URL = "https://example.com/feed"
+ITEMS = "".join(f"<item><title>PM {i}</title><link>https://example.com/{i}</link></item>" for i in range(5))
+FEED = f'<?xml version="1.0"?><rss><channel>{ITEMS}</channel></rss>'.encode()
+
+
+class FakeResponse:
+    status_code = 200
+    ok = True
+    url = FEED_URL
+    headers = {"ETag": '"new"'}
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeClient:
+    """본문을 cut 바이트까지 보낸 뒤 연결이 끊기는 클라이언트 (cut이 None이면 끝까지)"""
+
+    def __init__(self, cut=None):
+        self.cut = cut
+
+    def get(self, url, headers=None, timeout=None, stream=False):
+        return FakeResponse()
+
+    def iter_content(self, response):
+        body = FEED if self.cut is None else FEED[:self.cut]
+        for start in range(0, len(body), 64):
+            yield body[start:start + 64]
+        if self.cut is not None:
+            raise requests.ConnectionError("connection reset")
+
+
+def make_fetcher(client) -> FeedFetcher:
+    fetcher = FeedFetcher(state_file="", client=client)
+    fetcher.validators[FEED_URL] = {"etag": '"old"', "last_modified": None, "size": 0}
+    return fetcher
+
+
+def read(fetcher: FeedFetcher, limit=None) -> list:
+    response = fetcher.fetch(FEED_URL, stream=True)
+    return list(iter_feed_entries(response.iter_content(), limit, on_complete=response.complete))
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = RawArchive("20261017-090000-000001-1", root=str(tmp_path))
+    set_archive(archive)
+    yield archive
+    set_archive(None)
+
+
+class TestStreamValidators:
+    def test_complete_body_updates_validators(self, archive):
+        fetcher = make_fetcher(FakeClient())
+        assert len(read(fetcher)) == 5
+        assert fetcher.validators[FEED_URL]["etag"] == '"new"'
+        assert archive.lookup(FEED_URL) == (200, FEED)
+
+    def test_stopping_at_limit_updates_validators(self):
+        """필요한 만큼 읽고 멈춘 것은 정상 종료"""
+        fetcher = make_fetcher(FakeClient())
+        assert len(read(fetcher, limit=2)) == 2
+        assert fetcher.validators[FEED_URL]["etag"] == '"new"'
+
+    def test_dropped_connection_keeps_old_validators(self, archive):
+        """본문을 받다가 연결이 끊기면 이전 검증자를 유지하고 잘린 본문은 보관하지 않음"""
+        fetcher = make_fetcher(FakeClient(cut=len(FEED) // 2))
+        with pytest.raises(requests.ConnectionError):
+            read(fetcher)
+        assert fetcher.validators[FEED_URL]["etag"] == '"old"'
+        assert FEED_URL not in archive.responses
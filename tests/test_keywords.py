@@ -0,0 +1,108 @@
+"""키워드 매처 테스트 - 이전 부분 문자열 매칭과 같은 결과, 짧은 영문 키워드의 단어 경계"""
+import re
+from pathlib import Path
+
+import feedparser
+import pytest
+
+from config import KEYWORDS
+from scrapers.base import BaseScraper
+from utils.keywords import KeywordMatcher
+
+FIXTURES_DIR = Path(__file__).parent.parent / "benchmarks" / "fixtures" / "feeds"
+
+
+def fixture_texts() -> list[str]:
+    """벤치마크 픽스처의 엔트리마다 스크래퍼가 매칭하는 텍스트 (제목 + 요약)"""
+    texts = []
+    for path in sorted(FIXTURES_DIR.glob("*.xml")):
+        for entry in feedparser.parse(path.read_bytes()).entries:
+            summary = BaseScraper.strip_html(entry.get("summary", ""))
+            title = entry.get("title", "")
+            texts.append(f"{title}\n{summary}" if summary else title)
+    return texts
+
+
+def substring_hits(keywords: list[str], text: str) -> dict[str, int]:
+    """이전 방식 (kw.lower() in text.lower()), 겹치는 등장도 셈"""
+    text = text.lower()
+    hits = {}
+    for keyword in keywords:
+        count = sum(1 for i in range(len(text)) if text.startswith(keyword.lower(), i))
+        if count:
+            hits[keyword] = count
+    return hits
+
+
+def boundary_hits(keywords: list[str], text: str) -> dict[str, int]:
+    """단어 경계 규칙의 정규식 구현 (3글자 이하 영문/숫자 키워드, 복수형 s 허용)"""
+    text = text.lower()
+    hits = {}
+    for keyword in keywords:
+        pattern = re.escape(keyword.lower())
+        if len(keyword) <= 3 and keyword.isascii() and keyword.isalnum():
+            pattern = f"(?<![a-z0-9])(?={pattern}s?(?![a-z0-9])){pattern}"
+        else:
+            pattern = f"(?={pattern})"
+        count = len(re.findall(pattern, text))
+        if count:
+            hits[keyword] = count
+    return hits
+
+
+TEXTS = fixture_texts()
+
+
+class TestAgainstSubstringMatching:
+    def test_fixtures_are_loaded(self):
+        assert len(TEXTS) > 100
+
+    def test_same_as_substring_without_boundary(self):
+        matcher = KeywordMatcher(KEYWORDS, word_boundary=False)
+        for text in TEXTS:
+            assert matcher.find(text) == substring_hits(KEYWORDS, text), text
+
+    def test_boundary_rule_on_fixtures(self):
+        matcher = KeywordMatcher(KEYWORDS, word_boundary=True)
+        for text in TEXTS:
+            assert matcher.find(text) == boundary_hits(KEYWORDS, text), text
+
+    def test_matches_is_substring_check_without_boundary(self):
+        matcher = KeywordMatcher(KEYWORDS, word_boundary=False)
+        for text in TEXTS:
+            assert matcher.matches(text) == any(kw.lower() in text.lower() for kw in KEYWORDS)
+
+
+class TestWordBoundary:
+    @pytest.mark.parametrize("text", ["PM이 하는 일", "UX/UI 개선", "(PM)", "pm", "Senior PMs", "3 APIs", "PM's job"])
+    def test_matches(self, text):
+        matcher = KeywordMatcher(["PM", "UX", "API"])
+        assert matcher.matches(text)
+
+    @pytest.mark.parametrize("text", ["UPMOST", "PM2 프로세스 관리자", "SPMs", "PMsx", "APIX"])
+    def test_does_not_match(self, text):
+        matcher = KeywordMatcher(["PM", "API"])
+        assert not matcher.matches(text)
+
+    def test_disabled_boundary_matches_substrings(self):
+        matcher = KeywordMatcher(["PM"], word_boundary=False)
+        assert matcher.find("UPMOST PM2") == {"PM": 2}
+
+    def test_long_keywords_ignore_boundary(self):
+        matcher = KeywordMatcher(["product manager"])
+        assert matcher.matches("senior product managers2")
+
+
+class TestHits:
+    def test_counts_overlapping_keywords(self):
+        matcher = KeywordMatcher(["기획", "기획자", "서비스 기획"])
+        assert matcher.find("서비스 기획자와 기획") == {"기획": 2, "기획자": 1, "서비스 기획": 1}
+
+    def test_case_insensitive_and_first_spelling_wins(self):
+        matcher = KeywordMatcher(["Product Owner", "product owner"])
+        assert matcher.keywords == ["Product Owner"]
+        assert matcher.find("PRODUCT OWNER, product owner") == {"Product Owner": 2}
+
+    def test_empty(self):
+        assert KeywordMatcher([]).find("PM") == {}
+        assert KeywordMatcher(["PM"]).find("") == {}
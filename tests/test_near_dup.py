@@ -0,0 +1,88 @@
+"""유사 아티클 묶음 테스트 - 틀이 같은 제목은 묶지 않음"""
+import pytest
+
+from scrapers.base import Article
+from utils.near_dup import NearDuplicateFilter, article_signature, is_near_duplicate, similarity
+
+THRESHOLD = 0.6
+
+SUMMARY = (
+    "국내 핀테크 스타트업이 시리즈A 라운드에서 50억 원 규모의 투자를 유치했다고 밝혔다. "
+    "이번 투자는 벤처캐피털 세 곳이 참여했으며, 회사는 확보한 자금으로 프로덕트 조직을 확대할 계획이다."
+)
+
+
+def article(title: str, url: str, summary: str = None) -> Article:
+    return Article(title=title, url=url, source="test", summary=summary)
+
+
+def scores(first: Article, second: Article) -> tuple[float, float]:
+    return similarity(article_signature(first), article_signature(second))
+
+
+# 제목 틀만 같고 다른 글 (제목 유사도가 기준값 0.6을 넘음)
+FORMULAIC_TITLES = [
+    ("C사, 시리즈A 투자 유치", "D사, 시리즈A 투자 유치"),
+    ("2024년 1월 스타트업 투자 동향", "2024년 2월 스타트업 투자 동향"),
+    ("[주간 PM 뉴스] 1월 첫째 주 프로덕트 소식", "[주간 PM 뉴스] 1월 둘째 주 프로덕트 소식"),
+]
+
+
+class TestIsNearDuplicate:
+    def test_title_alone_needs_high_similarity(self):
+        assert not is_near_duplicate((0.7, 0.0), THRESHOLD)
+        assert is_near_duplicate((0.9, 0.0), THRESHOLD)
+
+    def test_title_with_matching_summary(self):
+        assert is_near_duplicate((0.4, 0.7), THRESHOLD)
+        assert not is_near_duplicate((0.4, 0.3), THRESHOLD)
+
+    def test_summary_alone_needs_high_similarity(self):
+        assert is_near_duplicate((0.0, 0.85), THRESHOLD)
+        assert not is_near_duplicate((0.0, 0.7), THRESHOLD)
+
+
+class TestFormulaicHeadlines:
+    @pytest.mark.parametrize("first,second", FORMULAIC_TITLES)
+    def test_not_merged(self, first, second):
+        """틀이 같은 제목은 묶지 않음"""
+        near_dup = NearDuplicateFilter(state_file="", threshold=THRESHOLD)
+        articles = [article(first, "https://a.com/1"), article(second, "https://b.com/2")]
+        representatives, skipped = near_dup.collapse(articles)
+        assert len(representatives) == 2 and skipped == []
+
+    @pytest.mark.parametrize("first,second", FORMULAIC_TITLES)
+    def test_not_dropped_by_history(self, first, second):
+        """지난 실행에 보낸 글과 제목 틀만 같으면 제외하지 않음"""
+        near_dup = NearDuplicateFilter(state_file="", threshold=THRESHOLD)
+        near_dup.add([article(first, "https://a.com/1")])
+        representatives, skipped = near_dup.collapse([article(second, "https://b.com/2")])
+        assert len(representatives) == 1 and skipped == []
+
+    def test_different_summaries_not_merged(self):
+        """제목 틀이 같고 요약문이 다르면 묶지 않음"""
+        first = article("C사, 시리즈A 투자 유치", "https://a.com/1", SUMMARY)
+        second = article(
+            "D사, 시리즈A 투자 유치", "https://b.com/2",
+            "헬스케어 기업 D사가 병원용 예약 서비스 고도화를 위해 신규 투자를 받았다. 회사는 올해 일본 시장 진출을 준비하고 있다.",
+        )
+        assert not is_near_duplicate(scores(first, second), THRESHOLD)
+
+
+class TestSamePressRelease:
+    def test_same_summary_different_title(self):
+        """매체마다 제목을 바꿔 실은 같은 보도자료는 묶음"""
+        near_dup = NearDuplicateFilter(state_file="", threshold=THRESHOLD)
+        articles = [
+            article("C사, 50억 원 규모 시리즈A 투자 유치", "https://a.com/1", SUMMARY),
+            article("C사 시리즈A 50억 투자 유치… 프로덕트 조직 확대", "https://b.com/2", SUMMARY),
+        ]
+        representatives, _ = near_dup.collapse(articles)
+        assert len(representatives) == 1
+        assert [a.url for a in representatives[0].duplicates] == ["https://b.com/2"]
+
+    def test_nearly_identical_titles(self):
+        """문장부호만 다른 제목은 요약문이 없어도 묶음"""
+        first = article("토스, 신규 PM 채용 시작… 프로덕트 조직 확대", "https://a.com/1")
+        second = article("토스, 신규 PM 채용 시작...프로덕트 조직 확대", "https://b.com/2")
+        assert is_near_duplicate(scores(first, second), THRESHOLD)
@@ -0,0 +1,58 @@
+"""스크래퍼 실행기 테스트 (응답하지 않는 소스가 있을 때 다른 소스 결과 유지)"""
+import threading
+import time
+
+import scrapers.runner as runner
+from scrapers.base import Article, BaseScraper
+from scrapers.fetch import FeedFetcher
+from scrapers.runner import run_scrapers
+
+
+class QuickScraper(BaseScraper):
+    def __init__(self, name: str, delay: float = 0.0):
+        super().__init__(keywords=["PM"], fetcher=FeedFetcher(state_file=""))
+        self.name = name
+        self.delay = delay
+
+    def scrape(self):
+        time.sleep(self.delay)
+        return [Article(title=f"{self.name} PM", url=f"https://example.com/{self.name}", source=self.name)]
+
+
+class HungScraper(QuickScraper):
+    """should_stop을 확인하지 않고 멈춘 소스 (네트워크 대기 등)"""
+
+    def __init__(self, name: str, release: threading.Event):
+        super().__init__(name)
+        self.release = release
+
+    def scrape(self):
+        self.release.wait(5)
+        return []
+
+
+class TestRunScrapers:
+    def test_hung_source_keeps_finished_results(self, monkeypatch):
+        """응답하지 않는 소스는 시간 초과로 건너뛰고, 끝난 소스의 결과는 모두 반환"""
+        monkeypatch.setattr(runner, "GRACE_SECONDS", 0.1)
+        release = threading.Event()
+        scrapers = [HungScraper("hung", release), QuickScraper("a"), QuickScraper("b", delay=0.05)]
+        started = time.monotonic()
+        try:
+            results = {result.source: result for result in run_scrapers(scrapers, max_workers=3, timeout=0.3)}
+        finally:
+            release.set()
+
+        assert time.monotonic() - started < 2
+        assert set(results) == {"hung", "a", "b"}
+        assert results["hung"].timed_out and results["hung"].failed
+        assert [article.source for article in results["a"].articles] == ["a"]
+        assert [article.source for article in results["b"].articles] == ["b"]
+
+    def test_queued_source_runs_after_others(self, monkeypatch):
+        """워커보다 소스가 많아도 대기열의 소스는 자기 제한 시간을 다 씀"""
+        monkeypatch.setattr(runner, "GRACE_SECONDS", 0.1)
+        scrapers = [QuickScraper(name, delay=0.2) for name in "abc"]
+        results = list(run_scrapers(scrapers, max_workers=2, timeout=0.3))
+        assert sorted(result.source for result in results) == ["a", "b", "c"]
+        assert all(result.articles and not result.timed_out for result in results)
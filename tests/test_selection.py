@@ -0,0 +1,60 @@
+"""프로필별 아티클 선택과 랭킹 테스트"""
+from config import KEYWORDS
+from scrapers.base import Article
+from utils.profiles import Profile
+from utils.ranking import Ranker, select_top
+
+
+def article(title: str, url: str, source: str = "test", hits: dict = None) -> Article:
+    item = Article(title=title, url=url, source=source)
+    item.keyword_hits = dict(hits or {})
+    return item
+
+
+def design_profile() -> Profile:
+    return Profile(name="design", keywords=["UX", "사용자 경험"], sources=["medium"])
+
+
+class TestProfileSelect:
+    def test_matched_source_uses_profile_keywords(self):
+        articles = [
+            article("PM이 알아야 할 UX 원칙", "https://a.com/1", hits={"PM": 1}),
+            article("PM 채용 공고", "https://a.com/2", hits={"PM": 1}),
+        ]
+        selected = design_profile().select(articles)
+        assert [a.url for a in selected] == ["https://a.com/1"]
+        assert selected[0].keyword_hits == {"UX": 1}
+        assert articles[0].keyword_hits == {"PM": 1}  # 원본은 바꾸지 않음
+
+    def test_passthrough_source_filtered_for_custom_keywords(self):
+        """키워드 필터 없이 받은 소스(Medium 등)도 프로필 키워드로 거름"""
+        articles = [
+            article("How PMs write roadmaps", "https://medium.com/1", source="Medium"),
+            article("사용자 경험 리서치 방법", "https://medium.com/2", source="Medium"),
+        ]
+        selected = design_profile().select(articles)
+        assert [a.url for a in selected] == ["https://medium.com/2"]
+
+    def test_passthrough_source_kept_for_default_keywords(self):
+        """기본 키워드 프로필은 한 프로필로 실행할 때처럼 그대로 받음"""
+        profile = Profile(name="default", keywords=list(KEYWORDS), sources=["medium"])
+        articles = [article("Roadmap tips", "https://medium.com/1", source="Medium")]
+        assert [a.url for a in profile.select(articles)] == ["https://medium.com/1"]
+
+
+class TestRanker:
+    def test_fallback_matching_uses_profile_keywords(self):
+        """매칭 결과가 없는 아티클은 프로필 키워드로 점수 계산"""
+        ranker = Ranker(keywords=["UX"], keyword_weights={})
+        ranked = ranker.score(article("PM을 위한 UX 가이드", "https://a.com/1"))
+        assert ranked.article.keyword_hits == {"UX": 1}
+
+    def test_select_top_respects_limits(self):
+        articles = [
+            article(f"UX {i}", f"https://a.com/{i}", source="a" if i < 3 else "b", hits={"UX": 3 - i % 3})
+            for i in range(6)
+        ]
+        selection = select_top(articles, limit=3, per_source=2, ranker=Ranker(keywords=["UX"], keyword_weights={}))
+        assert len(selection.selected) == 3
+        assert selection.over_quota == 2 and selection.over_limit == 1
+        assert sum(1 for ranked in selection.selected if ranked.article.source == "a") <= 2
@@ -0,0 +1,57 @@
+"""URL 정규화 테스트 - 캐시 키가 같은 글에는 같고 다른 글에는 다른지"""
+import pytest
+
+from utils.url import canonicalize_url
+
+SAME = [
+    # 스킴, www, 호스트 대소문자, 기본 포트
+    ("http://example.com/posts/1", "https://example.com/posts/1"),
+    ("https://www.example.com/posts/1", "https://example.com/posts/1"),
+    ("https://EXAMPLE.com/posts/1", "https://example.com/posts/1"),
+    ("https://example.com:443/posts/1", "https://example.com/posts/1"),
+    ("http://example.com:80/posts/1", "https://example.com/posts/1"),
+    # 끝 슬래시, fragment, 앞뒤 공백
+    ("https://example.com/posts/1/", "https://example.com/posts/1"),
+    ("https://example.com/posts/1#comments", "https://example.com/posts/1"),
+    ("  https://example.com/posts/1\n", "https://example.com/posts/1"),
+    # 퍼센트 인코딩 (인코딩 여부, 대소문자)
+    ("https://example.com/글/1", "https://example.com/%EA%B8%80/1"),
+    ("https://example.com/%ea%b8%80/1", "https://example.com/%EA%B8%80/1"),
+    ("https://example.com/a%7Eb", "https://example.com/a~b"),
+    # 쿼리 순서, 모든 호스트의 추적 파라미터
+    ("https://news.hada.io/topic?b=2&id=1", "https://news.hada.io/topic?b=2&id=1"),
+    ("https://news.hada.io/topic?id=1&b=2", "https://news.hada.io/topic?b=2&id=1"),
+    ("https://example.com/posts/1?utm_source=x&utm_medium=rss&fbclid=abc", "https://example.com/posts/1"),
+    ("https://example.com/posts/1?UTM_Campaign=x", "https://example.com/posts/1"),
+    # Medium에서만 추적용인 source, sk (하위 도메인 포함)
+    ("https://medium.com/p/abc?source=rss----1", "https://medium.com/p/abc"),
+    ("https://team.medium.com/post-abc?source=rss&sk=123", "https://team.medium.com/post-abc"),
+    ("https://twitter.com/user/status/1?ref_src=twsrc", "https://twitter.com/user/status/1"),
+]
+
+
+@pytest.mark.parametrize("url,expected", SAME)
+def test_canonical_form(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+@pytest.mark.parametrize("first,second", [
+    # 다른 사이트의 source, ref는 글을 고를 수 있으므로 유지
+    ("https://example.com/view?source=a", "https://example.com/view?source=b"),
+    ("https://example.com/article?ref=1", "https://example.com/article?ref=2"),
+    ("https://news.hada.io/topic?id=1", "https://news.hada.io/topic?id=2"),
+    ("https://example.com/posts/1", "https://example.org/posts/1"),
+    ("https://example.com:8080/posts/1", "https://example.com/posts/1"),
+])
+def test_distinct_urls_stay_distinct(first, second):
+    assert canonicalize_url(first) != canonicalize_url(second)
+
+
+def test_source_kept_outside_medium():
+    assert canonicalize_url("https://example.com/view?source=a") == "https://example.com/view?source=a"
+    assert canonicalize_url("https://notmedium.com/p?source=a") == "https://notmedium.com/p?source=a"
+
+
+@pytest.mark.parametrize("value", ["", "not a url", "mailto:pm@example.com", "/relative/path"])
+def test_non_http_values_are_only_stripped(value):
+    assert canonicalize_url(f" {value} ") == value
@@ -1,3 +1,5 @@
-from .cache import Cache
+from .cache import Cache, open_cache
+from .http import HttpClient, get_client
+from .url import canonicalize_url
 
-__all__ = ["Cache"]
+__all__ = ["Cache", "open_cache", "HttpClient", "get_client", "canonicalize_url"]
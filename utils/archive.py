@@ -0,0 +1,178 @@
+"""원본 응답 보관 모듈
+
+실행마다 받은 피드/페이지 원본을 내용 해시(SHA-256)로 압축 저장하고,
+실행 ID별 목록(runs/<실행 ID>.json)에 어떤 URL에서 어떤 내용을 받았는지 기록합니다.
+같은 내용은 한 번만 저장되므로 변경 없는 피드는 용량을 차지하지 않습니다.
+
+  archive/
+  ├── objects/ab/abcdef....gz   # 내용 해시로 찾는 압축 본문
+  └── runs/20261017-090000-123456-4242.json  # 실행 목록 (응답, 커서, 이미 전송한 URL)
+
+`python main.py --replay <실행 ID>`는 이 목록으로 네트워크 없이 파싱/필터링/랭킹을 다시 실행합니다.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from config import ARCHIVE_DIR, ARCHIVE_KEEP_DAYS
+
+
+class ArchiveMiss(LookupError):
+    """재실행 중 보관된 응답이 없는 URL을 요청함"""
+
+
+class RawArchive:
+    """실행 하나의 원본 응답 보관소 (기록 또는 재실행용)"""
+
+    def __init__(self, run_id: str, root: str = ARCHIVE_DIR, mode: str = "run"):
+        self.root = Path(root)
+        self.run_id = run_id
+        self.mode = mode
+        self.started_at = datetime.now()
+        self.replaying = False
+        self.responses: dict[str, dict] = {}   # URL → {"kind", "source", "status", "sha256", "size"}
+        self.cursors: dict[str, dict] = {}     # 실행 시작 시점의 피드 커서
+        self.sources: list[str] = []           # 실행한 소스 (등록 순서)
+        self.already_sent: set[str] = set()    # 캐시 때문에 제외된 정규화 URL
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / "runs" / f"{self.run_id}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.gz"
+
+    def record(self, kind: str, source: str, url: str, status: int, content: bytes = b"") -> None:
+        """응답 기록 (본문은 내용 해시로 저장, 이미 있으면 건너뜀)"""
+        digest = hashlib.sha256(content).hexdigest() if content else None
+        if digest:
+            path = self._object_path(digest)
+            try:
+                # 이미 있는 본문은 수정 시각만 갱신 (목록을 저장하기 전인 실행의 본문을 prune이 지우지 않도록)
+                os.utime(path)
+            except FileNotFoundError:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(gzip.compress(content, compresslevel=6))
+                os.replace(tmp_path, path)
+
+        with self._lock:
+            self.responses[url] = {
+                "kind": kind,
+                "source": source,
+                "status": status,
+                "sha256": digest,
+                "size": len(content),
+            }
+
+    def lookup(self, url: str) -> tuple[int, bytes]:
+        """보관된 (상태 코드, 본문) 반환 (없으면 ArchiveMiss)"""
+        entry = self.responses.get(url)
+        if entry is None:
+            raise ArchiveMiss(f"보관된 응답 없음: {url}")
+        if not entry["sha256"]:
+            return entry["status"], b""
+        return entry["status"], gzip.decompress(self._object_path(entry["sha256"]).read_bytes())
+
+    def mark_already_sent(self, urls) -> None:
+        with self._lock:
+            self.already_sent.update(urls)
+
+    def save(self) -> None:
+        """실행 목록 저장 후 보관 기간이 지난 실행 정리"""
+        with self._lock:
+            data = {
+                "run_id": self.run_id,
+                "mode": self.mode,
+                "started_at": self.started_at.isoformat(),
+                "sources": self.sources,
+                "cursors": self.cursors,
+                "already_sent": sorted(self.already_sent),
+                "responses": self.responses,
+            }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        prune(self.root, ARCHIVE_KEEP_DAYS)
+
+    @classmethod
+    def load(cls, run_id: str, root: str = ARCHIVE_DIR) -> "RawArchive":
+        """재실행용으로 실행 목록 로드 (run_id가 "latest"이면 가장 최근 실행)"""
+        if run_id == "latest":
+            runs = list_runs(root)
+            if not runs:
+                raise FileNotFoundError(f"보관된 실행이 없습니다: {root}")
+            run_id = runs[-1]
+
+        archive = cls(run_id, root)
+        with open(archive.manifest_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        archive.mode = data.get("mode", "run")
+        archive.started_at = datetime.fromisoformat(data["started_at"])
+        archive.sources = data.get("sources", [])
+        archive.cursors = data.get("cursors", {})
+        archive.already_sent = set(data.get("already_sent", []))
+        archive.responses = data.get("responses", {})
+        archive.replaying = True
+        return archive
+
+
+def list_runs(root: str = ARCHIVE_DIR) -> list[str]:
+    """보관된 실행 ID 목록 (오래된 순)"""
+    runs_dir = Path(root) / "runs"
+    if not runs_dir.exists():
+        return []
+    return sorted(path.stem for path in runs_dir.glob("*.json"))
+
+
+def prune(root, keep_days: int) -> None:
+    """keep_days보다 오래된 실행 목록을 지우고, 어느 실행에서도 참조하지 않는 본문 중 keep_days보다 오래된 것 삭제
+
+    다른 프로세스에서 진행 중인 실행은 아직 목록을 저장하지 않았으므로, 최근에 쓰거나 다시 쓴 본문은 남겨 둡니다.
+    """
+    if keep_days <= 0:
+        return
+    root = Path(root)
+    cutoff = datetime.now() - timedelta(days=keep_days)
+    referenced = set()
+    for path in (root / "runs").glob("*.json"):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if datetime.fromisoformat(data["started_at"]) < cutoff:
+                path.unlink()
+                continue
+            referenced.update(entry["sha256"] for entry in data.get("responses", {}).values())
+        except (json.JSONDecodeError, IOError, KeyError, ValueError):
+            continue
+
+    for path in (root / "objects").glob("*/*.gz"):
+        if path.name[:-3] in referenced:
+            continue
+        try:
+            if datetime.fromtimestamp(path.stat().st_mtime) < cutoff:
+                path.unlink()
+        except FileNotFoundError:
+            continue
+
+
+_current: Optional[RawArchive] = None
+
+
+def set_archive(archive: Optional[RawArchive]) -> None:
+    """현재 실행의 보관소 지정 (None이면 보관하지 않음)"""
+    global _current
+    _current = archive
+
+
+def get_archive() -> Optional[RawArchive]:
+    """현재 실행의 보관소 (보관하지 않으면 None)"""
+    return _current
@@ -0,0 +1,188 @@
+"""아티클 보관 및 전문 검색 모듈
+
+스크래핑한 아티클을 SQLite(ARTICLE_DB_FILE)에 정규화 URL 기준으로 쌓고,
+FTS5 인덱스로 제목/요약/작성자를 검색합니다 (`python main.py --search "프로덕트 로드맵"`).
+
+- 실행마다 한 트랜잭션으로 저장 (이미 있는 글은 마지막 확인 시각과 내용만 갱신)
+- 검색어의 각 단어는 접두어로 검색하므로 "로드맵"으로 "로드맵을", "로드맵과"도 찾음
+- 결과는 BM25 점수 순 (제목 일치에 가중치)
+"""
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Optional
+
+from config import ARTICLE_DB_FILE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    canonical_url TEXT NOT NULL UNIQUE,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT,
+    source TEXT NOT NULL,
+    author TEXT,
+    published_at TEXT,
+    keyword_hits TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    sent_at TEXT
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, author, source,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, summary, author, source)
+    VALUES (new.id, new.title, new.summary, new.author, new.source);
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, summary, author, source)
+    VALUES ('delete', old.id, old.title, old.summary, old.author, old.source);
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF title, summary, author, source ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, summary, author, source)
+    VALUES ('delete', old.id, old.title, old.summary, old.author, old.source);
+    INSERT INTO articles_fts(rowid, title, summary, author, source)
+    VALUES (new.id, new.title, new.summary, new.author, new.source);
+END;
+"""
+
+# bm25 열 가중치 (title, summary, author, source)
+BM25_WEIGHTS = (10.0, 2.0, 1.0, 1.0)
+
+
+@dataclass
+class SearchResult:
+    """검색 결과 한 건"""
+
+    title: str
+    url: str
+    source: str
+    published_at: Optional[str]
+    sent_at: Optional[str]
+    snippet: str
+    score: float  # bm25 (작을수록 관련도 높음)
+
+
+def build_query(text: str) -> str:
+    """검색어를 FTS5 쿼리로 변환 (단어마다 접두어 검색, 모든 단어 포함)"""
+    terms = [term.replace('"', '""') for term in text.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+
+class ArticleStore:
+    """스크래핑한 아티클 보관소 (SQLite + FTS5)"""
+
+    def __init__(self, db_file: str = ARTICLE_DB_FILE):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(db_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # 데몬이 쓰는 중에도 검색 가능
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def add(self, articles: Iterable, seen_at: Optional[datetime] = None) -> int:
+        """아티클 저장 (같은 정규화 URL은 내용과 마지막 확인 시각 갱신), 저장한 건수 반환"""
+        seen = (seen_at or datetime.now()).isoformat(timespec="seconds")
+        rows = [
+            (
+                article.canonical_url,
+                article.url,
+                article.title,
+                article.summary,
+                article.source,
+                article.author,
+                article.published_at.isoformat() if article.published_at else None,
+                json.dumps(article.keyword_hits, ensure_ascii=False) if article.keyword_hits else None,
+                seen,
+                seen,
+            )
+            for article in articles
+        ]
+        if not rows:
+            return 0
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO articles (canonical_url, url, title, summary, source, author,
+                                      published_at, keyword_hits, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(canonical_url) DO UPDATE SET
+                    url = excluded.url,
+                    title = excluded.title,
+                    summary = COALESCE(excluded.summary, articles.summary),
+                    author = COALESCE(excluded.author, articles.author),
+                    published_at = COALESCE(excluded.published_at, articles.published_at),
+                    keyword_hits = COALESCE(excluded.keyword_hits, articles.keyword_hits),
+                    last_seen = excluded.last_seen
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def mark_sent(self, articles: Iterable, sent_at: Optional[datetime] = None) -> None:
+        """슬랙으로 전송한 아티클 표시"""
+        sent = (sent_at or datetime.now()).isoformat(timespec="seconds")
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE articles SET sent_at = ? WHERE canonical_url = ?",
+                [(sent, article.canonical_url) for article in articles],
+            )
+
+    def search(self, text: str, limit: int = 20, source: Optional[str] = None) -> list[SearchResult]:
+        """검색어와 관련도 높은 순으로 아티클 반환"""
+        query = build_query(text)
+        if not query:
+            return []
+        sql = f"""
+            SELECT a.title, a.url, a.source, a.published_at, a.sent_at,
+                   snippet(articles_fts, -1, '[', ']', '…', 12),
+                   bm25(articles_fts, {", ".join(str(w) for w in BM25_WEIGHTS)}) AS score
+            FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+        """
+        params: list = [query]
+        if source:
+            sql += " AND a.source = ?"
+            params.append(source)
+        sql += " ORDER BY score, a.published_at DESC LIMIT ?"
+        params.append(limit)
+        return [SearchResult(*row) for row in self.conn.execute(sql, params)]
+
+
+def print_search(text: str, limit: int = 20, source: Optional[str] = None, db_file: str = ARTICLE_DB_FILE) -> None:
+    """검색 결과 출력 (--search)"""
+    if not os.path.exists(db_file):
+        print(f"보관된 아티클이 없습니다: {db_file} (--run 또는 데몬 모드로 실행하면 저장됩니다)")
+        return
+    store = ArticleStore(db_file)
+    try:
+        started = time.perf_counter()
+        results = store.search(text, limit=limit, source=source)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        total = len(store)
+    finally:
+        store.close()
+
+    print(f'"{text}" 검색 결과 {len(results)}건 (전체 {total}개 중, {elapsed_ms:.1f}ms)\n')
+    for rank, result in enumerate(results, 1):
+        published = result.published_at[:10] if result.published_at else "날짜 없음"
+        sent = "  ✓ 전송됨" if result.sent_at else ""
+        print(f"{rank:2d}. [{result.source}] {result.title}{sent}")
+        print(f"    {published}  {result.url}")
+        if result.snippet:
+            print(f"    {result.snippet}")
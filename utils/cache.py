@@ -1,55 +1,370 @@
-"""중복 방지용 캐시 모듈"""
+"""중복 방지용 캐시 모듈
+
+전송한 URL(정규화 키)을 추가 전용 로그 파일(CACHE_FILE)에 전송 순서대로 한 줄씩 기록합니다.
+한 줄은 `전송 시각(유닉스 초)<TAB>소스<TAB>URL`이며, URL만 있는 이전 줄은 파일 수정 시각에 보낸 것으로 봅니다.
+- mark_sent는 메모리에 모아 두었다가 CACHE_FSYNC_BATCH개마다(또는 save()에서) 한 번에 추가하고 fsync
+- 파일을 통째로 다시 쓰지 않으므로 저장 비용은 이력 크기가 아니라 새로 추가한 URL 수에 비례
+- 보관 기간(CACHE_TTL_DAYS)이 지났거나 최대 항목 수(CACHE_MAX_ENTRIES)를 넘으면 오래 전에 보낸 것부터 메모리에서 내보냄
+  (CACHE_SOURCE_POLICIES로 소스별로 따로 지정). CACHE_HISTORY이면 내보낸 URL은 전송 이력(utils.sent_history)으로
+  옮겨 블룸 필터와 디스크 색인으로 계속 확인하고, 아니면 잊음
+- 로그에 지운 항목이나 중복이 쌓이면 현재 목록만 전송 순서대로 임시 파일에 쓰고 원자적으로 교체(compaction)
+- 쓰는 도중 중단되어 마지막 줄이 잘렸으면 그 줄만 버림
+- 이전 형식(cache.json, {"urls": [...]})은 처음 불러올 때 읽어서 로그로 옮김
+"""
 import json
 import os
-from datetime import datetime
-from typing import Set
+import threading
+import time
+from collections import deque
+from typing import Iterable, Optional, Union
+
+from config import (
+    CACHE_FILE,
+    CACHE_FSYNC_BATCH,
+    CACHE_COMPACT_RATIO,
+    CACHE_COMPACT_MIN_LINES,
+    CACHE_TTL_DAYS,
+    CACHE_MAX_ENTRIES,
+    CACHE_SOURCE_POLICIES,
+    CACHE_HISTORY,
+    CACHE_BACKEND,
+)
+from .index_cache import IndexCache
+from .sent_history import SentHistory
+from .sqlite_cache import SqliteCache
+from .url import canonicalize_url
+
+DEFAULT_GROUP = ""  # 소스별 정책이 없는 소스들이 함께 쓰는 삭제 순서
+ENTRY_BYTES = 180  # 메모리에 둔 항목 하나의 대략적인 크기 (키 글자 수 제외, 문자열/dict/tuple/deque 포함)
+
+
+def _legacy_path(path: str) -> Optional[str]:
+    """같은 이름의 이전 형식 파일 경로 (cache.log → cache.json)"""
+    root, ext = os.path.splitext(path)
+    return None if ext == ".json" else f"{root}.json"
 
-from config import CACHE_FILE
+
+def _fsync_dir(path: str) -> None:
+    """rename이 디스크에 반영되도록 디렉터리 fsync (지원하지 않는 OS는 건너뜀)"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _format_line(key: str, sent_at: float, source: str) -> str:
+    return f"{int(sent_at)}\t{source}\t{key}\n"
 
 
 class Cache:
-    """이미 전송한 글의 URL을 저장하여 중복 전송 방지"""
+    """이미 전송한 글의 URL을 저장하여 중복 전송 방지
+
+    URL은 정규화한 키(canonicalize_url)로 저장하므로 추적 파라미터나
+    http/https 차이가 있어도 같은 글로 판단합니다. cache_file이 비어 있으면 파일 없이 메모리에만 둡니다.
+
+    sent_urls는 키 → (전송 시각, 소스)를 전송 순서대로 담습니다. 삭제 순서는 정책 그룹(소스별 정책이 있는
+    소스는 소스마다, 나머지는 함께)마다 deque로 따로 두므로 가장 오래된 항목을 앞에서부터 O(1)에 지웁니다.
+    """
 
-    def __init__(self, cache_file: str = CACHE_FILE):
+    def __init__(
+        self,
+        cache_file: str = CACHE_FILE,
+        fsync_batch: int = CACHE_FSYNC_BATCH,
+        ttl_days: float = CACHE_TTL_DAYS,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        source_policies: Optional[dict[str, tuple[float, int]]] = None,
+        history: bool = CACHE_HISTORY,
+    ):
         self.cache_file = cache_file
-        self.sent_urls: Set[str] = set()
+        self.fsync_batch = max(1, fsync_batch)
+        self.default_policy = (ttl_days, max_entries)
+        self.source_policies = CACHE_SOURCE_POLICIES if source_policies is None else source_policies
+        self.sent_urls: dict[str, tuple[float, str]] = {}
+        self._groups: dict[str, deque[str]] = {}     # 정책 그룹 → 전송 순서대로의 키
+        self._pending: list[str] = []                # 아직 로그에 쓰지 않은 줄
+        self._log_lines = 0                          # 로그 파일의 줄 수 (compaction 판단용)
+        self._needs_rewrite = False                  # 로그만으로는 현재 목록을 만들 수 없음 (이전 형식)
+        self._compacting: Optional[list[str]] = None  # compaction 중에 로그에 추가된 줄
+        self._compactor: Optional[threading.Thread] = None
+        self._lock = threading.RLock()
+        # 메모리에서 내보낸 URL (캐시 파일 이름에서 확장자를 뺀 경로.history/.bloom)
+        self.history = SentHistory(os.path.splitext(cache_file)[0]) if cache_file and history else None
+        # 내보내기는 save()/compact_caches에서만 (읽기만 하는 실행(--test)은 이력 파일을 건드리지 않음)
         self._load()
 
+    def _group(self, source: str) -> deque:
+        name = source if source in self.source_policies else DEFAULT_GROUP
+        group = self._groups.get(name)
+        if group is None:
+            group = self._groups[name] = deque()
+        return group
+
     def _load(self) -> None:
-        """캐시 파일에서 URL 목록 로드"""
-        if os.path.exists(self.cache_file):
+        """로그 파일에서 URL 목록 로드 (없으면 이전 형식 파일에서)"""
+        if not self.cache_file:
+            return
+        if not os.path.exists(self.cache_file):
+            legacy = _legacy_path(self.cache_file)
+            if legacy and os.path.exists(legacy):
+                self._load_legacy(legacy)
+            return
+
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = f.read()
+            mtime = os.path.getmtime(self.cache_file)
+        except IOError:
+            return
+        if data[:64].lstrip()[:1] == b"{":
+            self._load_legacy(self.cache_file)
+            return
+
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            # 추가하던 중 중단되어 잘린 마지막 줄은 버림 (다음 추가가 그 줄에 이어 붙지 않도록 파일도 자름)
+            data = data[:end]
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.sent_urls = set(data.get("urls", []))
-            except (json.JSONDecodeError, IOError):
-                self.sent_urls = set()
+                os.truncate(self.cache_file, end)
+            except OSError:
+                self._needs_rewrite = True
+        text = data.decode("utf-8", errors="replace")
+        lines = text.split("\n")
+        lines.pop()  # 마지막 줄바꿈 뒤의 빈 문자열
+        self._log_lines = len(lines)
+        if self._load_fields(text.replace("\n", "\t").split("\t"), len(lines)):
+            return
 
-    def save(self) -> None:
-        """캐시 파일에 URL 목록 저장"""
-        data = {
-            "urls": list(self.sent_urls),
-            "last_updated": datetime.now().isoformat(),
+        entries = self.sent_urls
+        for line in lines:
+            parts = line.split("\t", 2)
+            if len(parts) == 3:
+                try:
+                    sent_at = float(parts[0])
+                except ValueError:
+                    continue
+                # 지운 뒤 다시 보낸 URL은 로그에 두 번 있으므로 나중 줄(다시 보낸 시각과 순서)을 씀
+                entries.pop(parts[2], None)
+                entries[parts[2]] = (sent_at, parts[1])
+            elif parts[0] and parts[0] not in entries:
+                # 전송 시각이 없는 이전 줄은 마지막으로 저장한 시각에 보낸 것으로 봄
+                entries[parts[0]] = (mtime, "")
+        self._build_groups()
+
+    def _load_fields(self, fields: list[str], count: int) -> bool:
+        """모든 줄이 세 칸이고 중복이 없으면 (대부분의 경우) 줄마다 나누지 않고 한 번에 로드"""
+        if len(fields) != count * 3 + 1:
+            return False
+        keys, sources = fields[2::3], fields[1::3]
+        try:
+            entries = dict(zip(keys, zip(map(float, fields[0:-1:3]), sources)))
+        except ValueError:
+            return False
+        if len(entries) != count:
+            return False
+        self.sent_urls = entries
+        if self.source_policies.keys().isdisjoint(sources):
+            self._groups = {DEFAULT_GROUP: deque(keys)} if keys else {}
+        else:
+            self._build_groups()
+        return True
+
+    def _load_legacy(self, path: str) -> None:
+        """이전 형식(JSON)에서 로드 (다음 저장에서 로그로 다시 씀)"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            sent_at = os.path.getmtime(path)
+            # 정규화 이전에 저장된 URL도 같은 키로 변환
+            self.sent_urls = {canonicalize_url(url): (sent_at, "") for url in data.get("urls", [])}
+        except (json.JSONDecodeError, IOError):
+            self.sent_urls = {}
+        self._build_groups()
+        self._needs_rewrite = True
+
+    def _build_groups(self) -> None:
+        self._groups = {}
+        for key, (_, source) in self.sent_urls.items():
+            self._group(source).append(key)
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """보관 기간이 지났거나 최대 항목 수를 넘은 항목을 오래 전에 보낸 것부터 삭제하고 삭제 수 반환
+
+        지운 항목은 로그에 남아 있다가 compaction에서 빠지며, 그 전에 다시 불러오면 다음 save()에서 같은 기준으로 다시 지워집니다.
+        전송 이력이 있으면 지운 항목을 로그에서 빠지기 전에 이력에 먼저 저장합니다.
+        """
+        now = time.time() if now is None else now
+        evicted = []
+        with self._lock:
+            for name, group in self._groups.items():
+                ttl_days, max_entries = self.source_policies.get(name, self.default_policy)
+                cutoff = now - ttl_days * 86400 if ttl_days > 0 else None
+                while group:
+                    over = max_entries > 0 and len(group) > max_entries
+                    if not over and (cutoff is None or self.sent_urls[group[0]][0] >= cutoff):
+                        break
+                    key = group.popleft()
+                    del self.sent_urls[key]
+                    evicted.append(key)
+            if evicted and self.history is not None:
+                self.history.add(evicted)
+        return len(evicted)
+
+    def __len__(self) -> int:
+        """메모리에 둔 최근 항목 수"""
+        return len(self.sent_urls)
+
+    def memory_usage(self) -> dict[str, int]:
+        """메모리 사용량 추정 (바이트): 최근 항목, 전송 이력 블룸 필터"""
+        with self._lock:
+            entries = sum(len(key) for key in self.sent_urls) + ENTRY_BYTES * len(self.sent_urls)
+        return {
+            "entries": len(self.sent_urls),
+            "entries_bytes": entries,
+            "history": len(self.history) if self.history is not None else 0,
+            "bloom_bytes": self.history.memory_usage() if self.history is not None else 0,
         }
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def save(self) -> None:
+        """오래된 항목을 지우고 추가된 URL을 로그에 기록 (불필요한 줄이 많으면 백그라운드로 정리)"""
+        self.evict()
+        with self._lock:
+            self._flush()
+            compact = self._should_compact()
+        if compact:
+            self.compact(background=True)
+
+    def _flush(self) -> None:
+        """모아 둔 줄을 로그 끝에 한 번에 추가하고 fsync (잠금을 잡은 상태에서 호출)"""
+        if not self._pending or not self.cache_file:
+            self._pending.clear()
+            return
+        with open(self.cache_file, "a", encoding="utf-8") as f:
+            f.write("".join(self._pending))
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_lines += len(self._pending)
+        if self._compacting is not None:
+            self._compacting.extend(self._pending)
+        self._pending.clear()
+
+    def _should_compact(self) -> bool:
+        if not self.cache_file:
+            return False
+        if self._needs_rewrite:
+            return True
+        return (
+            self._log_lines >= CACHE_COMPACT_MIN_LINES
+            and self._log_lines > CACHE_COMPACT_RATIO * len(self.sent_urls)
+        )
+
+    def compact(self, background: bool = False) -> None:
+        """현재 목록만 전송 순서대로 담은 새 로그로 교체 (임시 파일에 쓰고 fsync한 뒤 rename)
+
+        background=True이면 별도 스레드에서 정리하며, 그동안 추가된 URL도 새 로그에 포함됩니다.
+        프로세스는 정리가 끝날 때까지 종료되지 않습니다 (daemon 스레드가 아님).
+        """
+        if not self.cache_file:
+            return
+        if background:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(target=self._compact, name="cache-compact")
+            self._compactor.start()
+            return
+        self.wait()
+        self._compact()
+
+    def wait(self) -> None:
+        """진행 중인 백그라운드 정리가 끝날 때까지 대기"""
+        if self._compactor is not None:
+            self._compactor.join()
+
+    def _compact(self) -> None:
+        with self._lock:
+            self._flush()
+            snapshot = [_format_line(key, sent_at, source) for key, (sent_at, source) in self.sent_urls.items()]
+            self._compacting = []
+            self._needs_rewrite = False
+
+        tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write("".join(snapshot))
+                f.flush()
+                os.fsync(f.fileno())
+
+            with self._lock:
+                # 임시 파일을 쓰는 동안 로그에 추가된 줄을 옮겨 적은 뒤 교체
+                self._flush()
+                added, self._compacting = self._compacting, None
+                if added:
+                    with open(tmp_path, "a", encoding="utf-8") as f:
+                        f.write("".join(added))
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, self.cache_file)
+                _fsync_dir(self.cache_file)
+                self._log_lines = len(snapshot) + len(added)
+        except OSError as e:
+            print(f"캐시 정리 실패: {e}")
+            with self._lock:
+                self._compacting = None
+                self._needs_rewrite = True
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def is_sent(self, url: str) -> bool:
-        """URL이 이미 전송되었는지 확인"""
-        return url in self.sent_urls
+        """URL이 이미 전송되었는지 확인 (최근 항목에 없으면 전송 이력에서)"""
+        key = canonicalize_url(url)
+        return key in self.sent_urls or (self.history is not None and key in self.history)
+
+    def mark_sent(self, url: str, source: str = "", sent_at: Optional[float] = None) -> None:
+        """URL을 전송 완료로 표시 (CACHE_FSYNC_BATCH개가 모이면 로그에 기록)
+
+        source는 소스 이름(Article.source)으로, CACHE_SOURCE_POLICIES에서 보관 정책을 고를 때 씁니다.
+        """
+        key = canonicalize_url(url)
+        sent_at = time.time() if sent_at is None else sent_at
+        with self._lock:
+            if key in self.sent_urls:
+                return
+            self.sent_urls[key] = (sent_at, source)
+            self._group(source).append(key)
+            self._pending.append(_format_line(key, sent_at, source))
+            if len(self._pending) >= self.fsync_batch:
+                self._flush()
 
-    def mark_sent(self, url: str) -> None:
-        """URL을 전송 완료로 표시"""
-        self.sent_urls.add(url)
+    def mark_sent_many(self, entries: Iterable[tuple[str, str]], sent_at: Optional[float] = None) -> None:
+        """(URL, 소스) 목록을 전송 완료로 표시"""
+        for url, source in entries:
+            self.mark_sent(url, source, sent_at)
 
     def filter_new(self, urls: list[str]) -> list[str]:
-        """새로운 URL만 필터링"""
-        return [url for url in urls if not self.is_sent(url)]
-
-    def cleanup(self, max_entries: int = 10000) -> None:
-        """캐시 크기 제한 (오래된 항목 삭제)"""
-        if len(self.sent_urls) > max_entries:
-            # 가장 오래된 항목부터 삭제 (set이므로 순서 보장 안됨, 랜덤 삭제)
-            excess = len(self.sent_urls) - max_entries
-            urls_list = list(self.sent_urls)
-            self.sent_urls = set(urls_list[excess:])
+        """새로운 URL만 필터링 (최근 항목에 없는 URL은 전송 이력에서 한 번에 확인)"""
+        candidates = [(url, key) for url, key in zip(urls, map(canonicalize_url, urls)) if key not in self.sent_urls]
+        if self.history is None or not candidates:
+            return [url for url, _ in candidates]
+        found = self.history.contains_many([key for _, key in candidates])
+        return [url for (url, _), hit in zip(candidates, found) if not hit]
+
+    def claim(self, urls: list[str]) -> set[str]:
+        """보내기 전에 아직 보내지 않은 URL 선점 (한 프로세스에서만 쓰므로 새 URL을 그대로 반환)"""
+        return set(self.filter_new(urls))
+
+    def release(self, urls: Iterable[str]) -> None:
+        """보내지 못한 URL의 선점 해제 (선점을 기록하지 않으므로 할 일 없음)"""
+
+
+def open_cache(cache_file: str = CACHE_FILE) -> Union[Cache, SqliteCache, IndexCache]:
+    """CACHE_BACKEND에 맞는 캐시 열기 (sqlite: 여러 프로세스가 함께 쓰는 SQLite, index: mmap 지문 색인, log: 추가 전용 로그)"""
+    if CACHE_BACKEND == "sqlite" and cache_file:
+        return SqliteCache(cache_file)
+    if CACHE_BACKEND == "index" and cache_file:
+        return IndexCache(cache_file)
+    return Cache(cache_file)
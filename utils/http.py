@@ -0,0 +1,169 @@
+"""공용 HTTP 클라이언트 모듈
+
+호스트별 keep-alive 연결 풀을 재사용하는 requests.Session 하나를
+스크래퍼(피드 요청, 지난 페이지 채우기)와 슬랙 알림이 함께 사용합니다.
+QA 자동화(qa/)와 분석(analytics/) 도구는 이 설정(config.py)에 의존하지 않도록 각자 세션을 씁니다.
+- gzip/deflate (brotli 설치 시 br 포함) 압축 협상
+- 기본 타임아웃 적용
+- 일시적 오류(연결 실패, 429/5xx)에 대한 지수 백오프 재시도
+- 호스트별 요청 수, 소요 시간, 전송량 집계
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from config import HTTP_TIMEOUT, HTTP_RETRIES, HTTP_BACKOFF, HTTP_POOL_SIZE
+
+# urllib3가 디코딩할 수 있는 인코딩만 요청 (brotli 패키지가 있으면 br 포함)
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+
+@dataclass
+class HostStats:
+    """호스트별 요청 통계"""
+
+    requests: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    bytes_received: int = 0  # 압축 해제 후 본문 크기
+    bytes_on_wire: int = 0   # 실제 수신한(압축된) 본문 크기
+
+    @property
+    def avg_ms(self) -> float:
+        return self.elapsed / self.requests * 1000 if self.requests else 0.0
+
+
+class HttpClient:
+    """연결 풀과 재시도, 요청 통계를 갖춘 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        timeout: float = HTTP_TIMEOUT,
+        retries: int = HTTP_RETRIES,
+        backoff: float = HTTP_BACKOFF,
+        pool_size: int = HTTP_POOL_SIZE,
+    ):
+        self.timeout = timeout
+        self.stats: dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUS,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+        **kwargs,
+    ) -> requests.Response:
+        """요청 전송 (timeout을 주지 않으면 기본 타임아웃 사용)
+
+        본문을 모두 읽은 뒤 반환하므로 연결은 곧바로 풀로 돌아갑니다.
+        stream=True이면 헤더까지만 읽고 반환하며, 본문은 iter_content()로 읽습니다.
+        """
+        host = urlsplit(url).netloc
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, url, timeout=timeout or self.timeout, stream=stream, **kwargs)
+            if stream:
+                self._record(host, time.monotonic() - started)
+                return response
+            content = response.content
+        except requests.RequestException:
+            self._record(host, time.monotonic() - started, error=True)
+            raise
+
+        wire = response.raw.tell() if hasattr(response.raw, "tell") else len(content)
+        self._record(host, time.monotonic() - started, received=len(content), wire=wire)
+        return response
+
+    def iter_content(self, response: requests.Response, chunk_size: int = 16 * 1024) -> Iterator[bytes]:
+        """stream=True로 받은 응답 본문을 조각 단위로 반환
+
+        중간에 읽기를 멈추면(제너레이터 close) 나머지 본문은 받지 않고 연결을 닫습니다.
+        소요 시간과 전송량은 읽은 만큼만 집계합니다.
+        """
+        host = urlsplit(response.url).netloc
+        started = time.monotonic()
+        received = 0
+        try:
+            for chunk in response.iter_content(chunk_size):
+                received += len(chunk)
+                yield chunk
+        finally:
+            wire = response.raw.tell() if hasattr(response.raw, "tell") else received
+            response.close()
+            self._record(host, time.monotonic() - started, received=received, wire=wire, count=False)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def _record(
+        self,
+        host: str,
+        elapsed: float,
+        received: int = 0,
+        wire: int = 0,
+        error: bool = False,
+        count: bool = True,
+    ) -> None:
+        with self._lock:
+            stats = self.stats.setdefault(host, HostStats())
+            stats.requests += int(count)
+            stats.errors += int(error)
+            stats.elapsed += elapsed
+            stats.bytes_received += received
+            stats.bytes_on_wire += wire
+
+    def summary_lines(self) -> list[str]:
+        """호스트별 요청 통계 요약"""
+        lines = []
+        with self._lock:
+            for host, stats in sorted(self.stats.items(), key=lambda item: item[1].elapsed, reverse=True):
+                lines.append(
+                    f"{host:<28} {stats.requests}회  평균 {stats.avg_ms:.0f}ms  "
+                    f"수신 {stats.bytes_on_wire / 1024:.1f}KB (해제 후 {stats.bytes_received / 1024:.1f}KB)"
+                    + (f"  오류 {stats.errors}회" if stats.errors else "")
+                )
+        return lines
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """프로세스 공용 HTTP 클라이언트 반환"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,112 @@
+"""지문 색인 중복 방지 캐시 모듈 (CACHE_BACKEND=index)
+
+`--test`처럼 URL 100개 정도만 확인하고 끝나는 짧은 실행에서는 캐시 로그 전체를 메모리에 불러오는 시간이 아깝습니다.
+이 백엔드는 캐시 파일 옆의 정렬된 64비트 지문 파일(cache.log → cache.fp)을 mmap으로 열어 이진 탐색하므로,
+이력이 얼마나 크든 시작할 때 읽는 것은 델타 로그(cache.fp.delta, 최대 CACHE_DELTA_MAX개)뿐입니다.
+- filter_new: URL 묶음의 지문을 한 번에 조회 (NumPy가 있으면 searchsorted 한 번)
+- mark_sent: CACHE_FSYNC_BATCH개씩 모아 델타 로그에 추가하고 fsync
+- compact: 델타 로그를 정렬된 파일에 바로 병합
+
+지문만 저장하므로 전송 시각과 소스가 없어 보관 기준(CACHE_TTL_DAYS 등)은 쓰지 않고 모든 이력을 계속 가집니다.
+파일이 없으면 처음 열 때 기존 캐시 로그와 전송 이력을 옮깁니다.
+"""
+import os
+from typing import Iterable, Optional
+
+from config import CACHE_FSYNC_BATCH
+from .sent_history import FingerprintIndex, SentHistory, fingerprint
+from .url import canonicalize_url
+
+
+class IndexCache:
+    """Cache와 같은 방식으로 쓰는 지문 색인 캐시 (불러오기 비용이 이력 크기와 무관)"""
+
+    def __init__(self, cache_file: str, fsync_batch: int = CACHE_FSYNC_BATCH):
+        self.cache_file = cache_file
+        self.index_file = f"{os.path.splitext(cache_file)[0]}.fp"
+        self.fsync_batch = max(1, fsync_batch)
+        migrate = not os.path.exists(self.index_file) and not os.path.exists(f"{self.index_file}.delta")
+        self.index = FingerprintIndex(self.index_file)
+        self._pending: dict[int, None] = {}  # 아직 델타 로그에 쓰지 않은 지문 (순서 유지)
+        if migrate:
+            self._migrate()
+
+    def _migrate(self) -> None:
+        """기존 캐시 로그(또는 cache.json)와 전송 이력의 지문을 옮김"""
+        from .cache import Cache  # cache 모듈이 이 모듈을 불러오므로 여기서
+
+        old = Cache(self.cache_file, ttl_days=0, max_entries=0, history=False)
+        fingerprints = [fingerprint(key) for key in old.sent_urls]
+        history = SentHistory(os.path.splitext(self.cache_file)[0])
+        if len(history):
+            fingerprints.extend(history.read_index())
+        moved = self.index.add(fingerprints)
+        if moved:
+            self.index.merge()
+            print(f"캐시 {moved}개를 {self.index_file}로 옮겼습니다")
+
+    def close(self) -> None:
+        self.save()
+        self.index.close()
+
+    def __len__(self) -> int:
+        return len(self.index) + len(self._pending)
+
+    def is_sent(self, url: str) -> bool:
+        """URL이 이미 전송되었는지 확인"""
+        fp = fingerprint(canonicalize_url(url))
+        return fp in self._pending or fp in self.index
+
+    def filter_new(self, urls: list[str]) -> list[str]:
+        """새로운 URL만 필터링 (색인에서 한 번에 조회)"""
+        fingerprints = [fingerprint(canonicalize_url(url)) for url in urls]
+        found = self.index.contains_many(fingerprints)
+        return [url for url, fp, hit in zip(urls, fingerprints, found) if not hit and fp not in self._pending]
+
+    def mark_sent(self, url: str, source: str = "", sent_at: Optional[float] = None) -> None:
+        """URL을 전송 완료로 표시 (CACHE_FSYNC_BATCH개가 모이면 델타 로그에 기록, 소스와 시각은 저장하지 않음)"""
+        self._pending[fingerprint(canonicalize_url(url))] = None
+        if len(self._pending) >= self.fsync_batch:
+            self._flush()
+
+    def mark_sent_many(self, entries: Iterable[tuple[str, str]], sent_at: Optional[float] = None) -> None:
+        """(URL, 소스) 목록을 전송 완료로 표시"""
+        for url, source in entries:
+            self.mark_sent(url, source, sent_at)
+
+    def claim(self, urls: list[str]) -> set[str]:
+        """보내기 전에 아직 보내지 않은 URL 선점 (한 프로세스에서만 쓰므로 새 URL을 그대로 반환)"""
+        return set(self.filter_new(urls))
+
+    def release(self, urls: Iterable[str]) -> None:
+        """보내지 못한 URL의 선점 해제 (선점을 기록하지 않으므로 할 일 없음)"""
+
+    def _flush(self) -> None:
+        if self._pending:
+            self.index.add(self._pending)
+            self._pending = {}
+
+    def save(self) -> None:
+        """모아 둔 지문을 델타 로그에 기록 (CACHE_DELTA_MAX개가 넘으면 정렬된 파일에 병합)"""
+        self._flush()
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """모든 지문을 디스크에 두므로 내보낼 항목 없음"""
+        return 0
+
+    def compact(self, background: bool = False) -> None:
+        """델타 로그를 정렬된 파일에 병합"""
+        self._flush()
+        self.index.merge()
+
+    def wait(self) -> None:
+        pass
+
+    def memory_usage(self) -> dict[str, int]:
+        """메모리 사용량 (델타 로그 지문, 바이트. mmap으로 읽은 페이지는 OS 캐시라 제외)"""
+        return {
+            "entries": len(self),
+            "entries_bytes": self.index.memory_usage(),
+            "history": 0,
+            "bloom_bytes": 0,
+        }
@@ -0,0 +1,140 @@
+"""키워드 매칭 모듈 (Aho-Corasick)
+
+키워드 목록을 한 번 오토마톤으로 컴파일해 두고, 텍스트를 한 번만 훑어서
+어떤 키워드가 몇 번 나왔는지 계산합니다. 대소문자는 구분하지 않습니다.
+
+"PM", "PO", "UX"처럼 짧은 영문 키워드는 단어 경계 규칙을 적용할 수 있습니다.
+앞뒤 글자가 영문/숫자가 아닐 때만 인정하므로 "UPMOST", "PM2"는 제외되고
+"PM이", "UX/UI"는 매칭됩니다. 복수형 s는 붙어 있어도 인정합니다 ("PMs", "APIs").
+"""
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Iterable
+
+from config import KEYWORD_WORD_BOUNDARY, KEYWORD_BOUNDARY_MAX_LENGTH
+
+
+def _is_ascii_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def _needs_boundary(keyword: str, max_length: int) -> bool:
+    """단어 경계 규칙을 적용할 짧은 영문 키워드인지 확인"""
+    return len(keyword) <= max_length and keyword.isascii() and keyword.isalnum()
+
+
+class KeywordMatcher:
+    """여러 키워드를 한 번에 찾는 Aho-Corasick 오토마톤"""
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        word_boundary: bool = KEYWORD_WORD_BOUNDARY,
+        boundary_max_length: int = KEYWORD_BOUNDARY_MAX_LENGTH,
+    ):
+        # 대소문자만 다른 키워드는 처음 나온 표기로 합침
+        self.keywords: list[str] = []
+        patterns: dict[str, int] = {}
+        for keyword in keywords:
+            pattern = keyword.lower()
+            if pattern and pattern not in patterns:
+                patterns[pattern] = len(self.keywords)
+                self.keywords.append(keyword)
+
+        self._boundary = [
+            word_boundary and _needs_boundary(keyword, boundary_max_length)
+            for keyword in self.keywords
+        ]
+
+        # goto[state]: 문자 → 다음 상태, output[state]: (키워드 번호, 길이) 목록
+        self._goto: list[dict[str, int]] = [{}]
+        self._output: list[list[tuple[int, int]]] = [[]]
+        for pattern, index in patterns.items():
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((index, len(pattern)))
+
+        self._build_failure_links()
+
+        # 루트 상태에서는 키워드 첫 글자가 나올 때까지 정규식으로 건너뜀
+        first_chars = "".join(re.escape(char) for char in self._goto[0])
+        self._start = re.compile(f"[{first_chars}]") if first_chars else None
+
+    def _build_failure_links(self) -> None:
+        """실패 링크 계산 후 각 상태의 출력에 실패 상태의 출력을 합침"""
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> dict[str, int]:
+        """텍스트에 나온 키워드별 등장 횟수 (등장하지 않은 키워드는 제외)"""
+        hits: dict[str, int] = {}
+        if not text or not self.keywords:
+            return hits
+
+        text = text.lower()
+        goto, fail, output, boundary = self._goto, self._fail, self._output, self._boundary
+        search = self._start.search
+        length_of_text = len(text)
+        state = 0
+        position = 0
+
+        while position < length_of_text:
+            if state == 0:
+                found = search(text, position)
+                if found is None:
+                    break
+                position = found.start()
+
+            char = text[position]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for index, length in output[state]:
+                if boundary[index]:
+                    start = position - length + 1
+                    if start > 0 and _is_ascii_word_char(text[start - 1]):
+                        continue
+                    end = position + 1
+                    if end < length_of_text and text[end] == "s":  # 복수형 (PMs, APIs)
+                        end += 1
+                    if end < length_of_text and _is_ascii_word_char(text[end]):
+                        continue
+                keyword = self.keywords[index]
+                hits[keyword] = hits.get(keyword, 0) + 1
+
+            position += 1
+
+        return hits
+
+    def matches(self, text: str) -> bool:
+        """키워드가 하나라도 나오는지 확인"""
+        return bool(self.find(text))
+
+
+@lru_cache(maxsize=32)
+def _compile(keywords: tuple, word_boundary: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, word_boundary=word_boundary)
+
+
+def get_matcher(keywords: Iterable[str], word_boundary: bool = KEYWORD_WORD_BOUNDARY) -> KeywordMatcher:
+    """키워드 목록별로 컴파일된 매처 반환 (같은 목록이면 스크래퍼끼리 공유)"""
+    return _compile(tuple(keywords), word_boundary)
@@ -0,0 +1,144 @@
+"""스크래핑 파이프라인 지표 모듈
+
+실행 한 번 동안 소스별/단계별 소요 시간과 개수를 모아서
+- METRICS_FILE에 JSON 한 줄로 추가하고
+- METRICS_TEXTFILE을 지정하면 OpenMetrics 텍스트 파일로도 저장합니다
+  (node_exporter textfile collector 등에서 읽을 수 있도록 임시 파일에 쓴 뒤 교체)
+
+단계: fetch(응답 수신), parse(엔트리 읽기), strip(요약문 HTML 제거),
+keyword_filter, cache_filter, dedupe, near_dup, rank, notify
+"""
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+from config import METRICS_FILE, METRICS_TEXTFILE
+
+GLOBAL = "_all"  # 소스 구분이 없는 단계 (dedupe, rank, notify 등)
+
+
+class RunMetrics:
+    """실행 한 번의 지표 수집기 (여러 스크래퍼 스레드에서 함께 사용)"""
+
+    def __init__(self, mode: str = "run", run_id: Optional[str] = None):
+        self.mode = mode
+        # 같은 초에 시작한 실행끼리(데몬 + 수동 실행 등) 겹치지 않도록 마이크로초와 프로세스 ID를 붙임
+        self.run_id = run_id or f"{datetime.now():%Y%m%d-%H%M%S-%f}-{os.getpid()}"
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+        self.stages: dict[str, dict[str, list[float]]] = {}   # 소스 → 단계 → [초, 횟수]
+        self.counters: dict[str, dict[str, float]] = {}       # 소스 → 이름 → 값
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timer(self, source: str, stage: str) -> Iterator[None]:
+        """with 블록의 소요 시간을 source/stage에 더함"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(source, stage, time.perf_counter() - started)
+
+    def add_time(self, source: str, stage: str, seconds: float, calls: int = 1) -> None:
+        with self._lock:
+            entry = self.stages.setdefault(source, {}).setdefault(stage, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += calls
+
+    def count(self, source: str, name: str, value: float = 1) -> None:
+        with self._lock:
+            counters = self.counters.setdefault(source, {})
+            counters[name] = counters.get(name, 0) + value
+
+    def to_record(self) -> dict:
+        """JSON 한 줄로 저장할 실행 기록"""
+        with self._lock:
+            sources = {}
+            for source in sorted(set(self.stages) | set(self.counters)):
+                counters = dict(self.counters.get(source, {}))
+                hits, misses = counters.get("cache_hits", 0), counters.get("cache_misses", 0)
+                if hits + misses:
+                    counters["cache_hit_ratio"] = round(hits / (hits + misses), 4)
+                sources[source] = {
+                    "stages": {
+                        stage: {"seconds": round(seconds, 6), "calls": calls}
+                        for stage, (seconds, calls) in self.stages.get(source, {}).items()
+                    },
+                    "counters": counters,
+                }
+        return {
+            "run_id": self.run_id,
+            "mode": self.mode,
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": round(time.monotonic() - self._started, 6),
+            "sources": sources,
+        }
+
+    def write(self, path: Optional[str] = METRICS_FILE, textfile: Optional[str] = METRICS_TEXTFILE) -> dict:
+        """실행 기록을 JSON Lines 파일에 추가 (textfile이 있으면 OpenMetrics로도 저장)"""
+        record = self.to_record()
+        if path:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if textfile:
+            tmp_path = f"{textfile}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(to_openmetrics(record))
+            os.replace(tmp_path, textfile)
+        return record
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def to_openmetrics(record: dict) -> str:
+    """실행 기록을 OpenMetrics 텍스트 형식으로 변환"""
+    lines = [
+        "# TYPE scraper_run_duration_seconds gauge",
+        f'scraper_run_duration_seconds{{mode="{_escape(record["mode"])}"}} {record["duration_seconds"]}',
+        "# TYPE scraper_run_timestamp_seconds gauge",
+        f'scraper_run_timestamp_seconds{{mode="{_escape(record["mode"])}"}} '
+        f'{datetime.fromisoformat(record["started_at"]).timestamp():.0f}',
+        "# TYPE scraper_stage_seconds gauge",
+    ]
+    counter_lines: dict[str, list[str]] = {}
+    for source, data in record["sources"].items():
+        label = _escape(source)
+        for stage, values in data["stages"].items():
+            lines.append(f'scraper_stage_seconds{{source="{label}",stage="{_escape(stage)}"}} {values["seconds"]}')
+        for name, value in data["counters"].items():
+            counter_lines.setdefault(_metric_name(name), []).append(f'{{source="{label}"}} {value}')
+
+    for name, samples in sorted(counter_lines.items()):
+        lines.append(f"# TYPE scraper_{name} gauge")
+        lines.extend(f"scraper_{name}{sample}" for sample in samples)
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+_current = RunMetrics()
+_current_lock = threading.Lock()
+
+
+def start_run(mode: str = "run") -> RunMetrics:
+    """새 실행의 지표 수집 시작 (이후 get_metrics()는 이 수집기를 반환)"""
+    global _current
+    with _current_lock:
+        _current = RunMetrics(mode)
+        return _current
+
+
+def get_metrics() -> RunMetrics:
+    """현재 실행의 지표 수집기"""
+    return _current
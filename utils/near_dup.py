@@ -0,0 +1,236 @@
+"""유사 아티클(같은 보도자료 등) 묶음 모듈 - MinHash + LSH
+
+여러 매체가 같은 보도자료를 제목만 조금 바꿔 싣는 경우를 찾기 위해
+제목과 요약문을 MinHash 서명으로 만들고, 밴드별 LSH 버킷에 넣어
+비슷한 후보만 빠르게 비교합니다.
+- 한국어는 띄어쓰기와 조사가 매체마다 달라서, 공백/문장부호를 뺀 뒤 글자 3-gram으로 나눔
+- 제목과 요약문은 따로 서명을 만들어, 제목이 거의 같거나(TITLE_ONLY_THRESHOLD),
+  제목이 어느 정도(기준값의 절반) 비슷하면서 요약문이 기준값 이상 비슷하거나,
+  제목을 바꿔 실었더라도 요약문이 거의 같을 때(BODY_ONLY_THRESHOLD) 같은 묶음으로 판단
+  ("C사 … 투자 유치"/"D사 … 투자 유치", "1월 동향"/"2월 동향"처럼 틀이 같은 제목은 기준값을 넘기 쉬워서,
+  제목만으로는 기준값보다 훨씬 비슷해야 같은 글로 봄)
+  (WordPress 요약문의 "The post ... appeared first on ..." 같은 공통 문구만 겹치는 경우 제외)
+- 이미 전송한 아티클의 서명은 파일에 보관해 다음 실행에서도 비교
+"""
+import hashlib
+import json
+import os
+import random
+import re
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from config import NEAR_DUP_STATE_FILE, NEAR_DUP_THRESHOLD, NEAR_DUP_HISTORY_DAYS
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64   # 제목/요약문 서명 각각의 길이 (전체 서명은 2배)
+BANDS = 16      # 밴드당 4행 → 자카드 유사도 약 0.5부터 후보가 됨
+ROWS = NUM_PERM // BANDS
+TITLE_ONLY_THRESHOLD = 0.85  # 요약문과 관계없이 같은 글로 볼 제목 유사도
+BODY_ONLY_THRESHOLD = 0.8    # 제목과 관계없이 같은 글로 볼 요약문 유사도
+MIN_BODY_SHINGLES = 20     # 이보다 짧은 요약문은 비교하지 않음 (우연히 겹치는 짧은 문구 제외)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+EMPTY = -1  # 텍스트가 없는 부분의 서명 값 (다른 서명과 겹친 것으로 보지 않음)
+
+# 실행마다 같은 서명이 나오도록 고정 시드로 만든 해시 함수 계수
+_rng = random.Random(20240601)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_NON_WORD = re.compile(r"[\W_]+")
+_WORDPRESS_FOOTER = re.compile(r"(?:\[(?:…|\.\.\.)\])?\s*The post.*?appeared first on.*$", re.S)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """공백/문장부호를 뺀 소문자 텍스트의 글자 n-gram 집합"""
+    text = _NON_WORD.sub("", (text or "").lower())
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash(features: Iterable[str]) -> list[int]:
+    """특징 집합의 MinHash 서명 (NUM_PERM개의 정수, 빈 집합이면 EMPTY)"""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=4).digest(), "big")
+        for feature in features
+    ]
+    if not hashes:
+        return [EMPTY] * NUM_PERM
+    return [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def similarity(signature: list[int], other: list[int]) -> tuple[float, float]:
+    """두 서명으로 추정한 (제목, 요약문) 자카드 유사도"""
+    title = sum(1 for x, y in zip(signature[:NUM_PERM], other[:NUM_PERM]) if x == y != EMPTY)
+    body = sum(1 for x, y in zip(signature[NUM_PERM:], other[NUM_PERM:]) if x == y != EMPTY)
+    return title / NUM_PERM, body / NUM_PERM
+
+
+def is_near_duplicate(scores: tuple[float, float], threshold: float) -> bool:
+    """제목/요약문 유사도로 같은 글인지 판단"""
+    title, body = scores
+    if title >= max(threshold, TITLE_ONLY_THRESHOLD) or body >= max(threshold, BODY_ONLY_THRESHOLD):
+        return True
+    return title >= threshold / 2 and body >= threshold
+
+
+def article_signature(article) -> list[int]:
+    """아티클 제목 서명과 요약문 서명을 이어 붙인 MinHash 서명"""
+    body = shingles(_WORDPRESS_FOOTER.sub("", article.summary or ""))
+    if len(body) < MIN_BODY_SHINGLES:
+        body = set()
+    return minhash(shingles(article.title or "")) + minhash(body)
+
+
+class LSHIndex:
+    """서명을 밴드별 버킷에 넣어 비슷한 후보만 찾는 인덱스"""
+
+    def __init__(self):
+        self.signatures: dict[str, list[int]] = {}
+        self._buckets: dict[tuple, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def _bands(self, signature: list[int]):
+        # 제목과 요약문 서명 모두 밴드로 나눔 (둘 중 하나만 겹쳐도 후보)
+        for band in range(len(signature) // ROWS):
+            rows = signature[band * ROWS:(band + 1) * ROWS]
+            if rows[0] != EMPTY:
+                yield (band, *rows)
+
+    def add(self, key: str, signature: list[int]) -> None:
+        if key in self.signatures:
+            return
+        self.signatures[key] = signature
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, []).append(key)
+
+    def query(self, signature: list[int], threshold: float) -> list[tuple[str, float]]:
+        """threshold 기준으로 유사한 키 목록 (제목 유사도 높은 순)"""
+        candidates = set()
+        for band in self._bands(signature):
+            candidates.update(self._buckets.get(band, ()))
+
+        matches = []
+        for key in candidates:
+            scores = similarity(signature, self.signatures[key])
+            if is_near_duplicate(scores, threshold):
+                matches.append((key, scores))
+        return sorted(matches, key=lambda item: (-item[1][0], -item[1][1], item[0]))
+
+
+class NearDuplicateFilter:
+    """이번 실행의 유사 아티클을 묶고, 전송 이력과 비슷한 아티클은 제외"""
+
+    def __init__(
+        self,
+        state_file: str = NEAR_DUP_STATE_FILE,
+        threshold: float = NEAR_DUP_THRESHOLD,
+        history_days: int = NEAR_DUP_HISTORY_DAYS,
+        signatures: Optional[dict[str, list[int]]] = None,
+    ):
+        self.state_file = state_file
+        self.threshold = threshold
+        self.history_days = history_days
+        self.history: dict[str, dict] = {}  # 정규화 URL → {"signature", "sent_at"}
+        # 정규화 URL → 서명 (프로필별 필터가 같은 dict를 받으면 서명을 한 번만 계산)
+        self._signatures: dict[str, list[int]] = signatures if signatures is not None else {}
+        self._load()
+
+    def _load(self) -> None:
+        """상태 파일에서 전송 이력 서명 로드 (보관 기간이 지난 항목 제외)"""
+        if not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+
+        cutoff = datetime.now() - timedelta(days=self.history_days)
+        for key, entry in data.get("articles", {}).items():
+            try:
+                if datetime.fromisoformat(entry["sent_at"]) >= cutoff and len(entry["signature"]) == NUM_PERM * 2:
+                    self.history[key] = entry
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def save(self) -> None:
+        """전송 이력 서명 저장"""
+        data = {
+            "articles": self.history,
+            "last_updated": datetime.now().isoformat(),
+        }
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def collapse(self, articles: list) -> tuple[list, list]:
+        """유사 아티클을 묶어 대표 아티클 목록과 전송 이력과 겹쳐 제외한 아티클 목록을 반환
+
+        묶음의 대표는 가장 먼저 발행된 아티클(발행 시각이 없으면 목록 순서)이고,
+        나머지는 대표의 duplicates에 기록됩니다.
+        """
+        history_index = LSHIndex()
+        for key, entry in self.history.items():
+            history_index.add(key, entry["signature"])
+
+        index = LSHIndex()
+        group_of: dict[str, str] = {}          # 아티클 키 → 묶음 키
+        representatives: dict[str, object] = {}
+        order: list[str] = []
+        skipped = []
+
+        for article in articles:
+            key = article.canonical_url
+            signature = self._signatures.get(key)
+            if signature is None:
+                signature = self._signatures[key] = article_signature(article)
+
+            if history_index.query(signature, self.threshold):
+                skipped.append(article)
+                continue
+
+            match = index.query(signature, self.threshold)
+            index.add(key, signature)
+            if not match:
+                group_of[key] = key
+                representatives[key] = article
+                order.append(key)
+                continue
+
+            group_key = group_of[match[0][0]]
+            group_of[key] = group_key
+            leader = representatives[group_key]
+            if _published_earlier(article, leader):
+                article.duplicates = [leader, *leader.duplicates]
+                leader.duplicates = []
+                representatives[group_key] = article
+            else:
+                leader.duplicates.append(article)
+
+        return [representatives[key] for key in order], skipped
+
+    def add(self, articles: Iterable) -> None:
+        """전송한 아티클(묶인 아티클 포함)의 서명을 이력에 추가"""
+        now = datetime.now().isoformat()
+        for article in articles:
+            for item in (article, *article.duplicates):
+                key = item.canonical_url
+                signature = self._signatures.get(key) or article_signature(item)
+                self.history[key] = {"signature": signature, "sent_at": now}
+
+
+def _published_earlier(article, other) -> bool:
+    """article이 other보다 먼저 발행되었는지 (발행 시각을 모르면 False)"""
+    if article.published_at is None or other.published_at is None:
+        return False
+    return article.published_at < other.published_at
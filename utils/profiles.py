@@ -0,0 +1,147 @@
+"""프로필(팀별 다이제스트) 모듈
+
+팀마다 봇을 따로 띄우면 같은 피드를 팀 수만큼 받고 파싱하게 되므로, PROFILES_FILE(JSON)에
+팀별 키워드, 소스, 슬랙 채널, 캐시 파일을 정의해 한 실행에서 함께 처리합니다.
+피드는 모든 프로필의 소스/키워드를 합친 스크래퍼로 한 번만 받아 파싱하고,
+파싱한 아티클을 프로필마다 자기 키워드 매처로 다시 나눠 각자의 캐시와 채널로 보냅니다.
+
+  {
+    "profiles": [
+      {"name": "pm", "keywords": ["PM", "프로덕트"], "sources": ["yozm", "geeknews"],
+       "slack_channel": "C0123456"},
+      {"name": "design", "keywords": ["UX", "사용자 경험"], "slack_webhook_url": "https://hooks.slack.com/..."}
+    ]
+  }
+
+keywords/sources를 생략하면 config의 KEYWORDS/SCRAPERS_ENABLED를, 캐시 파일을 생략하면
+CACHE_FILE 옆의 cache_<이름>.log, fingerprints_<이름>.json을 씁니다.
+PROFILES_FILE이 비어 있으면 기존 설정으로 만든 기본 프로필 하나로 실행합니다.
+"""
+import copy
+import json
+import os
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from config import (
+    CACHE_FILE,
+    KEYWORDS,
+    NEAR_DUP_STATE_FILE,
+    PROFILES_FILE,
+    SCRAPERS_ENABLED,
+)
+from .keywords import get_matcher
+
+DEFAULT_PROFILE = "default"
+
+
+@dataclass
+class Profile:
+    """다이제스트를 받는 팀 하나의 설정"""
+
+    name: str
+    keywords: list[str]
+    sources: list[str]                     # 소스 키 (SCRAPERS_ENABLED 키)
+    slack_webhook_url: Optional[str] = None  # 없으면 SLACK_WEBHOOK_URL
+    slack_channel: Optional[str] = None      # 없으면 SLACK_CHANNEL (Bot Token 방식)
+    cache_file: str = CACHE_FILE
+    near_dup_state_file: str = NEAR_DUP_STATE_FILE
+
+    def select(self, articles: list) -> list:
+        """소스 하나의 스크래핑 결과에서 이 프로필의 키워드에 매칭된 아티클
+
+        프로필마다 keyword_hits가 다르므로 매칭된 아티클은 복사해서 반환합니다.
+        스크래퍼가 키워드 매칭 없이 돌려준 소스(Medium의 PM 태그, 플래텀의 매칭 실패 시 최근 글 등,
+        매칭된 아티클이 하나도 없음)는 기본 키워드(KEYWORDS)를 쓰는 프로필에만 그대로 넘기고,
+        키워드를 따로 정한 프로필은 그 키워드로 거릅니다.
+        """
+        if not any(article.keyword_hits for article in articles) and set(self.keywords) == set(KEYWORDS):
+            return [_with_hits(article, {}) for article in articles]
+
+        matcher = get_matcher(self.keywords)
+        selected = []
+        for article in articles:
+            text = f"{article.title}\n{article.summary}" if article.summary else article.title
+            hits = matcher.find(text)
+            if hits:
+                selected.append(_with_hits(article, hits))
+        return selected
+
+
+def _with_hits(article, hits: dict[str, int]):
+    """keyword_hits만 다른 아티클 복사본 (유사 아티클 묶음도 프로필마다 따로)"""
+    copied = copy.copy(article)
+    copied.keyword_hits = hits
+    copied.duplicates = []
+    return copied
+
+
+def default_profile(sources: Optional[list[str]] = None) -> Profile:
+    """config 설정으로 만든 기본 프로필 (sources를 주면 SCRAPERS_ENABLED 대신 사용)"""
+    if sources is None:
+        sources = [key for key, enabled in SCRAPERS_ENABLED.items() if enabled]
+    return Profile(name=DEFAULT_PROFILE, keywords=list(KEYWORDS), sources=list(sources))
+
+
+def load_profiles(
+    path: str = PROFILES_FILE,
+    sources: Optional[list[str]] = None,
+    known_sources: Optional[Iterable[str]] = None,
+) -> list[Profile]:
+    """프로필 목록 로드 (path가 비어 있으면 기본 프로필 하나)
+
+    sources를 주면 각 프로필의 소스를 그 안으로 제한합니다 (--sources).
+    형식이 잘못되었거나 알 수 없는 소스 키가 있으면 ValueError를 냅니다.
+    """
+    if not path:
+        return [default_profile(sources)]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"프로필 파일을 읽을 수 없습니다: {path} ({e})") from e
+
+    cache_dir = os.path.dirname(CACHE_FILE)
+    profiles = []
+    for item in data.get("profiles", []):
+        name = item.get("name")
+        if not name:
+            raise ValueError("이름(name)이 없는 프로필이 있습니다.")
+        profile_sources = item.get("sources") or default_profile().sources
+        if sources is not None:
+            profile_sources = [key for key in profile_sources if key in sources]
+        profiles.append(Profile(
+            name=name,
+            keywords=item.get("keywords") or list(KEYWORDS),
+            sources=profile_sources,
+            slack_webhook_url=item.get("slack_webhook_url") or None,
+            slack_channel=item.get("slack_channel") or None,
+            cache_file=item.get("cache_file") or os.path.join(cache_dir, f"cache_{name}.log"),
+            near_dup_state_file=item.get("near_dup_state_file") or os.path.join(cache_dir, f"fingerprints_{name}.json"),
+        ))
+
+    if not profiles:
+        raise ValueError(f"프로필이 없습니다: {path}")
+    names = [profile.name for profile in profiles]
+    if len(set(names)) != len(names):
+        raise ValueError(f"프로필 이름이 중복되었습니다: {', '.join(names)}")
+    cache_files = [profile.cache_file for profile in profiles]
+    if len(set(cache_files)) != len(cache_files):
+        raise ValueError("프로필마다 cache_file이 달라야 합니다.")
+    if known_sources is not None:
+        known = set(known_sources)
+        unknown = sorted({key for profile in profiles for key in profile.sources if key not in known})
+        if unknown:
+            raise ValueError(f"알 수 없는 소스: {', '.join(unknown)}")
+    return profiles
+
+
+def union_keywords(profiles: list[Profile]) -> list[str]:
+    """모든 프로필의 키워드 (처음 나온 순서 유지)"""
+    return list(dict.fromkeys(keyword for profile in profiles for keyword in profile.keywords))
+
+
+def union_sources(profiles: list[Profile]) -> set[str]:
+    """모든 프로필의 소스 키"""
+    return {key for profile in profiles for key in profile.sources}
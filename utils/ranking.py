@@ -0,0 +1,141 @@
+"""아티클 랭킹 모듈 - 점수 계산 및 상위 K개 선택
+
+점수 = 소스 가중치 × (키워드 점수 + 최신도 점수)
+- 키워드 점수: 키워드별 가중치 × 등장 횟수(키워드당 최대 KEYWORD_HIT_CAP회)의 합
+- 최신도 점수: RANK_RECENCY_WEIGHT × 0.5^(경과 시간 / RANK_HALF_LIFE_HOURS)
+  (발행 시각을 모르면 반감기만큼 지난 것으로 계산)
+
+소스별로 크기 MAX_PER_SOURCE의 힙을 두고 후보를 한 번 훑은 뒤(O(n log MAX_PER_SOURCE)),
+소스별 상위 아티클 중에서 다시 상위 K개를 고릅니다. 전체 목록을 정렬하지 않습니다.
+점수가 같으면 먼저 들어온 아티클을 우선하여 결과가 항상 같습니다.
+"""
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from config import (
+    KEYWORDS,
+    KEYWORD_WEIGHTS,
+    SOURCE_WEIGHTS,
+    MAX_PER_SOURCE,
+    RANK_HALF_LIFE_HOURS,
+    RANK_RECENCY_WEIGHT,
+)
+from .keywords import get_matcher
+
+KEYWORD_HIT_CAP = 2  # 같은 키워드를 반복해서 점수를 올리는 것 방지
+
+
+@dataclass
+class RankedArticle:
+    """점수와 점수 구성"""
+
+    article: object
+    score: float
+    keyword_score: float
+    recency_score: float
+    source_weight: float
+    order: int  # 입력 순서 (동점 처리용)
+
+    def explain(self) -> str:
+        """점수 구성 설명"""
+        hits = ", ".join(f"{k}×{v}" for k, v in self.article.keyword_hits.items()) or "없음"
+        return (
+            f"키워드 {self.keyword_score:.1f} ({hits}) + 최신도 {self.recency_score:.2f}"
+            f" × 소스 {self.source_weight:g}"
+        )
+
+
+@dataclass
+class Selection:
+    """랭킹 결과 (선택된 아티클과 제외 사유별 개수)"""
+
+    selected: list[RankedArticle] = field(default_factory=list)
+    over_quota: int = 0   # 소스별 한도를 넘어 제외
+    over_limit: int = 0   # 전체 한도를 넘어 제외
+
+    @property
+    def articles(self) -> list:
+        return [ranked.article for ranked in self.selected]
+
+
+class Ranker:
+    """아티클 점수 계산기"""
+
+    def __init__(
+        self,
+        keyword_weights: Optional[dict[str, float]] = None,
+        keywords: Optional[list[str]] = None,
+        source_weights: Optional[dict[str, float]] = None,
+        half_life_hours: float = RANK_HALF_LIFE_HOURS,
+        recency_weight: float = RANK_RECENCY_WEIGHT,
+        now: Optional[datetime] = None,
+    ):
+        self.keyword_weights = {k.lower(): w for k, w in (keyword_weights or KEYWORD_WEIGHTS).items()}
+        self.source_weights = source_weights if source_weights is not None else SOURCE_WEIGHTS
+        self.half_life_hours = half_life_hours
+        self.recency_weight = recency_weight
+        self.now = now or datetime.now(timezone.utc)
+        self._matcher = get_matcher(keywords or KEYWORDS)  # 매칭 결과가 없는 아티클에 쓸 키워드 (프로필 키워드)
+
+    def score(self, article, order: int = 0) -> RankedArticle:
+        """아티클 점수 계산 (키워드 매칭 결과가 없으면 여기서 계산)"""
+        if not article.keyword_hits:
+            text = f"{article.title or ''}\n{article.summary or ''}"
+            article.keyword_hits = self._matcher.find(text)
+
+        keyword_score = sum(
+            self.keyword_weights.get(keyword.lower(), 1.0) * min(count, KEYWORD_HIT_CAP)
+            for keyword, count in article.keyword_hits.items()
+        )
+
+        if article.published_at is not None:
+            age_hours = max(0.0, (self.now - article.published_at).total_seconds() / 3600)
+        else:
+            age_hours = self.half_life_hours
+        recency_score = self.recency_weight * 0.5 ** (age_hours / self.half_life_hours)
+
+        source_weight = self.source_weights.get(article.source, 1.0)
+        return RankedArticle(
+            article=article,
+            score=source_weight * (keyword_score + recency_score),
+            keyword_score=keyword_score,
+            recency_score=recency_score,
+            source_weight=source_weight,
+            order=order,
+        )
+
+
+def select_top(
+    articles: Iterable,
+    limit: int,
+    per_source: int = MAX_PER_SOURCE,
+    ranker: Optional[Ranker] = None,
+) -> Selection:
+    """점수 상위 limit개 선택 (소스별 최대 per_source개, 점수 높은 순)"""
+    ranker = ranker or Ranker()
+    per_source = per_source if per_source > 0 else limit
+
+    # 소스별 최소 힙: 힙 크기를 per_source로 유지하며 가장 낮은 점수를 밀어냄
+    heaps: dict[str, list] = {}
+    total = 0
+    for order, article in enumerate(articles):
+        total += 1
+        ranked = ranker.score(article, order)
+        key = (ranked.score, -order)
+        heap = heaps.setdefault(article.source, [])
+        if len(heap) < per_source:
+            heapq.heappush(heap, (key, ranked))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, ranked))
+
+    candidates = (item for heap in heaps.values() for item in heap)
+    top = heapq.nlargest(limit, candidates, key=lambda item: item[0])
+
+    in_quota = sum(len(heap) for heap in heaps.values())
+    return Selection(
+        selected=[ranked for _, ranked in top],
+        over_quota=total - in_quota,
+        over_limit=in_quota - len(top),
+    )
@@ -0,0 +1,142 @@
+"""데몬 모드용 스케줄러 모듈
+
+- TimerHeap: 다음 실행 시각 순으로 작업을 꺼내는 타이머 힙. 가장 가까운 실행 시각까지
+  Event.wait로 잠들었다가 깨어나므로 주기적으로 확인(polling)하지 않습니다.
+- PollPlanner: 소스별 최근 발행 시각으로 평균 발행 간격을 추정해 확인 주기를 정합니다.
+  자주 발행하는 소스는 자주, 드물게 발행하는 소스는 드물게 확인합니다.
+- next_digest_time: 설정한 전송 시각(HH:MM) 중 다음 시각 계산
+"""
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from config import (
+    SCHEDULE_STATE_FILE,
+    POLL_DEFAULT_MINUTES,
+    POLL_MIN_MINUTES,
+    POLL_MAX_MINUTES,
+)
+
+HISTORY_SIZE = 20          # 소스별로 보관할 최근 발행 시각 수
+POLLS_PER_ARTICLE = 2      # 평균 발행 간격 동안 확인할 횟수
+
+
+class TimerHeap:
+    """실행 시각(time.time 기준) 순으로 작업을 꺼내는 타이머 힙"""
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, object]] = []
+        self._seq = itertools.count()  # 같은 시각이면 먼저 넣은 작업 우선
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._stopped = False
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, when: float, item: object) -> None:
+        """when(time.time 기준)에 꺼낼 작업 추가"""
+        with self._lock:
+            heapq.heappush(self._heap, (when, next(self._seq), item))
+        self._changed.set()
+
+    def next_time(self) -> Optional[float]:
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def wait(self) -> list:
+        """실행 시각이 된 작업이 생길 때까지 기다렸다가 모두 꺼내서 반환 (stop 후에는 빈 목록)"""
+        while not self._stopped:
+            with self._lock:
+                now = time.time()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap)[2])
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._changed.clear()
+            if due:
+                return due
+            # 가장 가까운 실행 시각까지, 또는 새 작업이 추가될 때까지 대기
+            self._changed.wait(timeout)
+        return []
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._changed.set()
+
+
+class PollPlanner:
+    """소스별 발행 이력으로 다음 확인까지의 간격을 정함"""
+
+    def __init__(self, state_file: str = SCHEDULE_STATE_FILE):
+        self.state_file = state_file
+        self.history: dict[str, list[datetime]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for source, published in data.get("published", {}).items():
+                self.history[source] = sorted(datetime.fromisoformat(p) for p in published)[-HISTORY_SIZE:]
+        except (json.JSONDecodeError, IOError, TypeError, ValueError):
+            self.history = {}
+
+    def save(self) -> None:
+        with self._lock:
+            data = {
+                "published": {
+                    source: [p.isoformat() for p in published]
+                    for source, published in self.history.items()
+                },
+                "intervals": {source: round(self._interval(source) / 60) for source in self.history},
+                "last_updated": datetime.now().isoformat(),
+            }
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def record(self, source: str, published: Iterable[datetime]) -> None:
+        """새로 확인한 엔트리의 발행 시각 기록"""
+        with self._lock:
+            merged = set(self.history.get(source, []))
+            merged.update(p for p in published if p is not None)
+            self.history[source] = sorted(merged)[-HISTORY_SIZE:]
+
+    def interval(self, source: str) -> float:
+        """다음 확인까지의 간격 (초)"""
+        with self._lock:
+            return self._interval(source)
+
+    def _interval(self, source: str) -> float:
+        published = self.history.get(source, [])
+        if len(published) < 2:
+            minutes = POLL_DEFAULT_MINUTES
+        else:
+            # 최근 발행 간격의 평균. 마지막 발행 이후 그보다 오래 조용하면 그 시간을 반영
+            span = (published[-1] - published[0]).total_seconds()
+            average_gap = span / (len(published) - 1)
+            silence = (datetime.now(timezone.utc) - published[-1]).total_seconds()
+            gap = max(average_gap, silence / 2)
+            minutes = gap / 60 / POLLS_PER_ARTICLE
+        return max(POLL_MIN_MINUTES, min(POLL_MAX_MINUTES, minutes)) * 60
+
+
+def next_digest_time(times: list[str], now: Optional[datetime] = None) -> datetime:
+    """전송 시각(HH:MM, 로컬 시간) 중 now 이후 가장 가까운 시각"""
+    now = now or datetime.now()
+    candidates = []
+    for value in times:
+        hour, minute = (int(part) for part in value.strip().split(":"))
+        at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if at <= now:
+            at += timedelta(days=1)
+        candidates.append(at)
+    return min(candidates)
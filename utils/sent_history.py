@@ -0,0 +1,354 @@
+"""전송 이력 모듈 (캐시 보관 기준을 넘은 URL)
+
+캐시(utils.cache.Cache)는 최근에 보낸 URL만 메모리에 두고, 보관 기준(CACHE_TTL_DAYS 등)을 넘은 URL은
+지우는 대신 이곳으로 옮깁니다. 몇 년치 이력이 쌓여도 메모리는 블룸 필터 크기로 제한됩니다.
+- 블룸 필터(<캐시>.bloom): 대부분인 "처음 보는 URL"을 디스크를 읽지 않고 판정
+- 정확한 색인(<캐시>.history): 정렬된 64비트 지문 파일(FingerprintIndex), 블룸 필터가 "있을 수도 있음"이라고 할 때만 이진 탐색
+
+블룸 필터는 가득 차면 용량 두 배, 오탐률 절반인 필터를 하나 더 두고(scalable Bloom filter),
+CACHE_BLOOM_MAX_MB를 넘게 되면 더 늘리지 않고 마지막 필터에 계속 추가합니다. 그러면 오탐이 늘어
+색인을 읽는 횟수만 늘고 결과는 그대로 정확합니다. 지문은 URL 키의 blake2b 앞 8바이트이며,
+서로 다른 URL의 지문이 같을 확률은 이력 100만 개에서 약 3천만분의 1입니다.
+
+지문 색인은 파일 전체를 읽지 않고 mmap으로 열어 이진 탐색하며, 새 지문은 델타 로그(<색인>.delta)에 추가했다가
+CACHE_DELTA_MAX개가 모이면 정렬된 파일에 병합해 원자적으로 교체합니다. NumPy가 있으면 여러 지문을
+searchsorted 한 번으로 찾고, 없으면 지문마다 이진 탐색합니다.
+"""
+import hashlib
+import json
+import heapq
+import math
+import mmap
+import os
+import sys
+from array import array
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from config import CACHE_BLOOM_CAPACITY, CACHE_BLOOM_ERROR_RATE, CACHE_BLOOM_MAX_MB, CACHE_DELTA_MAX
+
+FINGERPRINT_SIZE = 8
+DELTA_ENTRY_BYTES = 64  # 델타 로그 지문 하나의 메모리 추정치 (int 객체 + set 슬롯)
+
+
+def fingerprint(key: str) -> int:
+    """정규화 URL 키의 64비트 지문"""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=FINGERPRINT_SIZE).digest(), "little")
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """NumPy 모듈 (선택, 없으면 None). 불러오는 데 메모리가 10MB 넘게 들어 색인을 처음 찾을 때 불러옴"""
+    try:
+        import numpy
+    except ImportError:  # 없으면 지문마다 이진 탐색
+        return None
+    return numpy
+
+
+def _to_bytes(fingerprints: Iterable[int]) -> bytes:
+    """지문 목록을 파일 형식(리틀 엔디언 u64)으로"""
+    values = array("Q", fingerprints)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data: bytes) -> array:
+    values = array("Q")
+    values.frombytes(data[:len(data) - len(data) % FINGERPRINT_SIZE])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class FingerprintIndex:
+    """정렬된 64비트 지문 파일(mmap) + 최근에 추가한 지문의 델타 로그
+
+    여는 비용은 델타 로그(최대 delta_max개)를 읽는 것뿐이고, 정렬된 파일은 찾을 때 필요한 페이지만 읽습니다.
+    """
+
+    def __init__(self, path: str, delta_max: int = CACHE_DELTA_MAX):
+        self.path = path
+        self.delta_file = f"{path}.delta"
+        self.delta_max = delta_max
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0  # 정렬된 파일의 지문 수
+        self._open_map()
+        self.delta = self._load_delta()
+
+    def _open_map(self) -> None:
+        self.close()
+        try:
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size >= FINGERPRINT_SIZE:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._count = size // FINGERPRINT_SIZE
+        except FileNotFoundError:
+            pass
+
+    def _load_delta(self) -> set[int]:
+        try:
+            with open(self.delta_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return set()
+        if len(data) % FINGERPRINT_SIZE:
+            # 추가하던 도중 중단되어 잘린 마지막 지문은 버림
+            with open(self.delta_file, "r+b") as f:
+                f.truncate(len(data) - len(data) % FINGERPRINT_SIZE)
+        return set(_from_bytes(data))
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._map, self._count = None, 0
+
+    def __len__(self) -> int:
+        return self._count + len(self.delta)
+
+    def __contains__(self, fp: int) -> bool:
+        return fp in self.delta or self._search(fp)
+
+    def _search(self, fp: int) -> bool:
+        """정렬된 파일에서 이진 탐색 (읽는 것은 비교하는 8바이트씩)"""
+        data = self._map
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            offset = middle * FINGERPRINT_SIZE
+            value = int.from_bytes(data[offset:offset + FINGERPRINT_SIZE], "little")
+            if value == fp:
+                return True
+            if value < fp:
+                low = middle + 1
+            else:
+                high = middle
+        return False
+
+    def contains_many(self, fingerprints: list[int]) -> list[bool]:
+        """지문마다 색인에 있는지 (NumPy가 있으면 searchsorted 한 번으로)"""
+        if not self._count or not fingerprints:
+            return [fp in self.delta for fp in fingerprints]
+        np = _numpy()
+        if np is None:
+            return [fp in self for fp in fingerprints]
+        index = np.frombuffer(self._map, dtype="<u8", count=self._count)
+        query = np.array(fingerprints, dtype=np.uint64)
+        positions = np.minimum(np.searchsorted(index, query), self._count - 1)
+        found = (index[positions] == query).tolist()
+        del index  # mmap을 다시 열 수 있도록 버퍼 참조를 바로 놓음
+        return [hit or fp in self.delta for hit, fp in zip(found, fingerprints)]
+
+    def to_array(self) -> array:
+        """정렬된 지문 전체 (델타 로그 포함)"""
+        values = _from_bytes(self._map[:]) if self._map is not None else array("Q")
+        if self.delta:
+            values = array("Q", heapq.merge(values, sorted(self.delta)))
+        return values
+
+    def add(self, fingerprints: Iterable[int]) -> int:
+        """새 지문을 델타 로그에 추가하고(fsync) 추가한 수 반환, delta_max개가 모이면 병합"""
+        candidates = list(dict.fromkeys(fingerprints))
+        new = [fp for fp, hit in zip(candidates, self.contains_many(candidates)) if not hit]
+        if not new:
+            return 0
+        with open(self.delta_file, "ab") as f:
+            f.write(_to_bytes(new))
+            f.flush()
+            os.fsync(f.fileno())
+        self.delta.update(new)
+        if len(self.delta) >= self.delta_max:
+            self.merge()
+        return len(new)
+
+    def merge(self) -> None:
+        """델타 로그를 정렬된 파일에 병합 (임시 파일에 쓰고 원자적으로 교체한 뒤 델타 로그 삭제)"""
+        if not self.delta:
+            return
+        np = _numpy() if self._count else None
+        if np is not None:
+            index = np.frombuffer(self._map, dtype="<u8", count=self._count)
+            merged = np.union1d(index, np.array(sorted(self.delta), dtype=np.uint64)).astype("<u8").tobytes()
+            del index
+        else:
+            merged = _to_bytes(self.to_array())
+        _write_atomic(self.path, merged)
+        self._open_map()
+        # 병합 전에 중단되면 델타 로그가 남아 다음에 다시 병합 (같은 지문이 양쪽에 있어도 결과는 같음)
+        os.remove(self.delta_file)
+        self.delta = set()
+
+    def memory_usage(self) -> int:
+        """메모리에 두는 크기 (델타 로그 집합 추정치, 바이트. mmap 페이지는 OS 캐시라 제외)"""
+        return len(self.delta) * DELTA_ENTRY_BYTES
+
+
+class BloomFilter:
+    """고정 크기 블룸 필터 (지문 하나를 둘로 나눠 이중 해싱으로 비트 위치 계산)"""
+
+    def __init__(self, capacity: int, error_rate: float, hashes: int = 0, count: int = 0,
+                 data: Optional[bytearray] = None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        bits = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.data = data if data is not None else bytearray((bits + 7) // 8)
+        self.bits = len(self.data) * 8
+        self.hashes = hashes or max(1, round(self.bits / capacity * math.log(2)))
+        self.count = count
+
+    def _positions(self, fp: int) -> list[int]:
+        h1, h2 = fp & 0xFFFFFFFF, (fp >> 32) | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, fp: int) -> None:
+        data = self.data
+        for position in self._positions(fp):
+            data[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, fp: int) -> bool:
+        data = self.data
+        return all(data[position >> 3] & (1 << (position & 7)) for position in self._positions(fp))
+
+
+class ScalableBloomFilter:
+    """가득 차면 필터를 더하는 블룸 필터 (전체 오탐률은 약 error_rate, 메모리는 max_bytes 이하)"""
+
+    GROWTH = 2        # 다음 필터의 용량 배수
+    TIGHTENING = 0.5  # 다음 필터의 오탐률 배수 (오탐률 합이 첫 필터의 두 배를 넘지 않음)
+
+    def __init__(self, capacity: int = CACHE_BLOOM_CAPACITY, error_rate: float = CACHE_BLOOM_ERROR_RATE,
+                 max_bytes: int = int(CACHE_BLOOM_MAX_MB * 1024 * 1024)):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_bytes = max_bytes
+        self.filters: list[BloomFilter] = []
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(bloom.data) for bloom in self.filters)
+
+    def __len__(self) -> int:
+        return sum(bloom.count for bloom in self.filters)
+
+    def __contains__(self, fp: int) -> bool:
+        # 최근 필터부터 (최근에 옮긴 URL이 다시 나올 가능성이 높음)
+        return any(fp in bloom for bloom in reversed(self.filters))
+
+    def add(self, fp: int) -> bool:
+        """지문 추가 (이미 있는 것으로 판정되면 False)"""
+        if fp in self:
+            return False
+        last = self.filters[-1] if self.filters else None
+        if last is None or last.count >= last.capacity:
+            if last is None:
+                bloom = BloomFilter(self.capacity, self.error_rate * (1 - self.TIGHTENING))
+            else:
+                bloom = BloomFilter(last.capacity * self.GROWTH, last.error_rate * self.TIGHTENING)
+            if last is None or self.nbytes + len(bloom.data) <= self.max_bytes:
+                self.filters.append(bloom)
+        self.filters[-1].add(fp)
+        return True
+
+    def to_bytes(self) -> bytes:
+        header = {
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "filters": [
+                {"capacity": b.capacity, "error_rate": b.error_rate, "hashes": b.hashes, "count": b.count,
+                 "bytes": len(b.data)}
+                for b in self.filters
+            ],
+        }
+        return json.dumps(header).encode("utf-8") + b"\n" + b"".join(bytes(b.data) for b in self.filters)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, max_bytes: int) -> "ScalableBloomFilter":
+        end = data.index(b"\n")
+        header = json.loads(data[:end])
+        bloom = cls(header["capacity"], header["error_rate"], max_bytes)
+        offset = end + 1
+        for item in header["filters"]:
+            chunk = bytearray(data[offset:offset + item["bytes"]])
+            if len(chunk) != item["bytes"]:
+                raise ValueError("블룸 필터 파일이 잘렸습니다")
+            offset += item["bytes"]
+            bloom.filters.append(BloomFilter(item["capacity"], item["error_rate"], item["hashes"], item["count"], chunk))
+        return bloom
+
+
+class SentHistory:
+    """블룸 필터 + 정렬된 지문 색인으로 된 전송 이력 (base_path.bloom, base_path.history)"""
+
+    def __init__(self, base_path: str, max_bytes: int = int(CACHE_BLOOM_MAX_MB * 1024 * 1024)):
+        self.index_file = f"{base_path}.history"
+        self.bloom_file = f"{base_path}.bloom"
+        self.index_reads = 0  # 블룸 필터가 통과시켜 색인을 읽은 횟수
+        self.index = FingerprintIndex(self.index_file)
+        self.bloom = self._load_bloom(max_bytes)
+
+    def _load_bloom(self, max_bytes: int) -> ScalableBloomFilter:
+        try:
+            with open(self.bloom_file, "rb") as f:
+                return ScalableBloomFilter.from_bytes(f.read(), max_bytes)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"블룸 필터를 읽지 못해 색인에서 다시 만듭니다: {e}")
+        # 블룸 필터가 없거나 손상되었으면 색인에서 다시 채움
+        bloom = ScalableBloomFilter(max_bytes=max_bytes)
+        fingerprints = self.read_index()
+        for fp in fingerprints:
+            bloom.add(fp)
+        if fingerprints:
+            _write_atomic(self.bloom_file, bloom.to_bytes())
+        return bloom
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: str) -> bool:
+        return self.contains_many([key])[0]
+
+    def contains_many(self, keys: list[str]) -> list[bool]:
+        """URL 키마다 이력에 있는지 (블룸 필터를 통과한 것만 색인에서 한 번에 찾음)"""
+        found = [False] * len(keys)
+        maybe = [(i, fp) for i, fp in enumerate(map(fingerprint, keys)) if fp in self.bloom]
+        if maybe:
+            self.index_reads += len(maybe)
+            for (i, _), hit in zip(maybe, self.index.contains_many([fp for _, fp in maybe])):
+                found[i] = hit
+        return found
+
+    def read_index(self) -> array:
+        """정렬된 지문 전체"""
+        return self.index.to_array()
+
+    def add(self, keys: Iterable[str]) -> int:
+        """URL 키를 이력에 추가하고 새로 추가한 수 반환 (색인의 델타 로그, 블룸 필터 순으로 저장)"""
+        new = sorted({fingerprint(key) for key in keys})
+        if not new:
+            return 0
+        added = self.index.add(new)
+
+        bloom_changed = False
+        for fp in new:
+            bloom_changed |= self.bloom.add(fp)
+        if bloom_changed:
+            _write_atomic(self.bloom_file, self.bloom.to_bytes())
+        return added
+
+    def memory_usage(self) -> int:
+        """메모리에 두는 크기 (블룸 필터와 색인 델타 로그, 바이트)"""
+        return self.bloom.nbytes + self.index.memory_usage()
@@ -0,0 +1,201 @@
+"""SQLite 중복 방지 캐시 모듈 (CACHE_BACKEND=sqlite)
+
+같은 호스트에서 봇이 여러 개 돌 때(데몬 + 수동 `--run` 등) 각자 캐시 파일을 읽고 고쳐 쓰면
+서로의 기록을 덮어써 같은 글을 두 번 보낼 수 있습니다. 이 백엔드는 캐시 파일 옆의 SQLite DB
+(cache.log → cache.db)를 WAL 모드로 열어 여러 프로세스가 함께 씁니다.
+- 읽기는 쓰는 중에도 막히지 않음 (WAL), 쓰기는 BEGIN IMMEDIATE로 차례대로
+- mark_sent_many: 여러 URL을 한 트랜잭션으로 기록
+- claim: 보내기 전에 URL을 "전송 중"으로 선점해, 두 프로세스가 같은 글을 함께 보내지 않음
+  (보내지 못하면 release, 프로세스가 죽어 남은 선점은 CACHE_CLAIM_TIMEOUT_MINUTES 뒤에 다시 선점 가능)
+
+키는 전송 이력(utils.sent_history)과 같은 64비트 지문이며, 모든 항목을 디스크에 두므로
+메모리 보관 기준(CACHE_TTL_DAYS 등)은 쓰지 않습니다. DB가 없으면 처음 열 때 기존 캐시 로그와 전송 이력을 옮깁니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Iterable, Optional
+
+from config import CACHE_CLAIM_TIMEOUT_MINUTES
+from .sent_history import SentHistory, fingerprint
+from .url import canonicalize_url
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sent (
+    fingerprint INTEGER PRIMARY KEY,  -- 정규화 URL 키의 64비트 지문 (부호 있는 정수로 저장)
+    url TEXT,                         -- 정규화 URL (전송 이력에서 옮긴 항목은 NULL)
+    source TEXT NOT NULL DEFAULT '',
+    sent_at REAL,                     -- 전송 시각 (선점만 했으면 NULL)
+    claimed_by TEXT,                  -- 선점한 실행
+    claimed_at REAL
+);
+"""
+
+SQL_CHUNK = 500  # IN (...) 한 번에 넣을 지문 수
+
+
+def _signed(fp: int) -> int:
+    """지문을 SQLite INTEGER 범위(부호 있는 64비트)로 변환"""
+    return fp - (1 << 64) if fp >= 1 << 63 else fp
+
+
+def _row_id(key: str) -> int:
+    return _signed(fingerprint(key))
+
+
+class SqliteCache:
+    """Cache와 같은 방식으로 쓰는 SQLite 캐시 (여러 프로세스에서 함께 사용 가능)"""
+
+    def __init__(self, cache_file: str, claim_timeout_minutes: float = CACHE_CLAIM_TIMEOUT_MINUTES):
+        self.cache_file = cache_file
+        self.db_file = f"{os.path.splitext(cache_file)[0]}.db"
+        self.claim_timeout = claim_timeout_minutes * 60
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        migrate = not os.path.exists(self.db_file)
+        # 트랜잭션은 직접 시작 (쓰기는 BEGIN IMMEDIATE로 처음부터 쓰기 잠금)
+        self.conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        if migrate:
+            self._migrate()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _write(self, sql: str, rows: list[tuple]) -> int:
+        """한 트랜잭션으로 실행하고 바뀐 행 수 반환"""
+        if not rows:
+            return 0
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                changed = self.conn.executemany(sql, rows).rowcount
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return changed
+
+    def _migrate(self) -> None:
+        """기존 캐시 로그(또는 cache.json)와 전송 이력의 지문을 옮김"""
+        from .cache import Cache  # cache 모듈이 이 모듈을 불러오므로 여기서
+
+        old = Cache(self.cache_file, ttl_days=0, max_entries=0, history=False)
+        rows = [(_row_id(key), key, source, sent_at) for key, (sent_at, source) in old.sent_urls.items()]
+        history = SentHistory(os.path.splitext(self.cache_file)[0])
+        if len(history):
+            sent_at = os.path.getmtime(history.index_file) if os.path.exists(history.index_file) else time.time()
+            rows.extend((_signed(fp), None, "", sent_at) for fp in history.read_index())
+        moved = self._write("INSERT OR IGNORE INTO sent (fingerprint, url, source, sent_at) VALUES (?, ?, ?, ?)", rows)
+        if moved:
+            print(f"캐시 {moved}개를 {self.db_file}로 옮겼습니다")
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM sent WHERE sent_at IS NOT NULL").fetchone()[0]
+
+    def is_sent(self, url: str) -> bool:
+        """URL이 이미 전송되었는지 확인 (다른 실행이 선점해 보내는 중인 URL도 포함)"""
+        return not self.filter_new([url])
+
+    def filter_new(self, urls: list[str]) -> list[str]:
+        """새로운 URL만 필터링 (SQL_CHUNK개씩 한 번에 조회)"""
+        ids = [_row_id(canonicalize_url(url)) for url in urls]
+        taken = set()
+        stale = time.time() - self.claim_timeout
+        for start in range(0, len(ids), SQL_CHUNK):
+            chunk = ids[start:start + SQL_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            taken.update(row[0] for row in self.conn.execute(
+                f"SELECT fingerprint FROM sent WHERE fingerprint IN ({placeholders})"
+                " AND (sent_at IS NOT NULL OR claimed_at >= ?)",
+                [*chunk, stale],
+            ))
+        return [url for url, row_id in zip(urls, ids) if row_id not in taken]
+
+    def mark_sent(self, url: str, source: str = "", sent_at: Optional[float] = None) -> None:
+        """URL을 전송 완료로 표시"""
+        self.mark_sent_many([(url, source)], sent_at)
+
+    def mark_sent_many(self, entries: Iterable[tuple[str, str]], sent_at: Optional[float] = None) -> None:
+        """(URL, 소스) 목록을 한 트랜잭션으로 전송 완료로 표시"""
+        sent_at = time.time() if sent_at is None else sent_at
+        rows = []
+        for url, source in entries:
+            key = canonicalize_url(url)
+            rows.append((_row_id(key), key, source, sent_at))
+        self._write(
+            """
+            INSERT INTO sent (fingerprint, url, source, sent_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(fingerprint) DO UPDATE SET
+                url = excluded.url, source = excluded.source, sent_at = excluded.sent_at,
+                claimed_by = NULL, claimed_at = NULL
+            WHERE sent.sent_at IS NULL
+            """,
+            rows,
+        )
+
+    def claim(self, urls: list[str]) -> set[str]:
+        """아직 보내지 않았고 다른 실행이 선점하지 않은 URL을 선점하고, 선점한 URL 반환
+
+        한 트랜잭션(쓰기 잠금)에서 확인과 선점을 함께 하므로 두 프로세스가 같은 URL을 함께 선점하지 않습니다.
+        """
+        now = time.time()
+        claimed = set()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                for url in urls:
+                    key = canonicalize_url(url)
+                    cursor = self.conn.execute(
+                        """
+                        INSERT INTO sent (fingerprint, url, claimed_by, claimed_at) VALUES (?, ?, ?, ?)
+                        ON CONFLICT(fingerprint) DO UPDATE SET
+                            claimed_by = excluded.claimed_by, claimed_at = excluded.claimed_at
+                        WHERE sent.sent_at IS NULL AND (sent.claimed_at < ? OR sent.claimed_by = excluded.claimed_by)
+                        """,
+                        (_row_id(key), key, self.owner, now, now - self.claim_timeout),
+                    )
+                    if cursor.rowcount:
+                        claimed.add(url)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return claimed
+
+    def release(self, urls: Iterable[str]) -> None:
+        """보내지 못한 URL의 선점 해제"""
+        self._write(
+            "DELETE FROM sent WHERE fingerprint = ? AND sent_at IS NULL AND claimed_by = ?",
+            [(_row_id(canonicalize_url(url)), self.owner) for url in urls],
+        )
+
+    def save(self) -> None:
+        """기록할 때마다 커밋하므로 할 일 없음 (Cache와 같은 사용법을 위해 둠)"""
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """모든 항목을 디스크에 두므로 내보낼 항목 없음"""
+        return 0
+
+    def compact(self, background: bool = False) -> None:
+        """WAL 파일 내용을 DB에 반영하고 WAL 파일을 비움"""
+        with self._lock:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def wait(self) -> None:
+        pass
+
+    def memory_usage(self) -> dict[str, int]:
+        """메모리 사용량 (SQLite 페이지 캐시 최대 크기, 바이트)"""
+        cache_size = self.conn.execute("PRAGMA cache_size").fetchone()[0]
+        page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+        return {
+            "entries": len(self),
+            "entries_bytes": -cache_size * 1024 if cache_size < 0 else cache_size * page_size,
+            "history": 0,
+            "bloom_bytes": 0,
+        }
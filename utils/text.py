@@ -0,0 +1,131 @@
+"""HTML 요약문 텍스트 추출 모듈
+
+BeautifulSoup(html, "html.parser").get_text(strip=True)[:N]과 같은 결과를
+트리를 만들지 않고 스트리밍으로 계산합니다.
+- 태그/주석/선언 경계마다 텍스트 조각을 나누고, 조각별로 앞뒤 공백을 제거한 뒤 이어 붙임
+- 빈 조각, 주석, script/style/template/rt/rp 안의 텍스트는 제외
+- 문자 참조(&amp;, &#8230; 등)는 BeautifulSoup과 같은 규칙으로 디코딩
+- 필요한 글자 수를 채우면 나머지 문서는 읽지 않음
+"""
+import re
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import Optional
+
+# BeautifulSoup이 get_text() 대상에서 제외하는 문자열을 담는 태그
+_EXCLUDED_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+_DECIMAL_REFERENCE = re.compile(r"^([0-9]+)(.*)")
+_HEX_REFERENCE = re.compile(r"^([0-9a-f]+)(.*)", re.IGNORECASE)
+
+# 세미콜론 없는 이름으로도 찾을 수 있도록 정리한 엔티티 표
+_ENTITIES: dict[str, str] = {}
+for _name, _char in sorted(html5.items()):
+    _ENTITIES.setdefault(_name.rstrip(";"), _char)
+
+
+def _numeric_reference(number: int) -> str:
+    """숫자 문자 참조를 문자로 변환 (HTML 명세의 대체 규칙 적용)"""
+    if number == 0 or number > 0x10FFFF or 0xD800 <= number <= 0xDFFF:
+        return "\ufffd"
+    if 0x80 <= number <= 0x9F:
+        # windows-1252로 해석되던 구간
+        try:
+            return bytes([number]).decode("windows-1252")
+        except UnicodeDecodeError:
+            return chr(number)
+    return chr(number)
+
+
+class _LimitReached(Exception):
+    """필요한 글자 수를 채워 파싱을 중단"""
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self, limit: Optional[int]):
+        super().__init__(convert_charrefs=False)
+        self.limit = limit
+        self.parts: list[str] = []
+        self.length = 0
+        self._pending: list[str] = []
+        self._excluded_depth = 0
+
+    def _flush(self) -> None:
+        """모아 둔 텍스트 조각을 하나의 문자열로 확정"""
+        if not self._pending:
+            return
+        text = "".join(self._pending).strip()
+        self._pending = []
+        if text and not self._excluded_depth:
+            self.parts.append(text)
+            self.length += len(text)
+            if self.limit is not None and self.length >= self.limit:
+                raise _LimitReached
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in _EXCLUDED_TAGS:
+            self._excluded_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in _EXCLUDED_TAGS and self._excluded_depth:
+            self._excluded_depth -= 1
+
+    def handle_data(self, data):
+        self._pending.append(data)
+
+    def handle_entityref(self, name):
+        character = _ENTITIES.get(name)
+        self._pending.append(character if character is not None else f"&{name}")
+
+    def handle_charref(self, name):
+        reference = _DECIMAL_REFERENCE
+        base = 10
+        if name[:1] in ("x", "X"):
+            name, reference, base = name[1:], _HEX_REFERENCE, 16
+        match = reference.match(name)
+        if match is None:
+            self._pending.append(name)
+            return
+        self._pending.append(_numeric_reference(int(match.group(1), base)))
+        if match.group(2):
+            self._pending.append(match.group(2))
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        if data.upper().startswith("CDATA["):
+            self._pending.append(data[len("CDATA["):])
+            self._flush()
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def strip_html(html: Optional[str], max_length: Optional[int] = None) -> str:
+    """HTML에서 텍스트만 추출 (max_length 글자까지)"""
+    if not html:
+        return ""
+
+    extractor = _TextExtractor(max_length)
+    try:
+        extractor.feed(html)
+        extractor.close()
+    except _LimitReached:
+        pass
+
+    text = "".join(extractor.parts)
+    return text[:max_length] if max_length is not None else text
@@ -0,0 +1,78 @@
+"""URL 정규화 모듈
+
+같은 글이 추적 파라미터, http/https, www 유무, 끝 슬래시 차이 때문에
+다른 URL로 보이지 않도록 비교용 정규 URL을 만듭니다.
+- 스킴은 https, 호스트는 소문자로 통일하고 www. 와 기본 포트 제거
+- utm_*, fbclid 같은 추적 파라미터는 모든 호스트에서 제거
+- source, ref처럼 다른 사이트에서는 글을 고르는 데 쓸 수 있는 이름은
+  추적용으로 쓰는 호스트에서만 제거 (Medium의 source=rss... 등)
+- 남은 쿼리 파라미터는 이름순 정렬, #fragment 제거
+- 경로의 퍼센트 인코딩 통일, 끝 슬래시 제거
+"""
+from functools import lru_cache
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+# 어느 사이트에서나 글 내용과 관계없는 추적 파라미터 (광고 클릭 ID, 메일 캠페인)
+TRACKING_PARAMS = frozenset({
+    "fbclid",
+    "gclid",
+    "dclid",
+    "yclid",
+    "msclkid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_hsenc",
+    "_hsmi",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+# 호스트(하위 도메인 포함) → 그 호스트에서만 추적용인 파라미터
+HOST_TRACKING_PARAMS = {
+    "medium.com": frozenset({"source", "sk"}),  # ?source=rss----..., 공유 링크
+    "github.com": frozenset({"ref_src"}),
+    "twitter.com": frozenset({"ref_src"}),
+    "x.com": frozenset({"ref_src"}),
+}
+
+# 경로에서 인코딩하지 않고 그대로 둘 문자 (RFC 3986 pchar + "/")
+_PATH_SAFE = "/:@!$&'()*+,;=-._~"
+
+
+def _host_tracking_params(host: str) -> frozenset:
+    """호스트(www. 제거, 소문자)에서만 추적용인 파라미터"""
+    for domain, params in HOST_TRACKING_PARAMS.items():
+        if host == domain or host.endswith(f".{domain}"):
+            return params
+    return frozenset()
+
+
+def _is_tracking(name: str, host_params: frozenset = frozenset()) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name in host_params or name.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=4096)
+def canonicalize_url(url: str) -> str:
+    """비교/캐시 키로 쓸 정규 URL 반환 (URL이 아니면 앞뒤 공백만 제거)"""
+    url = (url or "").strip()
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    host_params = _host_tracking_params(host)
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = quote(unquote(parts.path), safe=_PATH_SAFE).rstrip("/")
+
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(name, host_params)
+    ))
+
+    return urlunsplit(("https", host, path, query, ""))